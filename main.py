@@ -382,6 +382,7 @@ class STTradingSystem:
         5. 关闭TA管理器
         6. 关闭PM管理器
         7. 关闭事件存储
+        8. 刷新日志队列
         """
         logger.info("=" * 80)
         logger.info("🛑 系统关闭中...")
@@ -430,6 +431,9 @@ class STTradingSystem:
             logger.info("✅ 系统已安全关闭")
             logger.info("=" * 80)
 
+            # 等待队列中的文件日志写完
+            await logger.complete()
+
         except Exception as e:
             logger.error(f"❌ 系统关闭时发生错误: {e}", exc_info=True)
 
@@ -637,8 +637,8 @@ class DEManager:
                 data={
                     "user_id": user_id,
                     "asset": result.get("asset"),
-                    "balance": result.get("balance"),
-                    "available_balance": result.get("availableBalance")
+                    "balance": float(result.get("balance", 0)),
+                    "available_balance": float(result.get("availableBalance", 0))
                 }
             ))
 
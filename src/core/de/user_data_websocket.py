@@ -439,8 +439,8 @@ class UserDataWebSocket:
                 "user_id": self.user_id,
                 "order_id": order_data.get("i"),
                 "symbol": order_data.get("s"),
-                "price": order_data.get("p"),
-                "quantity": order_data.get("z"),
+                "price": float(order_data.get("p", 0)),
+                "quantity": float(order_data.get("z", 0)),
                 "timestamp": order_data.get("T", time.time() * 1000) / 1000
             }
         )
@@ -7,6 +7,11 @@ Event 数据类
 - event_id: 事件ID（自动生成UUID）
 - timestamp: 时间戳（自动生成）
 - source: 事件源模块（可选）
+- typed_data: 类型化事件数据（可选，订阅者解码后缓存）
+
+数据约定：
+    data 中的数值字段（价格、数量、余额等）由发布者转换为 float/int 后发布，
+    不使用字符串。订阅者直接使用，不再重复转换类型。
 """
 
 from dataclasses import dataclass, field
@@ -15,17 +20,21 @@ from typing import Dict, Any, Optional
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """
     事件对象
     
+    使用 __slots__ 存储字段，不为每个实例分配 __dict__，降低高频事件的内存分配开销。
+    
     Attributes:
         subject: 事件主题，用于标识事件类型
         data: 事件数据，包含事件的具体信息
         event_id: 事件唯一标识符，自动生成UUID
         timestamp: 事件创建时间戳，自动生成
         source: 事件源模块，可选
+        typed_data: 类型化事件数据，可选。由发布者直接提供，或由首个订阅者
+            从data解码后写回，同一事件的其他订阅者直接复用，不参与序列化和比较
     
     使用方式：
         event = Event(
@@ -40,6 +49,7 @@ class Event:
     event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     timestamp: datetime = field(default_factory=datetime.now)
     source: Optional[str] = None
+    typed_data: Any = field(default=None, repr=False, compare=False)
     
     def __post_init__(self):
         """
@@ -121,6 +131,7 @@ class Event:
         object.__setattr__(event, 'data', data["data"])
         object.__setattr__(event, 'timestamp', timestamp)
         object.__setattr__(event, 'source', data.get("source"))
+        object.__setattr__(event, 'typed_data', None)
 
         return event
 
@@ -4,7 +4,7 @@ EventBus 事件总线
 实现事件驱动架构的核心组件，提供：
 - 单例模式：全局唯一的事件总线
 - 订阅/发布：支持多个订阅者订阅同一事件
-- 异步分发：并发执行所有处理器
+- 异步分发：并发执行所有异步处理器，同步处理器在发布方直接调用
 - 通配符订阅：支持 fnmatch 模式匹配（如 order.*）
 - 错误隔离：单个处理器失败不影响其他处理器
 - 依赖注入：可选的 EventStore 持久化
@@ -29,6 +29,7 @@ EventBus 事件总线
 
 import asyncio
 import fnmatch
+import inspect
 from typing import Callable, Optional, List, Dict
 from collections import defaultdict
 
@@ -48,6 +49,7 @@ class EventBus:
     Attributes:
         _instance: 单例实例
         _subscribers: 订阅者字典 {subject: [handler1, handler2, ...]}
+        _handler_is_async: 处理器是否为协程函数 {handler: bool}（订阅时判定）
         _event_store: 可选的事件存储
     
     设计原则：
@@ -70,6 +72,7 @@ class EventBus:
             不应该直接调用此方法，应该使用 get_instance() 获取单例
         """
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        self._handler_is_async: Dict[Callable, bool] = {}
         self._event_store = event_store
         
         logger.info("事件总线初始化完成")
@@ -102,7 +105,7 @@ class EventBus:
         
         Args:
             subject: 事件主题，支持通配符（如 order.*）
-            handler: 事件处理器，必须是 async 函数
+            handler: 事件处理器，async 函数或普通函数（仅做轻量处理时可用普通函数，免去协程开销）
         
         使用方式：
             async def my_handler(event):
@@ -115,9 +118,37 @@ class EventBus:
             - 同一个 handler 可以订阅多个 subject
             - 同一个 subject 可以有多个 handler
             - 支持通配符模式（使用 fnmatch）
+            - 订阅时判定处理器是否为协程函数，分发时不再重复判定
         """
         self._subscribers[subject].append(handler)
-        logger.debug(f"订阅事件: {subject}, 处理器: {handler.__name__}")
+        self._handler_is_async[handler] = asyncio.iscoroutinefunction(handler)
+        logger.debug("订阅事件: {}, 处理器: {}", subject, handler.__name__)
+    
+    def subscribe_many(self, handlers: Dict[str, Callable]):
+        """
+        批量订阅事件
+        
+        Args:
+            handlers: 订阅映射 {subject: handler}，subject 支持通配符
+        
+        使用方式：
+            bus.subscribe_many({
+                "order.created": on_created,
+                "order.filled": on_filled,
+            })
+        
+        实现细节：
+            - 与逐个调用 subscribe 等价，但只记录一条日志
+        """
+        subscribers = self._subscribers
+        is_async = self._handler_is_async
+        iscoroutinefunction = asyncio.iscoroutinefunction
+        
+        for subject, handler in handlers.items():
+            subscribers[subject].append(handler)
+            is_async[handler] = iscoroutinefunction(handler)
+        
+        logger.debug("批量订阅事件: {} 个主题", len(handlers))
     
     async def publish(self, event: Event, persist: bool = True):
         """
@@ -140,25 +171,25 @@ class EventBus:
             3. 异步分发：并发执行所有处理器
             4. 错误隔离：单个处理器失败不影响其他处理器
         """
-        logger.info(f"发布事件: {event.subject}")
+        logger.info("发布事件: {}", event.subject)
         
         # 1. 可选持久化
         if persist and self._event_store:
             try:
                 self._event_store.insert_event(event)
-                logger.debug(f"事件已持久化: {event.event_id}")
+                logger.debug("事件已持久化: {}", event.event_id)
             except Exception as e:
-                logger.error(f"事件持久化失败: {e}")
+                logger.error("事件持久化失败: {}", e)
                 # 持久化失败不影响事件分发
         
         # 2. 获取匹配的处理器
         handlers = self._get_matching_handlers(event.subject)
         
         if not handlers:
-            logger.debug(f"没有订阅者订阅事件: {event.subject}")
+            logger.debug("没有订阅者订阅事件: {}", event.subject)
             return
         
-        logger.debug(f"找到 {len(handlers)} 个处理器")
+        logger.debug("找到 {} 个处理器", len(handlers))
         
         # 3. 异步分发事件
         await self._dispatch_event(event, handlers)
@@ -204,42 +235,81 @@ class EventBus:
             handlers: 处理器列表
         
         实现细节：
-            - 并发执行所有处理器（使用 asyncio.gather）
+            - 同步处理器直接调用，不创建协程
+            - 只有一个异步处理器时直接等待，不经过 asyncio.gather 包装任务
+            - 多个异步处理器时直接传入各自的协程并发执行（使用 asyncio.gather）
             - 错误隔离：使用 return_exceptions=True
             - 处理器异常时记录日志并发布告警事件
         """
-        # 创建所有处理器的任务
-        tasks = [self._execute_handler(handler, event) for handler in handlers]
+        is_async = self._handler_is_async
+        async_handlers = []
+        
+        for handler in handlers:
+            if is_async.get(handler, True):
+                async_handlers.append(handler)
+                continue
+            try:
+                result = handler(event)
+                # 普通函数返回可等待对象时（如包装了协程的lambda）仍需等待
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                await self._on_handler_error(event, handler, e)
+        
+        if not async_handlers:
+            return
         
-        # 并发执行所有任务，捕获异常
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if len(async_handlers) == 1:
+            handler = async_handlers[0]
+            try:
+                await handler(event)
+            except Exception as e:
+                await self._on_handler_error(event, handler, e)
+            return
+        
+        # 创建所有异步处理器的协程（调用即失败的处理器同样隔离）
+        coros = []
+        for handler in async_handlers:
+            try:
+                coros.append(handler(event))
+            except Exception as e:
+                coros.append(self._raise(e))
+        
+        # 并发执行所有协程，捕获异常
+        results = await asyncio.gather(*coros, return_exceptions=True)
         
         # 检查是否有异常
         for i, result in enumerate(results):
             if isinstance(result, Exception):
-                handler = handlers[i]
-                logger.error(
-                    f"处理器执行失败: {handler.__name__}, "
-                    f"事件: {event.subject}, "
-                    f"错误: {result}"
-                )
-                
-                # 发布告警事件（不持久化，避免无限循环）
-                await self._publish_alert_event(event, handler, result)
+                await self._on_handler_error(event, async_handlers[i], result)
     
-    async def _execute_handler(self, handler: Callable, event: Event):
+    async def _on_handler_error(self, event: Event, handler: Callable, error: Exception):
         """
-        执行单个处理器
+        处理器执行失败时记录日志并发布告警事件
         
         Args:
-            handler: 事件处理器
             event: Event 对象
+            handler: 失败的处理器
+            error: 异常对象
+        """
+        logger.error(
+            f"处理器执行失败: {handler.__name__}, "
+            f"事件: {event.subject}, "
+            f"错误: {error}"
+        )
         
-        实现细节：
-            - 调用处理器并传入事件
-            - 如果处理器抛出异常，异常会被传播到 _dispatch_event
+        # 发布告警事件（不持久化，避免无限循环）
+        await self._publish_alert_event(event, handler, error)
+    
+    @staticmethod
+    async def _raise(error: Exception):
+        """
+        将创建协程时抛出的异常延迟到 gather 中抛出，与其他处理器的异常统一收集
+        
+        Args:
+            error: 异常对象
         """
-        await handler(event)
+        raise error
     
     async def _publish_alert_event(self, original_event: Event, handler: Callable, error: Exception):
         """
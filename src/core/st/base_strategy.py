@@ -77,7 +77,7 @@ class BaseStrategy(ABC):
         # 初始化所有交易对的持仓状态为NONE
         self._initialize_positions()
         
-        logger.info(f"[base_strategy.py:{self._get_line_number()}] 策略实例创建成功: {user_id}")
+        logger.info("策略实例创建成功: {}", user_id)
     
     def _initialize_positions(self) -> None:
         """初始化所有交易对的持仓状态为NONE"""
@@ -85,7 +85,7 @@ class BaseStrategy(ABC):
             symbol = pair["symbol"]
             self._positions[symbol] = PositionState.NONE
         
-        logger.debug(f"[base_strategy.py:{self._get_line_number()}] 持仓状态初始化完成: {list(self._positions.keys())}")
+        logger.debug("持仓状态初始化完成: {}", list(self._positions.keys()))
     
     def get_position(self, symbol: str) -> PositionState:
         """
@@ -109,7 +109,7 @@ class BaseStrategy(ABC):
         """
         old_state = self._positions.get(symbol, PositionState.NONE)
         self._positions[symbol] = state
-        logger.info(f"[base_strategy.py:{self._get_line_number()}] 持仓状态更新: {symbol} {old_state.value} -> {state.value}")
+        logger.info("持仓状态更新: {} {} -> {}", symbol, old_state.value, state.value)
     
     async def _publish_strategy_loaded(self) -> None:
         """
@@ -131,7 +131,7 @@ class BaseStrategy(ABC):
         )
         
         await self._event_bus.publish(event)
-        logger.info(f"[base_strategy.py:{self._get_line_number()}] 发布策略加载事件: {self._user_id}")
+        logger.info("发布策略加载事件: {}", self._user_id)
     
     async def _publish_indicator_subscriptions(self) -> None:
         """
@@ -161,7 +161,7 @@ class BaseStrategy(ABC):
                 )
 
                 await self._event_bus.publish(event)
-                logger.info(f"[base_strategy.py:{self._get_line_number()}] 发布指标订阅: {symbol}/{indicator_name}, timeframe={timeframe}")
+                logger.info("发布指标订阅: {}/{}, timeframe={}", symbol, indicator_name, timeframe)
     
     async def _generate_signal(self, symbol: str, side: str, action: str) -> None:
         """
@@ -184,7 +184,7 @@ class BaseStrategy(ABC):
         )
 
         await self._event_bus.publish(event)
-        logger.info(f"[base_strategy.py:{self._get_line_number()}] 生成交易信号: {symbol} {side} {action}")
+        logger.info("生成交易信号: {} {} {}", symbol, side, action)
 
     async def on_position_opened(self, symbol: str, side: str, entry_price: float) -> None:
         """
@@ -200,7 +200,7 @@ class BaseStrategy(ABC):
         # 检查网格交易配置
         grid_config = self._config.get("grid_trading", {})
         if not grid_config.get("enabled", False):
-            logger.debug(f"[base_strategy.py:{self._get_line_number()}] 网格交易未启用: {symbol}")
+            logger.debug("网格交易未启用: {}", symbol)
             return
 
         # 发布网格创建事件
@@ -232,7 +232,7 @@ class BaseStrategy(ABC):
         )
 
         await self._event_bus.publish(event)
-        logger.info(f"[base_strategy.py:{self._get_line_number()}] 发布网格创建事件: {symbol} 入场价={entry_price}")
+        logger.info("发布网格创建事件: {} 入场价={}", symbol, entry_price)
 
     async def on_position_closed(self, symbol: str, side: str) -> None:
         """
@@ -247,7 +247,7 @@ class BaseStrategy(ABC):
         # 检查反向建仓配置
         reverse_enabled = self._config.get("reverse", False)
         if not reverse_enabled:
-            logger.debug(f"[base_strategy.py:{self._get_line_number()}] 反向建仓未启用: {symbol}")
+            logger.debug("反向建仓未启用: {}", symbol)
             return
 
         # 生成反向开仓信号
@@ -255,13 +255,7 @@ class BaseStrategy(ABC):
         # 平空仓 → 开多仓
         reverse_side = "SHORT" if side == "LONG" else "LONG"
         await self._generate_signal(symbol, reverse_side, "OPEN")
-        logger.info(f"[base_strategy.py:{self._get_line_number()}] 反向建仓: {symbol} 平{side}仓 → 开{reverse_side}仓")
-
-    @staticmethod
-    def _get_line_number() -> int:
-        """获取当前行号（用于日志）"""
-        import inspect
-        return inspect.currentframe().f_back.f_lineno
+        logger.info("反向建仓: {} 平{}仓 → 开{}仓", symbol, side, reverse_side)
     
     @abstractmethod
     async def on_indicators_completed(self, symbol: str, indicators: Dict[str, Any]) -> None:
@@ -290,4 +284,3 @@ class BaseStrategy(ABC):
             ...         await self._generate_signal(symbol, "LONG", "OPEN")
         """
         pass
-
@@ -79,7 +79,7 @@ class STManager:
             if event_bus is None:
                 raise ValueError("首次调用必须提供event_bus")
             cls._instance = cls(event_bus)
-            logger.info(f"[st_manager.py:{cls._get_line_number()}] STManager 单例实例创建成功")
+            logger.info("STManager 单例实例创建成功")
         return cls._instance
 
     @classmethod
@@ -90,13 +90,7 @@ class STManager:
         警告：此方法仅应在单元测试中使用，生产环境不应调用。
         """
         cls._instance = None
-        logger.debug(f"[st_manager.py:{cls._get_line_number()}] STManager 单例实例已重置")
-
-    @staticmethod
-    def _get_line_number() -> int:
-        """获取当前行号（用于日志）"""
-        import inspect
-        return inspect.currentframe().f_back.f_lineno
+        logger.debug("STManager 单例实例已重置")
 
     def __init__(self, event_bus: EventBus):
         """
@@ -113,7 +107,7 @@ class STManager:
         # 订阅事件
         self._subscribe_events()
 
-        logger.info(f"[st_manager.py:{self._get_line_number()}] STManager 初始化完成")
+        logger.info("STManager 初始化完成")
 
     def _subscribe_events(self) -> None:
         """订阅所有需要的事件"""
@@ -121,10 +115,10 @@ class STManager:
         self._event_bus.subscribe(STEvents.INPUT_INDICATORS_COMPLETED, self._handle_indicators_completed)
         self._event_bus.subscribe(STEvents.INPUT_POSITION_OPENED, self._handle_position_opened)
         self._event_bus.subscribe(STEvents.INPUT_POSITION_CLOSED, self._handle_position_closed)
-        logger.debug(f"[st_manager.py:{self._get_line_number()}] 已订阅 {STEvents.INPUT_ACCOUNT_LOADED} 事件")
-        logger.debug(f"[st_manager.py:{self._get_line_number()}] 已订阅 {STEvents.INPUT_INDICATORS_COMPLETED} 事件")
-        logger.debug(f"[st_manager.py:{self._get_line_number()}] 已订阅 {STEvents.INPUT_POSITION_OPENED} 事件")
-        logger.debug(f"[st_manager.py:{self._get_line_number()}] 已订阅 {STEvents.INPUT_POSITION_CLOSED} 事件")
+        logger.debug("已订阅 {} 事件", STEvents.INPUT_ACCOUNT_LOADED)
+        logger.debug("已订阅 {} 事件", STEvents.INPUT_INDICATORS_COMPLETED)
+        logger.debug("已订阅 {} 事件", STEvents.INPUT_POSITION_OPENED)
+        logger.debug("已订阅 {} 事件", STEvents.INPUT_POSITION_CLOSED)
 
     async def _handle_account_loaded(self, event: Event) -> None:
         """
@@ -145,18 +139,18 @@ class STManager:
         strategy_name = event.data.get("strategy_name")
 
         if not user_id or not strategy_name:
-            logger.warning(f"[st_manager.py:{self._get_line_number()}] 账户加载事件缺少必要字段")
+            logger.warning("账户加载事件缺少必要字段")
             return
 
         # 加载策略配置
         config = self._load_config(user_id, strategy_name)
         if not config:
-            logger.error(f"[st_manager.py:{self._get_line_number()}] 策略配置加载失败: {user_id}/{strategy_name}")
+            logger.error("策略配置加载失败: {}/{}", user_id, strategy_name)
             return
 
         # 验证配置
         if not self._validate_config(config):
-            logger.error(f"[st_manager.py:{self._get_line_number()}] 策略配置验证失败: {user_id}/{strategy_name}")
+            logger.error("策略配置验证失败: {}/{}", user_id, strategy_name)
             return
 
         # 动态导入策略类（这里使用测试策略类）
@@ -167,7 +161,7 @@ class STManager:
         # 创建策略实例
         # 注意：这里需要一个具体的策略类，而不是抽象基类
         # 暂时跳过策略实例创建，等待具体策略类实现
-        logger.info(f"[st_manager.py:{self._get_line_number()}] 策略配置已加载: {user_id}/{strategy_name}")
+        logger.info("策略配置已加载: {}/{}", user_id, strategy_name)
 
         # TODO: 创建策略实例并存储到 self._strategies[user_id]
 
@@ -196,12 +190,12 @@ class STManager:
         # 查找对应的策略实例
         strategy = self._strategies.get(user_id)
         if not strategy:
-            logger.warning(f"[st_manager.py:{self._get_line_number()}] 用户策略不存在: {user_id}")
+            logger.warning("用户策略不存在: {}", user_id)
             return
 
         # 调用策略的指标处理方法
         await strategy.on_indicators_completed(symbol, indicators)
-        logger.debug(f"[st_manager.py:{self._get_line_number()}] 已处理指标完成事件: {user_id}/{symbol}")
+        logger.debug("已处理指标完成事件: {}/{}", user_id, symbol)
 
     async def _handle_position_opened(self, event: Event) -> None:
         """
@@ -229,7 +223,7 @@ class STManager:
         # 查找对应的策略实例
         strategy = self._strategies.get(user_id)
         if not strategy:
-            logger.warning(f"[st_manager.py:{self._get_line_number()}] 用户策略不存在: {user_id}")
+            logger.warning("用户策略不存在: {}", user_id)
             return
 
         # 将side转换为PositionState
@@ -237,7 +231,7 @@ class STManager:
 
         # 更新持仓状态
         strategy.update_position(symbol, position_state)
-        logger.info(f"[st_manager.py:{self._get_line_number()}] 持仓状态已更新: {user_id}/{symbol} -> {position_state.value}")
+        logger.info("持仓状态已更新: {}/{} -> {}", user_id, symbol, position_state.value)
 
         # 调用策略的持仓开启处理方法（可能触发网格交易）
         await strategy.on_position_opened(symbol, side, entry_price)
@@ -267,12 +261,12 @@ class STManager:
         # 查找对应的策略实例
         strategy = self._strategies.get(user_id)
         if not strategy:
-            logger.warning(f"[st_manager.py:{self._get_line_number()}] 用户策略不存在: {user_id}")
+            logger.warning("用户策略不存在: {}", user_id)
             return
 
         # 更新持仓状态为NONE
         strategy.update_position(symbol, PositionState.NONE)
-        logger.info(f"[st_manager.py:{self._get_line_number()}] 持仓状态已更新: {user_id}/{symbol} -> NONE")
+        logger.info("持仓状态已更新: {}/{} -> NONE", user_id, symbol)
 
         # 调用策略的持仓关闭处理方法（可能触发反向建仓）
         await strategy.on_position_closed(symbol, side)
@@ -293,16 +287,16 @@ class STManager:
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
-            logger.info(f"[st_manager.py:{self._get_line_number()}] 加载策略配置成功: {user_id}/{strategy}")
+            logger.info("加载策略配置成功: {}/{}", user_id, strategy)
             return config
         except FileNotFoundError:
-            logger.error(f"[st_manager.py:{self._get_line_number()}] 配置文件不存在: {config_path}")
+            logger.error("配置文件不存在: {}", config_path)
             return None
         except json.JSONDecodeError as e:
-            logger.error(f"[st_manager.py:{self._get_line_number()}] 配置文件格式错误: {e}")
+            logger.error("配置文件格式错误: {}", e)
             return None
         except Exception as e:
-            logger.error(f"[st_manager.py:{self._get_line_number()}] 加载配置文件失败: {e}")
+            logger.error("加载配置文件失败: {}", e)
             return None
 
     def _validate_config(self, config: Dict[str, Any]) -> bool:
@@ -321,14 +315,13 @@ class STManager:
         # 检查必需字段
         for field in required_fields:
             if field not in config:
-                logger.error(f"[st_manager.py:{self._get_line_number()}] 配置缺少必需字段: {field}")
+                logger.error("配置缺少必需字段: {}", field)
                 return False
 
         # 检查trading_pairs
         if not isinstance(config["trading_pairs"], list) or len(config["trading_pairs"]) == 0:
-            logger.error(f"[st_manager.py:{self._get_line_number()}] trading_pairs 必须是非空数组")
+            logger.error("trading_pairs 必须是非空数组")
             return False
 
-        logger.debug(f"[st_manager.py:{self._get_line_number()}] 配置验证通过")
+        logger.debug("配置验证通过")
         return True
-
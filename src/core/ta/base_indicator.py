@@ -25,6 +25,7 @@ BaseIndicator 指标抽象基类
 - 面向对象设计：充分使用类方法和属性
 """
 
+import inspect
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Dict, Any
@@ -313,7 +314,6 @@ class BaseIndicator(ABC):
         Returns:
             当前行号
         """
-        import inspect
         return inspect.currentframe().f_back.f_lineno
 
     def _log_prefix(self) -> str:
@@ -25,6 +25,7 @@ TA技术分析管理器
 - 事件驱动架构：通过事件总线与其他模块通信
 """
 
+import inspect
 from typing import Optional, Dict, Any, TYPE_CHECKING
 from src.utils.logger import logger
 from src.core.event.event_bus import EventBus
@@ -105,7 +106,6 @@ class TAManager:
     @staticmethod
     def _get_line_number() -> int:
         """获取当前行号（用于日志）"""
-        import inspect
         return inspect.currentframe().f_back.f_lineno
 
     def _log_prefix(self) -> str:
@@ -26,12 +26,43 @@ CapitalManager负责资金管理和仓位计算，包括：
         entry_price=1.0,
         ratio=1.0
     )
+    
+    # 一次计算入场所需的保证金、仓位和单格仓位
+    sizing = capital_manager.size_entry(5, entry_price=1.0, ratio=1.0, grid_levels=10)
 """
 
-from typing import Optional
+from functools import lru_cache
+from typing import NamedTuple, Optional
 from loguru import logger
 
 
+@lru_cache(maxsize=1024)
+def _position_size(margin: float, entry_price: float, ratio: float, leverage: int) -> float:
+    """
+    仓位大小计算（按参数精确匹配缓存）
+    
+    同一价格tick内的重复信号参数完全相同，直接命中缓存。
+    保证金作为参数参与缓存键，余额变化后自然产生新键，无需主动失效。
+    
+    公式: 仓位大小 = (保证金 × ratio × 杠杆) ÷ 入场价格
+    """
+    return (margin * ratio * leverage) / entry_price
+
+
+class EntrySize(NamedTuple):
+    """
+    入场仓位计算结果
+    
+    Attributes:
+        margin_per_symbol: 每个交易对分配的保证金
+        quantity: 仓位大小（数量）
+        grid_quantity: 单个网格订单的仓位大小（仓位大小 ÷ 网格层数）
+    """
+    margin_per_symbol: float
+    quantity: float
+    grid_quantity: float
+
+
 class CapitalManager:
     """
     资金管理器
@@ -76,10 +107,11 @@ class CapitalManager:
         self.available_balance: Optional[float] = None
         self.total_balance: Optional[float] = None
         
-        logger.info(
-            f"[capital_manager.py:{self._get_line_number()}] 资金管理器初始化: "
-            f"{user_id} 杠杆={leverage}x 保证金类型={margin_type}"
-        )
+        # 每个交易对保证金缓存（余额更新时失效）
+        self._cached_margin_per_symbol: Optional[float] = None
+        self._cached_symbol_count: int = -1
+        
+        logger.info("资金管理器初始化: {} 杠杆={}x 保证金类型={}", user_id, leverage, margin_type)
     
     def update_balance(self, available_balance: float, total_balance: Optional[float] = None) -> None:
         """
@@ -94,11 +126,9 @@ class CapitalManager:
         """
         self.available_balance = available_balance
         self.total_balance = total_balance if total_balance is not None else available_balance
+        self._cached_margin_per_symbol = None
         
-        logger.info(
-            f"[capital_manager.py:{self._get_line_number()}] 账户余额更新: "
-            f"{self.user_id} 可用={available_balance} 总额={self.total_balance}"
-        )
+        logger.info("账户余额更新: {} 可用={} 总额={}", self.user_id, available_balance, self.total_balance)
     
     def get_available_balance(self) -> float:
         """
@@ -133,8 +163,8 @@ class CapitalManager:
         usable = available * self.SAFETY_RATIO
         
         logger.debug(
-            f"[capital_manager.py:{self._get_line_number()}] 可使用余额: "
-            f"{self.user_id} 可用={available} 可使用={usable} (安全系数={self.SAFETY_RATIO})"
+            "可使用余额: {} 可用={} 可使用={} (安全系数={})",
+            self.user_id, available, usable, self.SAFETY_RATIO
         )
         
         return usable
@@ -145,6 +175,8 @@ class CapitalManager:
         
         公式: 每个交易对保证金 = 可使用余额 ÷ 交易对数量
         
+        结果按交易对数量缓存，余额更新前重复调用直接返回缓存值。
+        
         Args:
             symbol_count: 交易对数量
         
@@ -159,16 +191,21 @@ class CapitalManager:
             >>> margin = capital_manager.calculate_margin_per_symbol(5)
             >>> print(margin)  # 1900.0 (10000 * 0.95 / 5)
         """
+        if symbol_count == self._cached_symbol_count and self._cached_margin_per_symbol is not None:
+            return self._cached_margin_per_symbol
+        
         if symbol_count <= 0:
             raise ValueError(f"交易对数量必须大于0: {symbol_count}")
         
         usable_balance = self.get_usable_balance()
         margin_per_symbol = usable_balance / symbol_count
         
+        self._cached_margin_per_symbol = margin_per_symbol
+        self._cached_symbol_count = symbol_count
+        
         logger.info(
-            f"[capital_manager.py:{self._get_line_number()}] 保证金分配: "
-            f"{self.user_id} 可使用={usable_balance} 交易对数={symbol_count} "
-            f"每个={margin_per_symbol}"
+            "保证金分配: {} 可使用={} 交易对数={} 每个={}",
+            self.user_id, usable_balance, symbol_count, margin_per_symbol
         )
         
         return margin_per_symbol
@@ -204,20 +241,14 @@ class CapitalManager:
             >>> size = capital_manager.calculate_position_size(2000, 1.0, 0.5)
             >>> print(size)  # 4000.0 (2000 * 0.5 * 4 / 1.0)
         """
-        if margin <= 0:
-            raise ValueError(f"保证金必须大于0: {margin}")
-        if entry_price <= 0:
-            raise ValueError(f"入场价格必须大于0: {entry_price}")
-        if ratio <= 0 or ratio > 1:
-            raise ValueError(f"资金比例必须在(0, 1]范围内: {ratio}")
+        self._validate_sizing(margin, entry_price, ratio)
         
         # 计算仓位大小
-        position_size = (margin * ratio * self.leverage) / entry_price
+        position_size = _position_size(margin, entry_price, ratio, self.leverage)
         
         logger.info(
-            f"[capital_manager.py:{self._get_line_number()}] 仓位计算: "
-            f"{self.user_id} 保证金={margin} 价格={entry_price} "
-            f"比例={ratio} 杠杆={self.leverage}x 仓位={position_size}"
+            "仓位计算: {} 保证金={} 价格={} 比例={} 杠杆={}x 仓位={}",
+            self.user_id, margin, entry_price, ratio, self.leverage, position_size
         )
         
         return position_size
@@ -251,23 +282,90 @@ class CapitalManager:
             >>> size = capital_manager.calculate_grid_position_size(2000, 1.0, 10)
             >>> print(size)  # 800.0 (2000 * 1.0 * 4 / 1.0 / 10)
         """
-        if grid_levels <= 0:
-            raise ValueError(f"网格层数必须大于0: {grid_levels}")
+        self._validate_sizing(margin, entry_price, ratio, grid_levels)
         
         # 先计算总仓位大小
-        total_position_size = self.calculate_position_size(margin, entry_price, ratio)
+        total_position_size = _position_size(margin, entry_price, ratio, self.leverage)
         
         # 平均分配到每个网格
         grid_position_size = total_position_size / grid_levels
         
         logger.info(
-            f"[capital_manager.py:{self._get_line_number()}] 网格仓位计算: "
-            f"{self.user_id} 总仓位={total_position_size} 网格层数={grid_levels} "
-            f"单个网格={grid_position_size}"
+            "网格仓位计算: {} 总仓位={} 网格层数={} 单个网格={}",
+            self.user_id, total_position_size, grid_levels, grid_position_size
         )
         
         return grid_position_size
     
+    def size_entry(
+        self,
+        symbol_count: int,
+        entry_price: float,
+        ratio: float = 1.0,
+        grid_levels: int = 1
+    ) -> EntrySize:
+        """
+        一次计算入场所需的保证金分配、仓位大小和单个网格仓位
+        
+        等价于依次调用 calculate_margin_per_symbol、calculate_position_size 和
+        calculate_grid_position_size，参数校验和计算结果一致，只记录一条日志。
+        
+        Args:
+            symbol_count: 交易对数量
+            entry_price: 入场价格
+            ratio: 资金使用比例（默认1.0）
+            grid_levels: 网格层数（默认1，非网格场景下单格仓位等于总仓位）
+        
+        Returns:
+            EntrySize: 保证金、仓位大小和单个网格仓位
+        
+        Raises:
+            ValueError: 如果参数无效或余额未初始化
+        
+        Example:
+            >>> capital_manager.update_balance(10000.0)
+            >>> sizing = capital_manager.size_entry(5, 1.0, 1.0, 10)
+            >>> print(sizing)  # EntrySize(margin_per_symbol=1900.0, quantity=7600.0, grid_quantity=760.0)
+        """
+        margin = self._cached_margin_per_symbol
+        if margin is None or symbol_count != self._cached_symbol_count:
+            margin = self.calculate_margin_per_symbol(symbol_count)
+        
+        self._validate_sizing(margin, entry_price, ratio, grid_levels)
+        
+        quantity = _position_size(margin, entry_price, ratio, self.leverage)
+        sizing = EntrySize(margin, quantity, quantity / grid_levels)
+        
+        logger.info(
+            "入场仓位计算: {} 保证金={} 价格={} 比例={} 杠杆={}x 仓位={} 网格层数={} 单个网格={}",
+            self.user_id, margin, entry_price, ratio, self.leverage, quantity, grid_levels, sizing.grid_quantity
+        )
+        
+        return sizing
+    
+    @staticmethod
+    def _validate_sizing(margin: float, entry_price: float, ratio: float, grid_levels: int = 1) -> None:
+        """
+        校验仓位计算参数
+        
+        Args:
+            margin: 分配的保证金
+            entry_price: 入场价格
+            ratio: 资金使用比例
+            grid_levels: 网格层数（默认1，非网格计算无需传入）
+        
+        Raises:
+            ValueError: 如果参数无效
+        """
+        if margin <= 0:
+            raise ValueError(f"保证金必须大于0: {margin}")
+        if entry_price <= 0:
+            raise ValueError(f"入场价格必须大于0: {entry_price}")
+        if ratio <= 0 or ratio > 1:
+            raise ValueError(f"资金比例必须在(0, 1]范围内: {ratio}")
+        if grid_levels <= 0:
+            raise ValueError(f"网格层数必须大于0: {grid_levels}")
+    
     def get_leverage(self) -> int:
         """
         获取杠杆倍数
@@ -285,10 +383,3 @@ class CapitalManager:
             str: 保证金类型（USDT或USDC）
         """
         return self.margin_type
-    
-    @staticmethod
-    def _get_line_number() -> int:
-        """获取当前行号（用于日志）"""
-        import inspect
-        return inspect.currentframe().f_back.f_lineno
-
@@ -18,8 +18,62 @@ GridCalculator负责计算网格交易的价格和数量，包括：
     )
 """
 
-from typing import List, Dict, Any
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
+import numpy as np
 from loguru import logger
+from src.utils.jit import njit
+
+
+@njit(cache=True)
+def _grid_prices_jit(upper_price: float, lower_price: float, grid_levels: int) -> np.ndarray:
+    """
+    网格价格计算内核
+
+    按闭式 lower + span * i / levels 计算每一层价格，最后一层直接取上边价格。
+
+    Args:
+        upper_price: 网格上边价格
+        lower_price: 网格下边价格
+        grid_levels: 网格层数
+
+    Returns:
+        np.ndarray: 网格价格数组（从下到上，长度为 grid_levels + 1）
+    """
+    prices = lower_price + (upper_price - lower_price) * np.arange(grid_levels + 1) / grid_levels
+    prices[grid_levels] = upper_price
+    return prices
+
+
+@lru_cache(maxsize=256)
+def _calculate_grid_prices(
+    upper_price: float,
+    lower_price: float,
+    grid_levels: int
+) -> Tuple[float, ...]:
+    """
+    计算网格价格（带缓存）
+    
+    纯函数，按 (upper_price, lower_price, grid_levels) 缓存结果。
+    返回元组以保证缓存结果不会被调用方修改。
+    
+    每个价格按闭式 lower + span * i / levels 独立计算，避免
+    lower + i * interval 的误差累积，首尾价格与上下边价格完全一致。
+    
+    Args:
+        upper_price: 网格上边价格
+        lower_price: 网格下边价格
+        grid_levels: 网格层数
+    
+    Returns:
+        Tuple[float, ...]: 网格价格（从下到上）
+    """
+    prices = tuple(_grid_prices_jit(upper_price, lower_price, grid_levels).tolist())
+    
+    logger.debug("网格价格计算完成: 层数={} 价格数量={}", grid_levels, len(prices))
+    
+    return prices
 
 
 class GridOrder:
@@ -63,7 +117,7 @@ class GridCalculator:
     
     def __init__(self):
         """初始化网格计算器"""
-        logger.info(f"[grid_calculator.py:{self._get_line_number()}] 网格计算器初始化完成")
+        logger.info("网格计算器初始化完成")
     
     def calculate_price_interval(
         self,
@@ -101,8 +155,8 @@ class GridCalculator:
         interval = (upper_price - lower_price) / grid_levels
         
         logger.debug(
-            f"[grid_calculator.py:{self._get_line_number()}] 价格间隔计算: "
-            f"上边={upper_price} 下边={lower_price} 层数={grid_levels} 间隔={interval}"
+            "价格间隔计算: 上边={} 下边={} 层数={} 间隔={}",
+            upper_price, lower_price, grid_levels, interval
         )
         
         return interval
@@ -112,36 +166,35 @@ class GridCalculator:
         upper_price: float,
         lower_price: float,
         grid_levels: int
-    ) -> List[float]:
+    ) -> Tuple[float, ...]:
         """
         计算所有网格价格
         
+        相同的 (上边价格, 下边价格, 层数) 只计算一次，后续调用直接返回缓存结果。
+        
         Args:
             upper_price: 网格上边价格
             lower_price: 网格下边价格
             grid_levels: 网格层数
         
         Returns:
-            List[float]: 网格价格列表（从下到上）
+            Tuple[float, ...]: 网格价格元组（从下到上，不可变）
+        
+        Raises:
+            ValueError: 如果参数无效
         
         Example:
             >>> calculator = GridCalculator()
             >>> prices = calculator.calculate_grid_prices(1.05, 0.95, 10)
-            >>> print(prices)  # [0.95, 0.96, 0.97, ..., 1.04, 1.05]
+            >>> print(prices)  # (0.95, 0.96, 0.97, ..., 1.04, 1.05)
         """
-        interval = self.calculate_price_interval(upper_price, lower_price, grid_levels)
-        
-        prices = []
-        for i in range(grid_levels + 1):
-            price = lower_price + i * interval
-            prices.append(price)
+        if upper_price <= lower_price:
+            raise ValueError(f"上边价格必须大于下边价格: {upper_price} <= {lower_price}")
         
-        logger.debug(
-            f"[grid_calculator.py:{self._get_line_number()}] 网格价格计算完成: "
-            f"层数={grid_levels} 价格数量={len(prices)}"
-        )
+        if grid_levels <= 0:
+            raise ValueError(f"网格层数必须大于0: {grid_levels}")
         
-        return prices
+        return _calculate_grid_prices(upper_price, lower_price, grid_levels)
     
     def calculate_grid_orders(
         self,
@@ -196,8 +249,8 @@ class GridCalculator:
             orders.append(order)
         
         logger.info(
-            f"[grid_calculator.py:{self._get_line_number()}] 网格订单计算完成: "
-            f"层数={grid_levels} 总数量={total_quantity} 每层数量={quantity_per_level}"
+            "网格订单计算完成: 层数={} 总数量={} 每层数量={}",
+            grid_levels, total_quantity, quantity_per_level
         )
         
         return orders
@@ -239,17 +292,14 @@ class GridCalculator:
         # 计算所有网格价格
         prices = self.calculate_grid_prices(upper_price, lower_price, grid_levels)
         
-        # 分离买单和卖单价格
-        buy_prices = [p for p in prices if p < entry_price]
-        sell_prices = [p for p in prices if p > entry_price]
+        # 价格单调递增，二分定位分界点（等于入场价的层级不挂单）
+        buy_prices = prices[:bisect_left(prices, entry_price)]
+        sell_prices = prices[bisect_right(prices, entry_price):]
         
         # 计算每个订单的数量
         total_orders = len(buy_prices) + len(sell_prices)
         if total_orders == 0:
-            logger.warning(
-                f"[grid_calculator.py:{self._get_line_number()}] "
-                f"没有可用的网格价格"
-            )
+            logger.warning("没有可用的网格价格")
             return {"buy_orders": [], "sell_orders": []}
         
         quantity_per_order = total_quantity / total_orders
@@ -277,18 +327,12 @@ class GridCalculator:
             sell_orders.append(order)
         
         logger.info(
-            f"[grid_calculator.py:{self._get_line_number()}] 对称网格订单计算完成: "
-            f"买单={len(buy_orders)} 卖单={len(sell_orders)} 每单数量={quantity_per_order}"
+            "对称网格订单计算完成: 买单={} 卖单={} 每单数量={}",
+            len(buy_orders), len(sell_orders), quantity_per_order
         )
         
         return {
             "buy_orders": buy_orders,
             "sell_orders": sell_orders
         }
-    
-    @staticmethod
-    def _get_line_number() -> int:
-        """获取当前行号（用于日志）"""
-        import inspect
-        return inspect.currentframe().f_back.f_lineno
 
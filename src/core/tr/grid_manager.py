@@ -21,12 +21,49 @@ GridManager负责网格订单的创建、管理和配对，包括：
     )
 """
 
-from typing import Dict, List, Optional, Any
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Optional, Any, Tuple
+import numpy as np
 from loguru import logger
 from src.core.event.event_bus import EventBus
 from src.core.tr.order_manager import OrderManager
 from src.core.tr.precision_handler import PrecisionHandler
-from src.core.tr.grid_calculator import GridCalculator, GridOrder
+from src.core.tr.profit_calculator import _grid_pair_profit_kernel
+from src.core.tr.grid_calculator import GridCalculator, GridOrder, _grid_prices_jit
+from src.utils.jit import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def _profits_jit(
+    buy_prices: np.ndarray,
+    sell_prices: np.ndarray,
+    quantities: np.ndarray,
+    fee_rate: float
+) -> np.ndarray:
+    """
+    网格配对利润批量计算内核
+
+    利润 = 数量 × ((卖价 - 买价) - (买价 + 卖价) × 手续费率)
+
+    运算顺序与单配对内核 _grid_pair_profit_kernel 相同且均不启用fastmath，
+    逐元素结果与单配对计算完全一致。
+    """
+    return quantities * ((sell_prices - buy_prices) - (buy_prices + sell_prices) * fee_rate)
+
+
+def warm_up_kernels() -> None:
+    """
+    预热网格计算内核
+    
+    Numba内核在首次调用时才编译（或从磁盘缓存加载），在启动阶段用与实盘相同的
+    参数类型调用一次，避免首个网格事件承担编译延迟。单配对利润内核按签名在导入时
+    编译，无需预热。未安装Numba时直接返回。
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    
+    prices = _grid_prices_jit(2.0, 1.0, 1)
+    _profits_jit(prices, prices, prices, 0.0)
 
 
 class GridPair:
@@ -82,18 +119,7 @@ class GridPair:
         Returns:
             float: 利润金额
         """
-        # 利润 = (卖价 - 买价) × 数量 - 手续费
-        price_diff = self.sell_price - self.buy_price
-        gross_profit = price_diff * self.quantity
-        
-        # 手续费 = 买入手续费 + 卖出手续费
-        buy_fee = self.buy_price * self.quantity * fee_rate
-        sell_fee = self.sell_price * self.quantity * fee_rate
-        total_fee = buy_fee + sell_fee
-        
-        net_profit = gross_profit - total_fee
-        
-        return net_profit
+        return _grid_pair_profit_kernel(self.buy_price, self.sell_price, self.quantity, fee_rate)
 
 
 class GridManager:
@@ -130,9 +156,9 @@ class GridManager:
         self._calculator = GridCalculator()
         
         # 网格配对管理: {symbol: {pair_id: GridPair}}
-        self._grid_pairs: Dict[str, Dict[str, GridPair]] = {}
+        self._grid_pairs: DefaultDict[str, Dict[str, GridPair]] = defaultdict(dict)
         
-        logger.info(f"[grid_manager.py:{self._get_line_number()}] 网格管理器初始化完成")
+        logger.info("网格管理器初始化完成")
     
     async def create_grid_orders(
         self,
@@ -166,51 +192,28 @@ class GridManager:
             ...     "user_001", "XRPUSDC", 1.05, 0.95, 10, 1000.0, "BUY"
             ... )
         """
-        logger.info(
-            f"[grid_manager.py:{self._get_line_number()}] 创建网格订单: "
-            f"{symbol} 上边={upper_price} 下边={lower_price} 层数={grid_levels}"
-        )
+        logger.info("创建网格订单: {} 上边={} 下边={} 层数={}", symbol, upper_price, lower_price, grid_levels)
         
         # 计算网格订单
         grid_orders = self._calculator.calculate_grid_orders(
             upper_price, lower_price, grid_levels, total_quantity, side
         )
         
-        # 批量提交订单
-        order_ids = []
-        for grid_order in grid_orders:
-            # 精度处理
-            price, quantity = self._precision_handler.process_order_params(
-                symbol, grid_order.price, grid_order.quantity
-            )
-            
-            # 验证订单
-            is_valid, error = self._precision_handler.validate_order(symbol, price, quantity)
-            if not is_valid:
-                logger.warning(
-                    f"[grid_manager.py:{self._get_line_number()}] "
-                    f"网格订单无效，跳过: {error}"
-                )
-                continue
-            
-            # 提交订单
-            if order_type == "POST_ONLY":
-                await self._order_manager.submit_post_only_order(
-                    user_id, symbol, grid_order.side, quantity, price
-                )
-            else:
-                await self._order_manager.submit_limit_order(
-                    user_id, symbol, grid_order.side, quantity, price
-                )
-            
-            # TODO: 实际订单ID应该从DE模块的订单提交成功事件中获取
-            order_ids.append(f"grid_{symbol}_{grid_order.level}")
+        # 精度处理并过滤无效订单
+        valid_orders = self._filter_valid_orders(symbol, grid_orders, "网格订单无效")
         
-        logger.info(
-            f"[grid_manager.py:{self._get_line_number()}] 网格订单创建完成: "
-            f"{symbol} 订单数量={len(order_ids)}"
+        # 批量提交订单
+        await self._order_manager.submit_grid_orders(
+            user_id, symbol, self._grid_order_type(order_type),
+            [(grid_order.side, quantity, price) for grid_order, price, quantity in valid_orders]
         )
         
+        # TODO: 实际订单ID应该从DE模块的订单提交成功事件中获取
+        id_prefix = f"grid_{symbol}_"
+        order_ids = [id_prefix + str(grid_order.level) for grid_order, _, _ in valid_orders]
+        
+        logger.info("网格订单创建完成: {} 订单数量={}", symbol, len(order_ids))
+        
         return order_ids
     
     async def create_symmetric_grid_orders(
@@ -240,79 +243,85 @@ class GridManager:
         Returns:
             Dict[str, List[str]]: {"buy_order_ids": [...], "sell_order_ids": [...]}
         """
-        logger.info(
-            f"[grid_manager.py:{self._get_line_number()}] 创建对称网格订单: "
-            f"{symbol} 入场价={entry_price}"
-        )
+        logger.info("创建对称网格订单: {} 入场价={}", symbol, entry_price)
         
         # 计算对称网格订单
         orders = self._calculator.calculate_symmetric_grid_orders(
             entry_price, upper_price, lower_price, grid_levels, total_quantity
         )
         
-        buy_order_ids = []
-        sell_order_ids = []
+        valid_buys = self._filter_valid_orders(symbol, orders["buy_orders"], "买单无效")
+        valid_sells = self._filter_valid_orders(symbol, orders["sell_orders"], "卖单无效")
         
-        # 创建买单
-        for grid_order in orders["buy_orders"]:
-            price, quantity = self._precision_handler.process_order_params(
-                symbol, grid_order.price, grid_order.quantity
-            )
-            
-            is_valid, error = self._precision_handler.validate_order(symbol, price, quantity)
-            if not is_valid:
-                logger.warning(
-                    f"[grid_manager.py:{self._get_line_number()}] "
-                    f"买单无效，跳过: {error}"
-                )
-                continue
-            
-            if order_type == "POST_ONLY":
-                await self._order_manager.submit_post_only_order(
-                    user_id, symbol, "BUY", quantity, price
-                )
-            else:
-                await self._order_manager.submit_limit_order(
-                    user_id, symbol, "BUY", quantity, price
-                )
-            
-            buy_order_ids.append(f"grid_buy_{symbol}_{grid_order.level}")
+        # 买单和卖单合并为一批提交
+        submissions = [("BUY", quantity, price) for _, price, quantity in valid_buys]
+        submissions.extend(("SELL", quantity, price) for _, price, quantity in valid_sells)
+        await self._order_manager.submit_grid_orders(
+            user_id, symbol, self._grid_order_type(order_type), submissions
+        )
         
-        # 创建卖单
-        for grid_order in orders["sell_orders"]:
-            price, quantity = self._precision_handler.process_order_params(
-                symbol, grid_order.price, grid_order.quantity
-            )
-            
-            is_valid, error = self._precision_handler.validate_order(symbol, price, quantity)
-            if not is_valid:
-                logger.warning(
-                    f"[grid_manager.py:{self._get_line_number()}] "
-                    f"卖单无效，跳过: {error}"
-                )
-                continue
-            
-            if order_type == "POST_ONLY":
-                await self._order_manager.submit_post_only_order(
-                    user_id, symbol, "SELL", quantity, price
-                )
-            else:
-                await self._order_manager.submit_limit_order(
-                    user_id, symbol, "SELL", quantity, price
-                )
-            
-            sell_order_ids.append(f"grid_sell_{symbol}_{grid_order.level}")
+        buy_prefix = f"grid_buy_{symbol}_"
+        sell_prefix = f"grid_sell_{symbol}_"
+        buy_order_ids = [buy_prefix + str(grid_order.level) for grid_order, _, _ in valid_buys]
+        sell_order_ids = [sell_prefix + str(grid_order.level) for grid_order, _, _ in valid_sells]
         
-        logger.info(
-            f"[grid_manager.py:{self._get_line_number()}] 对称网格订单创建完成: "
-            f"{symbol} 买单={len(buy_order_ids)} 卖单={len(sell_order_ids)}"
-        )
+        logger.info("对称网格订单创建完成: {} 买单={} 卖单={}", symbol, len(buy_order_ids), len(sell_order_ids))
         
         return {
             "buy_order_ids": buy_order_ids,
             "sell_order_ids": sell_order_ids
         }
     
+    @staticmethod
+    def _grid_order_type(order_type: str) -> str:
+        """网格挂单类型：POST_ONLY 保持不变，其余按 LIMIT 提交"""
+        return "POST_ONLY" if order_type == "POST_ONLY" else "LIMIT"
+    
+    def _filter_valid_orders(
+        self,
+        symbol: str,
+        grid_orders: List[GridOrder],
+        invalid_message: str
+    ) -> List[Tuple[GridOrder, float, float]]:
+        """
+        网格订单精度处理并过滤无效订单
+        
+        网格计算器保证同一批订单数量相同，因此数量只做一次精度处理；
+        名义价值直接按 价格 × 数量 与最小名义价值比较，不再逐单调用 validate_order。
+        
+        Args:
+            symbol: 交易对
+            grid_orders: 网格订单列表
+            invalid_message: 无效订单的日志前缀
+        
+        Returns:
+            List[Tuple[GridOrder, float, float]]: 有效订单列表 [(网格订单, 处理后价格, 处理后数量)]
+        """
+        if not grid_orders:
+            return []
+        
+        quantity = self._precision_handler.round_quantity(symbol, grid_orders[0].quantity)
+        if quantity <= 0:
+            logger.warning("{}，跳过全部{}单: 数量必须大于0: {}", invalid_message, len(grid_orders), quantity)
+            return []
+        
+        min_notional = self._precision_handler.get_min_notional(symbol)
+        round_price = self._precision_handler.round_price
+        
+        valid_orders = []
+        for grid_order in grid_orders:
+            price = round_price(symbol, grid_order.price)
+            notional = price * quantity
+            if price <= 0 or notional < min_notional:
+                logger.warning(
+                    "{}，跳过: 价格={} 名义价值={} 最小要求={}",
+                    invalid_message, price, notional, min_notional
+                )
+                continue
+            valid_orders.append((grid_order, price, quantity))
+        
+        return valid_orders
+    
     def create_grid_pair(
         self,
         symbol: str,
@@ -332,20 +341,16 @@ class GridManager:
         Returns:
             str: 配对ID
         """
-        if symbol not in self._grid_pairs:
-            self._grid_pairs[symbol] = {}
+        bucket = self._grid_pairs[symbol]
 
         # 生成配对ID
-        pair_id = f"{symbol}_{len(self._grid_pairs[symbol])}"
+        pair_id = f"{symbol}_{len(bucket)}"
 
         # 创建配对
         pair = GridPair(pair_id, buy_price, sell_price, quantity)
-        self._grid_pairs[symbol][pair_id] = pair
+        bucket[pair_id] = pair
 
-        logger.debug(
-            f"[grid_manager.py:{self._get_line_number()}] 创建网格配对: "
-            f"{pair_id} 买价={buy_price} 卖价={sell_price}"
-        )
+        logger.debug("创建网格配对: {} 买价={} 卖价={}", pair_id, buy_price, sell_price)
 
         return pair_id
 
@@ -365,31 +370,22 @@ class GridManager:
             order_id: 订单ID
             side: 订单方向（"BUY" 或 "SELL"）
         """
-        if symbol not in self._grid_pairs:
-            logger.warning(
-                f"[grid_manager.py:{self._get_line_number()}] "
-                f"交易对不存在: {symbol}"
-            )
+        bucket = self._grid_pairs.get(symbol)
+        if bucket is None:
+            logger.warning("交易对不存在: {}", symbol)
             return
 
-        if pair_id not in self._grid_pairs[symbol]:
-            logger.warning(
-                f"[grid_manager.py:{self._get_line_number()}] "
-                f"配对不存在: {pair_id}"
-            )
+        pair = bucket.get(pair_id)
+        if pair is None:
+            logger.warning("配对不存在: {}", pair_id)
             return
 
-        pair = self._grid_pairs[symbol][pair_id]
-
         if side == "BUY":
             pair.set_buy_order(order_id)
         elif side == "SELL":
             pair.set_sell_order(order_id)
 
-        logger.debug(
-            f"[grid_manager.py:{self._get_line_number()}] 更新网格配对订单: "
-            f"{pair_id} {side}={order_id}"
-        )
+        logger.debug("更新网格配对订单: {} {}={}", pair_id, side, order_id)
 
     def mark_pair_completed(self, symbol: str, pair_id: str) -> Optional[float]:
         """
@@ -402,21 +398,19 @@ class GridManager:
         Returns:
             Optional[float]: 利润金额，如果配对不存在则返回None
         """
-        if symbol not in self._grid_pairs:
+        bucket = self._grid_pairs.get(symbol)
+        if bucket is None:
             return None
 
-        if pair_id not in self._grid_pairs[symbol]:
+        pair = bucket.get(pair_id)
+        if pair is None:
             return None
 
-        pair = self._grid_pairs[symbol][pair_id]
         pair.mark_completed()
 
         profit = pair.calculate_profit()
 
-        logger.info(
-            f"[grid_manager.py:{self._get_line_number()}] 网格配对完成: "
-            f"{pair_id} 利润={profit}"
-        )
+        logger.info("网格配对完成: {} 利润={}", pair_id, profit)
 
         return profit
 
@@ -432,6 +426,31 @@ class GridManager:
         """
         return self._grid_pairs.get(symbol, {})
 
+    def calculate_all_profits(self, symbol: str, fee_rate: float = 0.0004) -> np.ndarray:
+        """
+        批量计算交易对所有网格配对的利润
+
+        与逐个调用 GridPair.calculate_profit 结果一致，但一次性向量化计算。
+
+        Args:
+            symbol: 交易对
+            fee_rate: 手续费率（默认0.04%）
+
+        Returns:
+            np.ndarray: 各配对利润，顺序与 get_grid_pairs 一致；无配对时返回空数组
+        """
+        bucket = self._grid_pairs.get(symbol)
+        if not bucket:
+            return np.empty(0, dtype=np.float64)
+
+        pairs = bucket.values()
+        count = len(bucket)
+        buy = np.fromiter((p.buy_price for p in pairs), dtype=np.float64, count=count)
+        sell = np.fromiter((p.sell_price for p in pairs), dtype=np.float64, count=count)
+        qty = np.fromiter((p.quantity for p in pairs), dtype=np.float64, count=count)
+
+        return _profits_jit(buy, sell, qty, fee_rate)
+
     def clear_grid_pairs(self, symbol: str) -> None:
         """
         清除交易对的所有网格配对
@@ -439,14 +458,11 @@ class GridManager:
         Args:
             symbol: 交易对
         """
-        if symbol in self._grid_pairs:
-            count = len(self._grid_pairs[symbol])
-            del self._grid_pairs[symbol]
+        bucket = self._grid_pairs.pop(symbol, None)
+        if bucket is not None:
+            count = len(bucket)
 
-            logger.info(
-                f"[grid_manager.py:{self._get_line_number()}] 清除网格配对: "
-                f"{symbol} 数量={count}"
-            )
+            logger.info("清除网格配对: {} 数量={}", symbol, count)
 
     async def cancel_all_grid_orders(
         self,
@@ -462,19 +478,9 @@ class GridManager:
             symbol: 交易对
             order_ids: 订单ID列表
         """
-        logger.info(
-            f"[grid_manager.py:{self._get_line_number()}] 撤销网格订单: "
-            f"{symbol} 数量={len(order_ids)}"
-        )
+        logger.info("撤销网格订单: {} 数量={}", symbol, len(order_ids))
 
         await self._order_manager.cancel_all_orders(user_id, symbol, order_ids)
 
         # 清除配对
         self.clear_grid_pairs(symbol)
-
-    @staticmethod
-    def _get_line_number() -> int:
-        """获取当前行号（用于日志）"""
-        import inspect
-        return inspect.currentframe().f_back.f_lineno
-
@@ -17,13 +17,43 @@ OrderManager负责订单的提交、跟踪和撤销，包括：
     )
 """
 
-from typing import Optional
+import math
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
 from src.core.event.event_bus import EventBus
 from src.core.event.event import Event
 from src.core.tr.tr_events import TREvents
 
 
+# 常用精度的 10 的幂次表（0~15 位小数）
+_POW10 = tuple(10.0 ** i for i in range(16))
+
+
+def _round_half_up(value: float, precision: int) -> float:
+    """
+    按精度四舍五入（常用精度查表，其他精度回退到内置 round）
+
+    负数按绝对值四舍五入后保留符号，如 -1.5 → -2.0。
+    按小数部分判断是否进位，不使用 floor(x + 0.5)，避免加法舍入导致
+    0.49999999999999994 这类数值被进位。
+
+    Args:
+        value: 原始数值
+        precision: 精度（小数位数）
+
+    Returns:
+        float: 处理后的数值
+    """
+    if 0 <= precision < 16:
+        factor = _POW10[precision]
+        scaled = abs(value) * factor
+        units = math.floor(scaled)
+        if scaled - units >= 0.5:
+            units += 1
+        return math.copysign(units, value) / factor
+    return round(value, precision)
+
+
 class OrderManager:
     """
     订单管理器
@@ -32,6 +62,8 @@ class OrderManager:
     
     Attributes:
         _event_bus: 事件总线实例
+        _order_create_subject: 订单创建事件主题
+        _source: 事件源模块标识
     
     Example:
         >>> event_bus = EventBus()
@@ -39,6 +71,20 @@ class OrderManager:
         >>> await order_manager.submit_market_order("user_001", "XRPUSDC", "BUY", 100)
     """
     
+    # 各订单类型的事件数据字段（按顺序对应 _submit 的参数）
+    _ORDER_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+        "MARKET": ("user_id", "symbol", "side", "order_type", "quantity"),
+        "LIMIT": ("user_id", "symbol", "side", "order_type", "quantity", "price"),
+        "POST_ONLY": ("user_id", "symbol", "side", "order_type", "quantity", "price"),
+    }
+    
+    # 各订单类型的日志名称
+    _ORDER_LABELS: Dict[str, str] = {
+        "MARKET": "市价单",
+        "LIMIT": "限价单",
+        "POST_ONLY": "POST_ONLY订单",
+    }
+    
     def __init__(self, event_bus: EventBus):
         """
         初始化订单管理器
@@ -47,7 +93,12 @@ class OrderManager:
             event_bus: 事件总线实例
         """
         self._event_bus = event_bus
-        logger.info(f"[order_manager.py:{self._get_line_number()}] OrderManager初始化完成")
+        
+        # 订单提交热路径中复用的事件字段
+        self._order_create_subject = TREvents.ORDER_CREATE
+        self._source = "tr"
+        
+        logger.info("OrderManager初始化完成")
     
     async def submit_market_order(
         self,
@@ -68,23 +119,7 @@ class OrderManager:
         Example:
             >>> await order_manager.submit_market_order("user_001", "XRPUSDC", "BUY", 100)
         """
-        event = Event(
-            subject=TREvents.ORDER_CREATE,
-            data={
-                "user_id": user_id,
-                "symbol": symbol,
-                "side": side,
-                "order_type": "MARKET",
-                "quantity": quantity
-            },
-            source="tr"
-        )
-        
-        await self._event_bus.publish(event)
-        logger.info(
-            f"[order_manager.py:{self._get_line_number()}] 提交市价单: "
-            f"{user_id}/{symbol} {side} 数量={quantity}"
-        )
+        await self._submit("MARKET", user_id, symbol, side, quantity)
     
     async def submit_limit_order(
         self,
@@ -107,24 +142,7 @@ class OrderManager:
         Example:
             >>> await order_manager.submit_limit_order("user_001", "XRPUSDC", "BUY", 100, 1.0)
         """
-        event = Event(
-            subject=TREvents.ORDER_CREATE,
-            data={
-                "user_id": user_id,
-                "symbol": symbol,
-                "side": side,
-                "order_type": "LIMIT",
-                "quantity": quantity,
-                "price": price
-            },
-            source="tr"
-        )
-        
-        await self._event_bus.publish(event)
-        logger.info(
-            f"[order_manager.py:{self._get_line_number()}] 提交限价单: "
-            f"{user_id}/{symbol} {side} 价格={price} 数量={quantity}"
-        )
+        await self._submit("LIMIT", user_id, symbol, side, quantity, price)
     
     async def submit_post_only_order(
         self,
@@ -147,25 +165,92 @@ class OrderManager:
         Example:
             >>> await order_manager.submit_post_only_order("user_001", "XRPUSDC", "BUY", 100, 1.0)
         """
-        event = Event(
-            subject=TREvents.ORDER_CREATE,
-            data={
-                "user_id": user_id,
-                "symbol": symbol,
-                "side": side,
-                "order_type": "POST_ONLY",
-                "quantity": quantity,
-                "price": price
-            },
-            source="tr"
-        )
+        await self._submit("POST_ONLY", user_id, symbol, side, quantity, price)
+    
+    async def submit_grid_orders(
+        self,
+        user_id: str,
+        symbol: str,
+        order_type: str,
+        orders: List[Tuple[str, float, float]]
+    ) -> None:
+        """
+        批量提交网格挂单（LIMIT 或 POST_ONLY）
+        
+        公共字段只构建一次模板，逐单复制后补充方向、数量和价格。
+        每个订单仍发布独立的Event：订阅方可能持有事件引用，且event_id需唯一。
+        
+        Args:
+            user_id: 用户ID
+            symbol: 交易对符号
+            order_type: 订单类型（"LIMIT" 或 "POST_ONLY"）
+            orders: 订单列表，每项为 (方向, 数量, 价格)
+        
+        Example:
+            >>> await order_manager.submit_grid_orders(
+            ...     "user_001", "XRPUSDC", "LIMIT", [("BUY", 100, 0.99), ("BUY", 100, 0.98)]
+            ... )
+        """
+        template = {"user_id": user_id, "symbol": symbol, "order_type": order_type}
+        subject = self._order_create_subject
+        source = self._source
+        publish = self._event_bus.publish
+        
+        for side, quantity, price in orders:
+            data = template.copy()
+            data["side"] = side
+            data["quantity"] = quantity
+            data["price"] = price
+            await publish(Event(subject=subject, data=data, source=source))
         
-        await self._event_bus.publish(event)
         logger.info(
-            f"[order_manager.py:{self._get_line_number()}] 提交POST_ONLY订单: "
-            f"{user_id}/{symbol} {side} 价格={price} 数量={quantity}"
+            "批量提交网格订单: {}/{} 类型={} 数量={}", user_id, symbol, order_type, len(orders)
         )
     
+    async def _submit(
+        self,
+        order_type: str,
+        user_id: str,
+        symbol: str,
+        side: str,
+        quantity: float,
+        price: Optional[float] = None
+    ) -> None:
+        """
+        按订单类型模板构建事件数据并发布订单创建事件
+        
+        Args:
+            order_type: 订单类型（"MARKET"、"LIMIT" 或 "POST_ONLY"）
+            user_id: 用户ID
+            symbol: 交易对符号
+            side: 方向（"BUY" 或 "SELL"）
+            quantity: 数量
+            price: 价格（市价单忽略）
+        
+        Raises:
+            ValueError: 订单类型不支持时抛出
+        """
+        fields = self._ORDER_TEMPLATES.get(order_type)
+        if fields is None:
+            raise ValueError(f"不支持的订单类型: {order_type}")
+        
+        # 市价单模板只有5个字段，zip 自动丢弃价格
+        data = dict(zip(fields, (user_id, symbol, side, order_type, quantity, price)))
+        await self._event_bus.publish(
+            Event(subject=self._order_create_subject, data=data, source=self._source)
+        )
+        
+        if price is None:
+            logger.info(
+                "提交{}: {}/{} {} 数量={}",
+                self._ORDER_LABELS[order_type], user_id, symbol, side, quantity
+            )
+        else:
+            logger.info(
+                "提交{}: {}/{} {} 价格={} 数量={}",
+                self._ORDER_LABELS[order_type], user_id, symbol, side, price, quantity
+            )
+    
     async def cancel_order(
         self,
         user_id: str,
@@ -190,20 +275,17 @@ class OrderManager:
                 "symbol": symbol,
                 "order_id": order_id
             },
-            source="tr"
+            source=self._source
         )
         
         await self._event_bus.publish(event)
-        logger.info(
-            f"[order_manager.py:{self._get_line_number()}] 撤销订单: "
-            f"{user_id}/{symbol} 订单ID={order_id}"
-        )
+        logger.info("撤销订单: {}/{} 订单ID={}", user_id, symbol, order_id)
     
     async def cancel_all_orders(
         self,
         user_id: str,
         symbol: str,
-        order_ids: list
+        order_ids: List[str]
     ) -> None:
         """
         批量撤销订单
@@ -211,7 +293,7 @@ class OrderManager:
         Args:
             user_id: 用户ID
             symbol: 交易对符号
-            order_ids: 订单ID列表
+            order_ids: 订单ID列表（只读遍历，调用方可直接传入自身维护的列表，撤单完成前不要修改）
         
         Example:
             >>> await order_manager.cancel_all_orders("user_001", "XRPUSDC", ["12345", "12346"])
@@ -219,10 +301,7 @@ class OrderManager:
         for order_id in order_ids:
             await self.cancel_order(user_id, symbol, order_id)
         
-        logger.info(
-            f"[order_manager.py:{self._get_line_number()}] 批量撤销订单: "
-            f"{user_id}/{symbol} 数量={len(order_ids)}"
-        )
+        logger.info("批量撤销订单: {}/{} 数量={}", user_id, symbol, len(order_ids))
     
     async def request_account_balance(
         self,
@@ -245,19 +324,16 @@ class OrderManager:
                 "user_id": user_id,
                 "asset": asset
             },
-            source="tr"
+            source=self._source
         )
         
         await self._event_bus.publish(event)
-        logger.info(
-            f"[order_manager.py:{self._get_line_number()}] 请求账户余额: "
-            f"{user_id} 资产={asset}"
-        )
+        logger.info("请求账户余额: {} 资产={}", user_id, asset)
     
     @staticmethod
     def round_price(price: float, precision: int) -> float:
         """
-        价格精度处理
+        价格精度处理（四舍五入）
         
         Args:
             price: 原始价格
@@ -270,12 +346,12 @@ class OrderManager:
             >>> OrderManager.round_price(1.23456, 2)
             1.23
         """
-        return round(price, precision)
+        return _round_half_up(price, precision)
     
     @staticmethod
     def round_quantity(quantity: float, precision: int) -> float:
         """
-        数量精度处理
+        数量精度处理（四舍五入）
         
         Args:
             quantity: 原始数量
@@ -288,11 +364,4 @@ class OrderManager:
             >>> OrderManager.round_quantity(100.123, 0)
             100.0
         """
-        return round(quantity, precision)
-    
-    @staticmethod
-    def _get_line_number() -> int:
-        """获取当前行号（用于日志）"""
-        import inspect
-        return inspect.currentframe().f_back.f_lineno
-
+        return _round_half_up(quantity, precision)
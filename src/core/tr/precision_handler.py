@@ -21,11 +21,66 @@ PrecisionHandler负责订单精度处理和验证，包括：
     is_valid = handler.validate_order("XRPUSDC", price, quantity)
 """
 
-from typing import Dict, Tuple, Optional
+import math
+from typing import Callable, Dict, Tuple, Optional
 from loguru import logger
 from decimal import Decimal, ROUND_DOWN
 
 
+# 浮点数可精确表示的整数上限，缩放后的数值超过它时整数缩放取整不再可靠
+_EXACT_UNITS_LIMIT = 2.0 ** 53
+
+
+def _make_floor_rounder(precision: int) -> Callable[[float], float]:
+    """
+    生成指定精度的向下取整函数
+    
+    缩放系数在闭包中预先计算，并校正浮点乘法误差
+    （例如 0.29 * 100 = 28.999999999999996），结果与Decimal按字符串向下取整一致。
+    缩放后超出浮点整数精确范围（2**53）的数值回退到Decimal取整。
+    
+    Args:
+        precision: 精度（小数位数，0..MAX_SCALED_PRECISION）
+    
+    Returns:
+        Callable[[float], float]: 向下取整函数
+    """
+    scale = 10 ** precision
+    floor = math.floor
+    decimal_rounder = _make_decimal_rounder(precision)
+    
+    def rounder(value: float) -> float:
+        scaled = value * scale
+        if scaled >= _EXACT_UNITS_LIMIT:
+            return decimal_rounder(value)
+        units = floor(scaled)
+        if (units + 1) / scale <= value:
+            units += 1
+        elif units / scale > value:
+            units -= 1
+        return units / scale
+    
+    return rounder
+
+
+def _make_decimal_rounder(precision: int) -> Callable[[float], float]:
+    """
+    生成基于Decimal的向下取整函数（用于超出整数缩放范围的精度）
+    
+    Args:
+        precision: 精度（小数位数，可为负数）
+    
+    Returns:
+        Callable[[float], float]: 向下取整函数
+    """
+    quantum = Decimal(10) ** -precision
+    
+    def rounder(value: float) -> float:
+        return float(Decimal(str(value)).quantize(quantum, rounding=ROUND_DOWN))
+    
+    return rounder
+
+
 class PrecisionHandler:
     """
     精度处理器
@@ -33,9 +88,12 @@ class PrecisionHandler:
     负责订单价格和数量的精度处理、验证。
     
     Attributes:
-        _symbol_precision: 交易对精度配置字典
+        _symbol_config: 交易对精度配置字典
             key: symbol (str)
             value: (price_precision, quantity_precision, min_notional)
+        _symbol_precision: 交易对取整配置字典（在_symbol_config基础上附加取整函数）
+            key: symbol (str)
+            value: (price_precision, quantity_precision, min_notional, price_fn, quantity_fn)
     
     Example:
         >>> handler = PrecisionHandler()
@@ -49,12 +107,42 @@ class PrecisionHandler:
     DEFAULT_QUANTITY_PRECISION = 0
     DEFAULT_MIN_NOTIONAL = 5.0  # 最小名义价值（USDT/USDC）
     
+    # 整数缩放取整支持的最大精度，超出时回退到Decimal
+    # （13位及以上小数时缩放结果与Decimal按字符串取整不再一致）
+    MAX_SCALED_PRECISION = 12
+    
+    # 默认配置: (价格精度, 数量精度, 最小名义价值)
+    _DEFAULT_TUPLE: Tuple[int, int, float] = (
+        DEFAULT_PRICE_PRECISION,
+        DEFAULT_QUANTITY_PRECISION,
+        DEFAULT_MIN_NOTIONAL,
+    )
+    
+    # 按精度索引的向下取整函数表: _ROUNDERS[precision](value)
+    _ROUNDERS: Tuple[Callable[[float], float], ...] = tuple(
+        _make_floor_rounder(p) for p in range(MAX_SCALED_PRECISION + 1)
+    )
+    
+    # 默认取整条目: (价格精度, 数量精度, 最小名义价值, 价格取整函数, 数量取整函数)
+    _DEFAULT_ENTRY: Tuple[int, int, float, Callable, Callable] = _DEFAULT_TUPLE + (
+        _ROUNDERS[DEFAULT_PRICE_PRECISION],
+        _ROUNDERS[DEFAULT_QUANTITY_PRECISION],
+    )
+    
     def __init__(self):
         """初始化精度处理器"""
         # 交易对精度配置: {symbol: (price_precision, quantity_precision, min_notional)}
-        self._symbol_precision: Dict[str, Tuple[int, int, float]] = {}
+        self._symbol_config: Dict[str, Tuple[int, int, float]] = {}
         
-        logger.info(f"[precision_handler.py:{self._get_line_number()}] 精度处理器初始化完成")
+        # 交易对取整配置: {symbol: (price_precision, quantity_precision, min_notional,
+        #                          price_fn, quantity_fn)}
+        self._symbol_precision: Dict[str, Tuple[int, int, float, Callable, Callable]] = {}
+        
+        # 最近一次命中的取整配置（单槽缓存）
+        self._last_symbol: Optional[str] = None
+        self._last_entry: Tuple[int, int, float, Callable, Callable] = self._DEFAULT_ENTRY
+        
+        logger.info("精度处理器初始化完成")
     
     def set_symbol_precision(
         self,
@@ -75,12 +163,19 @@ class PrecisionHandler:
         Example:
             >>> handler.set_symbol_precision("XRPUSDC", 4, 0, 5.0)
         """
-        self._symbol_precision[symbol] = (price_precision, quantity_precision, min_notional)
+        config = (price_precision, quantity_precision, min_notional)
+        self._symbol_config[symbol] = config
+        self._symbol_precision[symbol] = config + (
+            self._get_rounder(price_precision),
+            self._get_rounder(quantity_precision),
+        )
+        
+        # 配置变更后使单槽缓存失效
+        self._last_symbol = None
         
         logger.debug(
-            f"[precision_handler.py:{self._get_line_number()}] 设置精度配置: "
-            f"{symbol} 价格精度={price_precision} 数量精度={quantity_precision} "
-            f"最小名义价值={min_notional}"
+            "设置精度配置: {} 价格精度={} 数量精度={} 最小名义价值={}",
+            symbol, price_precision, quantity_precision, min_notional
         )
     
     def get_symbol_precision(self, symbol: str) -> Tuple[int, int, float]:
@@ -96,19 +191,28 @@ class PrecisionHandler:
         Example:
             >>> price_prec, qty_prec, min_notional = handler.get_symbol_precision("XRPUSDC")
         """
-        if symbol not in self._symbol_precision:
-            # 返回默认配置
-            logger.warning(
-                f"[precision_handler.py:{self._get_line_number()}] "
-                f"未找到{symbol}的精度配置，使用默认值"
-            )
-            return (
-                self.DEFAULT_PRICE_PRECISION,
-                self.DEFAULT_QUANTITY_PRECISION,
-                self.DEFAULT_MIN_NOTIONAL
-            )
+        config = self._symbol_config.get(symbol)
+        if config is None:
+            logger.warning("未找到{}的精度配置，使用默认值", symbol)
+            return self._DEFAULT_TUPLE
+        return config
+    
+    def get_min_notional(self, symbol: str) -> float:
+        """
+        获取交易对最小名义价值
+        
+        Args:
+            symbol: 交易对符号
         
-        return self._symbol_precision[symbol]
+        Returns:
+            float: 最小名义价值
+        
+        Example:
+            >>> handler.set_symbol_precision("XRPUSDC", 4, 0, 5.0)
+            >>> handler.get_min_notional("XRPUSDC")
+            5.0
+        """
+        return self._get_entry(symbol)[2]
     
     def round_price(self, symbol: str, price: float) -> float:
         """
@@ -126,19 +230,10 @@ class PrecisionHandler:
             >>> price = handler.round_price("XRPUSDC", 1.23456)
             >>> print(price)  # 1.2345
         """
-        price_precision, _, _ = self.get_symbol_precision(symbol)
-        
-        # 使用Decimal进行精确计算，避免浮点数误差
-        decimal_price = Decimal(str(price))
-        rounded_price = float(decimal_price.quantize(
-            Decimal(10) ** -price_precision,
-            rounding=ROUND_DOWN
-        ))
+        price_precision, _, _, price_fn, _ = self._get_entry(symbol)
+        rounded_price = price_fn(price)
         
-        logger.debug(
-            f"[precision_handler.py:{self._get_line_number()}] 价格精度处理: "
-            f"{symbol} 原始={price} 处理后={rounded_price} 精度={price_precision}"
-        )
+        logger.debug("价格精度处理: {} 原始={} 处理后={} 精度={}", symbol, price, rounded_price, price_precision)
         
         return rounded_price
     
@@ -158,18 +253,12 @@ class PrecisionHandler:
             >>> qty = handler.round_quantity("XRPUSDC", 100.123)
             >>> print(qty)  # 100.0
         """
-        _, quantity_precision, _ = self.get_symbol_precision(symbol)
-        
-        # 使用Decimal进行精确计算
-        decimal_quantity = Decimal(str(quantity))
-        rounded_quantity = float(decimal_quantity.quantize(
-            Decimal(10) ** -quantity_precision,
-            rounding=ROUND_DOWN
-        ))
+        _, quantity_precision, _, _, quantity_fn = self._get_entry(symbol)
+        rounded_quantity = quantity_fn(quantity)
         
         logger.debug(
-            f"[precision_handler.py:{self._get_line_number()}] 数量精度处理: "
-            f"{symbol} 原始={quantity} 处理后={rounded_quantity} 精度={quantity_precision}"
+            "数量精度处理: {} 原始={} 处理后={} 精度={}",
+            symbol, quantity, rounded_quantity, quantity_precision
         )
         
         return rounded_quantity
@@ -200,9 +289,8 @@ class PrecisionHandler:
         
         if not is_valid:
             logger.warning(
-                f"[precision_handler.py:{self._get_line_number()}] 名义价值不足: "
-                f"{symbol} 价格={price} 数量={quantity} "
-                f"名义价值={notional_value} 最小要求={min_notional}"
+                "名义价值不足: {} 价格={} 数量={} 名义价值={} 最小要求={}",
+                symbol, price, quantity, notional_value, min_notional
             )
         
         return is_valid
@@ -236,13 +324,13 @@ class PrecisionHandler:
         # 检查价格
         if price <= 0:
             error_msg = f"价格必须大于0: {price}"
-            logger.error(f"[precision_handler.py:{self._get_line_number()}] {error_msg}")
+            logger.error(error_msg)
             return False, error_msg
         
         # 检查数量
         if quantity <= 0:
             error_msg = f"数量必须大于0: {quantity}"
-            logger.error(f"[precision_handler.py:{self._get_line_number()}] {error_msg}")
+            logger.error(error_msg)
             return False, error_msg
         
         # 检查最小名义价值
@@ -279,15 +367,51 @@ class PrecisionHandler:
         rounded_quantity = self.round_quantity(symbol, quantity)
         
         logger.debug(
-            f"[precision_handler.py:{self._get_line_number()}] 订单参数处理: "
-            f"{symbol} 价格 {price}->{rounded_price} 数量 {quantity}->{rounded_quantity}"
+            "订单参数处理: {} 价格 {}->{} 数量 {}->{}",
+            symbol, price, rounded_price, quantity, rounded_quantity
         )
         
         return rounded_price, rounded_quantity
     
-    @staticmethod
-    def _get_line_number() -> int:
-        """获取当前行号（用于日志）"""
-        import inspect
-        return inspect.currentframe().f_back.f_lineno
-
+    def _get_entry(self, symbol: str) -> Tuple[int, int, float, Callable, Callable]:
+        """
+        获取交易对配置条目（未配置时返回默认条目）
+        
+        网格下单时同一交易对会连续取整多次，先比较最近一次命中的交易对，
+        命中时跳过字典查找。
+        
+        Args:
+            symbol: 交易对符号
+        
+        Returns:
+            Tuple[int, int, float, Callable, Callable]: (价格精度, 数量精度, 最小名义价值,
+                价格取整函数, 数量取整函数)
+        """
+        if symbol == self._last_symbol:
+            return self._last_entry
+        
+        entry = self._symbol_precision.get(symbol)
+        if entry is None:
+            logger.warning("未找到{}的精度配置，使用默认值", symbol)
+            return self._DEFAULT_ENTRY
+        
+        self._last_symbol = symbol
+        self._last_entry = entry
+        return entry
+    
+    def _get_rounder(self, precision: int) -> Callable[[float], float]:
+        """
+        获取指定精度的向下取整函数
+        
+        常用精度（0..MAX_SCALED_PRECISION）直接取自_ROUNDERS表；
+        超出范围（负数或更高精度）时生成基于Decimal的取整函数。
+        
+        Args:
+            precision: 精度（小数位数）
+        
+        Returns:
+            Callable[[float], float]: 向下取整函数
+        """
+        if 0 <= precision <= self.MAX_SCALED_PRECISION:
+            return self._ROUNDERS[precision]
+        return _make_decimal_rounder(precision)
@@ -29,7 +29,59 @@ ProfitCalculator负责计算交易利润，包括：
 """
 
 from typing import List, Dict, Any, Optional
+import numpy as np
 from loguru import logger
+from src.utils.jit import njit, NUMBA_AVAILABLE
+
+
+@njit("float64(float64, float64, float64, boolean, float64)", cache=True)
+def _order_profit_kernel(
+    entry_price: float,
+    exit_price: float,
+    quantity: float,
+    is_long: bool,
+    fee_rate: float
+) -> float:
+    """
+    单个订单利润计算内核
+
+    利润 = 数量 × (价格差 - (入场价 + 出场价) × 手续费率)
+    """
+    price_diff = exit_price - entry_price if is_long else entry_price - exit_price
+    return quantity * (price_diff - (entry_price + exit_price) * fee_rate)
+
+
+@njit("float64(float64, float64, float64, float64)", cache=True)
+def _grid_pair_profit_kernel(
+    buy_price: float,
+    sell_price: float,
+    quantity: float,
+    fee_rate: float
+) -> float:
+    """
+    网格配对利润计算内核
+
+    利润 = 数量 × ((卖价 - 买价) - (买价 + 卖价) × 手续费率)
+    """
+    return quantity * ((sell_price - buy_price) - (buy_price + sell_price) * fee_rate)
+
+
+@njit(cache=True)
+def _profit_summary_kernel(profits: np.ndarray):
+    """
+    总盈亏汇总内核
+
+    单次遍历同时得到总利润、盈利单数量和亏损单数量，避免生成临时布尔数组。
+    比较结果直接按整数累加，循环体内没有分支。未安装Numba时同样适用于普通列表。
+    """
+    total_profit = 0.0
+    profit_count = 0
+    loss_count = 0
+    for profit in profits:
+        total_profit += profit
+        profit_count += profit > 0
+        loss_count += profit < 0
+    return total_profit, profit_count, loss_count
 
 
 class ProfitCalculator:
@@ -44,9 +96,11 @@ class ProfitCalculator:
     
     DEFAULT_FEE_RATE = 0.0004  # 0.04% Taker费率
     
+    _VALID_SIDES = frozenset(("LONG", "SHORT"))
+    
     def __init__(self):
         """初始化利润计算器"""
-        logger.info(f"[profit_calculator.py:{self._get_line_number()}] 利润计算器初始化完成")
+        logger.info("利润计算器初始化完成")
     
     def calculate_order_profit(
         self,
@@ -83,39 +137,53 @@ class ProfitCalculator:
         if quantity <= 0:
             raise ValueError(f"数量必须大于0: {quantity}")
         
-        if side not in ["LONG", "SHORT"]:
+        if side not in self._VALID_SIDES:
             raise ValueError(f"持仓方向必须是LONG或SHORT: {side}")
         
         if fee_rate is None:
             fee_rate = self.DEFAULT_FEE_RATE
         
-        # 计算价格差
-        if side == "LONG":
-            # 多头：买入后卖出，利润 = (出场价 - 入场价) × 数量
-            price_diff = exit_price - entry_price
-        else:
-            # 空头：卖出后买入，利润 = (入场价 - 出场价) × 数量
-            price_diff = entry_price - exit_price
-        
-        # 毛利润
-        gross_profit = price_diff * quantity
-        
-        # 手续费 = 入场手续费 + 出场手续费
-        entry_fee = entry_price * quantity * fee_rate
-        exit_fee = exit_price * quantity * fee_rate
-        total_fee = entry_fee + exit_fee
-        
-        # 净利润
-        net_profit = gross_profit - total_fee
+        net_profit = _order_profit_kernel(
+            entry_price, exit_price, quantity, side == "LONG", fee_rate
+        )
         
         logger.debug(
-            f"[profit_calculator.py:{self._get_line_number()}] 订单利润计算: "
-            f"{side} 入场={entry_price} 出场={exit_price} 数量={quantity} "
-            f"毛利={gross_profit:.4f} 手续费={total_fee:.4f} 净利={net_profit:.4f}"
+            "订单利润计算: {} 入场={} 出场={} 数量={} 净利={:.4f}",
+            side, entry_price, exit_price, quantity, net_profit
         )
         
         return net_profit
     
+    def calculate_order_profit_fast(
+        self,
+        entry_price: float,
+        exit_price: float,
+        quantity: float,
+        is_long: bool,
+        fee_rate: float = DEFAULT_FEE_RATE
+    ) -> float:
+        """
+        计算单个订单的利润（不做参数校验）
+        
+        供参数已在上游校验过的内部路径使用（例如已开仓的交易任务平仓），
+        外部调用应使用calculate_order_profit。
+        
+        Args:
+            entry_price: 入场价格
+            exit_price: 出场价格
+            quantity: 数量
+            is_long: 是否多头持仓
+            fee_rate: 手续费率
+        
+        Returns:
+            float: 利润金额（正数为盈利，负数为亏损）
+        
+        Example:
+            >>> calculator = ProfitCalculator()
+            >>> profit = calculator.calculate_order_profit_fast(1.0, 1.05, 100.0, True)
+        """
+        return _order_profit_kernel(entry_price, exit_price, quantity, is_long, fee_rate)
+    
     def calculate_grid_pair_profit(
         self,
         buy_price: float,
@@ -149,22 +217,11 @@ class ProfitCalculator:
         if fee_rate is None:
             fee_rate = self.DEFAULT_FEE_RATE
         
-        # 价格差利润
-        price_diff = sell_price - buy_price
-        gross_profit = price_diff * quantity
-        
-        # 手续费
-        buy_fee = buy_price * quantity * fee_rate
-        sell_fee = sell_price * quantity * fee_rate
-        total_fee = buy_fee + sell_fee
-        
-        # 净利润
-        net_profit = gross_profit - total_fee
+        net_profit = _grid_pair_profit_kernel(buy_price, sell_price, quantity, fee_rate)
         
         logger.debug(
-            f"[profit_calculator.py:{self._get_line_number()}] 网格配对利润: "
-            f"买价={buy_price} 卖价={sell_price} 数量={quantity} "
-            f"毛利={gross_profit:.4f} 手续费={total_fee:.4f} 净利={net_profit:.4f}"
+            "网格配对利润: 买价={} 卖价={} 数量={} 净利={:.4f}",
+            buy_price, sell_price, quantity, net_profit
         )
         
         return net_profit
@@ -177,7 +234,7 @@ class ProfitCalculator:
         计算总盈亏
         
         Args:
-            order_profits: 订单利润列表
+            order_profits: 订单利润列表（也接受NumPy数组）
         
         Returns:
             Dict[str, float]: {
@@ -193,7 +250,7 @@ class ProfitCalculator:
             >>> print(result["total_profit"])  # 10.0
             >>> print(result["win_rate"])  # 0.5
         """
-        if not order_profits:
+        if len(order_profits) == 0:
             return {
                 "total_profit": 0.0,
                 "profit_count": 0,
@@ -201,16 +258,20 @@ class ProfitCalculator:
                 "win_rate": 0.0
             }
         
-        total_profit = sum(order_profits)
-        profit_count = sum(1 for p in order_profits if p > 0)
-        loss_count = sum(1 for p in order_profits if p < 0)
+        # 有Numba时转为数组交给编译内核；否则直接在原列表上单次遍历，省去数组构建
+        if NUMBA_AVAILABLE:
+            order_profits = np.asarray(order_profits, dtype=np.float64)
+        total_profit, profit_count, loss_count = _profit_summary_kernel(order_profits)
+        
+        total_profit = float(total_profit)
+        profit_count = int(profit_count)
+        loss_count = int(loss_count)
         total_count = len(order_profits)
         win_rate = profit_count / total_count if total_count > 0 else 0.0
         
         logger.info(
-            f"[profit_calculator.py:{self._get_line_number()}] 总盈亏计算: "
-            f"总利润={total_profit:.4f} 盈利单={profit_count} 亏损单={loss_count} "
-            f"胜率={win_rate:.2%}"
+            "总盈亏计算: 总利润={:.4f} 盈利单={} 亏损单={} 胜率={:.2%}",
+            total_profit, profit_count, loss_count, win_rate
         )
         
         return {
@@ -274,16 +335,6 @@ class ProfitCalculator:
         
         roi = profit / initial_capital
         
-        logger.debug(
-            f"[profit_calculator.py:{self._get_line_number()}] ROI计算: "
-            f"利润={profit:.4f} 初始资金={initial_capital:.4f} ROI={roi:.2%}"
-        )
+        logger.debug("ROI计算: 利润={:.4f} 初始资金={:.4f} ROI={:.2%}", profit, initial_capital, roi)
         
         return roi
-    
-    @staticmethod
-    def _get_line_number() -> int:
-        """获取当前行号（用于日志）"""
-        import inspect
-        return inspect.currentframe().f_back.f_lineno
-
@@ -18,13 +18,27 @@ TRDatabase负责TR模块的数据持久化，包括：
     tasks = await db.query_trading_tasks(user_id="user_001")
 """
 
+import asyncio
 import sqlite3
 import json
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from loguru import logger
 import aiosqlite
 
+try:
+    import orjson
+
+    def _json_dumps(value: Any) -> str:
+        """序列化为JSON字符串（orjson）"""
+        return orjson.dumps(value).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 
 class TRDatabase:
     """
@@ -34,9 +48,53 @@ class TRDatabase:
     
     Attributes:
         db_path: 数据库文件路径
-        _conn: 数据库连接
+        _conn: 数据库连接（写入）
+        _read_conn: 只读查询连接
+    """
+    
+    # 连接初始化参数：WAL日志 + NORMAL同步，批量写入时减少fsync次数
+    _PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-20000",
+    )
+    
+    # 订单插入语句
+    _INSERT_ORDER_SQL = """
+        INSERT INTO orders (
+            task_id, order_id, symbol, side, order_type,
+            price, quantity, filled_quantity, status,
+            is_grid_order, grid_pair_id, profit, created_at, filled_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     """
     
+    # 交易任务查询返回的列（与返回字典的键一致）
+    _TASK_COLUMNS = (
+        "id", "user_id", "symbol", "trading_mode", "position_state",
+        "entry_side", "entry_price", "entry_quantity", "exit_price",
+        "total_profit", "created_at", "opened_at", "closed_at", "grid_config",
+    )
+    
+    _SELECT_TASKS_SQL = "SELECT " + ", ".join(_TASK_COLUMNS) + " FROM trading_tasks"
+    
+    # 按 (是否按用户过滤, 是否按交易对过滤) 预先生成的查询语句
+    _QUERY_BY_FILTER = {
+        (False, False): _SELECT_TASKS_SQL + " ORDER BY created_at DESC LIMIT ?",
+        (True, False): _SELECT_TASKS_SQL + " WHERE user_id = ? ORDER BY created_at DESC LIMIT ?",
+        (False, True): _SELECT_TASKS_SQL + " WHERE symbol = ? ORDER BY created_at DESC LIMIT ?",
+        (True, True): (
+            _SELECT_TASKS_SQL
+            + " WHERE user_id = ? AND symbol = ? ORDER BY created_at DESC LIMIT ?"
+        ),
+    }
+    
+    # 未提交写入达到该行数时自动提交
+    FLUSH_ROWS = 100
+    
+    # WAL检查点间隔（秒）
+    CHECKPOINT_INTERVAL = 30.0
+    
     def __init__(self, db_path: str = "data/tr_trading.db"):
         """
         初始化数据库
@@ -47,7 +105,16 @@ class TRDatabase:
         self.db_path = db_path
         self._conn: Optional[aiosqlite.Connection] = None
         
-        logger.info(f"[tr_database.py:{self._get_line_number()}] TR数据库初始化: {db_path}")
+        # 只读查询连接（WAL模式下查询不阻塞写入）
+        self._read_conn: Optional[aiosqlite.Connection] = None
+        
+        # 后台WAL检查点任务
+        self._checkpoint_task: Optional[asyncio.Task] = None
+        
+        # 未提交的写入行数（save_order_nocommit）
+        self._pending_writes = 0
+        
+        logger.info("TR数据库初始化: {}", db_path)
     
     async def initialize(self) -> None:
         """
@@ -59,11 +126,30 @@ class TRDatabase:
         
         # 连接数据库
         self._conn = await aiosqlite.connect(self.db_path)
+        self._conn.row_factory = aiosqlite.Row
+        for pragma in self._PRAGMAS:
+            await self._conn.execute(pragma)
         
         # 创建表
         await self._create_tables()
         
-        logger.info(f"[tr_database.py:{self._get_line_number()}] TR数据库初始化完成")
+        # 只读查询连接（表创建完成后再打开）
+        read_uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        self._read_conn = await aiosqlite.connect(read_uri, uri=True)
+        self._read_conn.row_factory = aiosqlite.Row
+        
+        self._checkpoint_task = asyncio.create_task(self._checkpoint_loop())
+        
+        logger.info("TR数据库初始化完成")
+    
+    async def _checkpoint_loop(self) -> None:
+        """定期执行被动WAL检查点，控制WAL文件大小且不阻塞写入"""
+        while True:
+            await asyncio.sleep(self.CHECKPOINT_INTERVAL)
+            try:
+                await self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            except Exception as e:
+                logger.warning("WAL检查点执行失败: {}", e)
     
     async def _create_tables(self) -> None:
         """创建数据库表"""
@@ -125,9 +211,27 @@ class TRDatabase:
             )
         """)
         
-        await self._conn.commit()
+        # 查询索引：按用户/交易对过滤并按创建时间倒序
+        await self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_user_created "
+            "ON trading_tasks(user_id, created_at DESC)"
+        )
+        await self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_symbol_created "
+            "ON trading_tasks(symbol, created_at DESC)"
+        )
+        await self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_orders_task ON orders(task_id)"
+        )
+        # 部分索引：只索引网格订单，跳过大多数为NULL的行
+        await self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_orders_grid_pair "
+            "ON orders(grid_pair_id) WHERE grid_pair_id IS NOT NULL"
+        )
+        
+        await self._commit()
         
-        logger.info(f"[tr_database.py:{self._get_line_number()}] 数据库表创建完成")
+        logger.info("数据库表创建完成")
     
     async def save_trading_task(self, task_data: Dict[str, Any]) -> int:
         """
@@ -158,15 +262,15 @@ class TRDatabase:
             task_data.get("created_at"),
             task_data.get("opened_at"),
             task_data.get("closed_at"),
-            json.dumps(task_data.get("grid_config")) if task_data.get("grid_config") else None
+            _json_dumps(task_data.get("grid_config")) if task_data.get("grid_config") else None
         ))
         
-        await self._conn.commit()
+        await self._commit()
         task_id = cursor.lastrowid
         
         logger.info(
-            f"[tr_database.py:{self._get_line_number()}] 交易任务已保存: "
-            f"ID={task_id} {task_data.get('user_id')}/{task_data.get('symbol')}"
+            "交易任务已保存: ID={} {}/{}",
+            task_id, task_data.get('user_id'), task_data.get('symbol')
         )
         
         return task_id
@@ -181,13 +285,82 @@ class TRDatabase:
         Returns:
             int: 订单记录ID
         """
-        cursor = await self._conn.execute("""
-            INSERT INTO orders (
-                task_id, order_id, symbol, side, order_type,
-                price, quantity, filled_quantity, status,
-                is_grid_order, grid_pair_id, profit, created_at, filled_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        cursor = await self._conn.execute(self._INSERT_ORDER_SQL, self._order_row(order_data))
+        
+        await self._commit()
+        order_id = cursor.lastrowid
+        
+        logger.debug("订单已保存: ID={} {}", order_id, order_data.get('order_id'))
+        
+        return order_id
+    
+    async def save_order_nocommit(self, order_data: Dict[str, Any]) -> None:
+        """
+        保存订单但不立即提交
+        
+        写入累计达到FLUSH_ROWS行时自动提交，调用方也可以随时调用flush()提交。
+        
+        Args:
+            order_data: 订单数据
+        """
+        await self._conn.execute(self._INSERT_ORDER_SQL, self._order_row(order_data))
+        self._pending_writes += 1
+        
+        if self._pending_writes >= self.FLUSH_ROWS:
+            await self.flush()
+    
+    async def flush(self) -> None:
+        """提交所有未提交的写入"""
+        if self._pending_writes == 0:
+            return
+        
+        logger.debug("提交未提交写入: 数量={}", self._pending_writes)
+        await self._commit()
+    
+    async def _commit(self) -> None:
+        """
+        提交写连接上的事务
+        
+        所有写入共用同一连接，任何一次提交都会连带提交save_order_nocommit
+        累计的行，因此在此统一清零未提交计数。
+        """
+        await self._conn.commit()
+        self._pending_writes = 0
+    
+    async def save_orders_bulk(self, orders_data: List[Dict[str, Any]]) -> int:
+        """
+        批量保存订单（单次事务提交）
+        
+        Args:
+            orders_data: 订单数据列表
+        
+        Returns:
+            int: 保存的订单数量
+        """
+        if not orders_data:
+            return 0
+        
+        await self._conn.executemany(
+            self._INSERT_ORDER_SQL, [self._order_row(order_data) for order_data in orders_data]
+        )
+        await self._commit()
+        
+        logger.debug("批量保存订单: 数量={}", len(orders_data))
+        
+        return len(orders_data)
+    
+    @staticmethod
+    def _order_row(order_data: Dict[str, Any]) -> tuple:
+        """
+        订单数据转换为插入参数
+        
+        Args:
+            order_data: 订单数据
+        
+        Returns:
+            tuple: 与_INSERT_ORDER_SQL列顺序一致的参数
+        """
+        return (
             order_data.get("task_id"),
             order_data.get("order_id"),
             order_data.get("symbol"),
@@ -202,17 +375,7 @@ class TRDatabase:
             order_data.get("profit", 0.0),
             order_data.get("created_at"),
             order_data.get("filled_at")
-        ))
-        
-        await self._conn.commit()
-        order_id = cursor.lastrowid
-        
-        logger.debug(
-            f"[tr_database.py:{self._get_line_number()}] 订单已保存: "
-            f"ID={order_id} {order_data.get('order_id')}"
         )
-        
-        return order_id
     
     async def update_task_profit(self, task_id: int, total_profit: float) -> None:
         """
@@ -226,7 +389,7 @@ class TRDatabase:
             UPDATE trading_tasks SET total_profit = ? WHERE id = ?
         """, (total_profit, task_id))
         
-        await self._conn.commit()
+        await self._commit()
     
     async def query_trading_tasks(
         self,
@@ -245,54 +408,44 @@ class TRDatabase:
         Returns:
             List[Dict[str, Any]]: 交易任务列表
         """
-        query = "SELECT * FROM trading_tasks WHERE 1=1"
-        params = []
-        
-        if user_id:
-            query += " AND user_id = ?"
-            params.append(user_id)
-        
-        if symbol:
-            query += " AND symbol = ?"
-            params.append(symbol)
-        
-        query += " ORDER BY created_at DESC LIMIT ?"
-        params.append(limit)
+        has_user = bool(user_id)
+        has_symbol = bool(symbol)
+        query = self._QUERY_BY_FILTER[has_user, has_symbol]
         
-        cursor = await self._conn.execute(query, params)
-        rows = await cursor.fetchall()
+        if has_user and has_symbol:
+            params = (user_id, symbol, limit)
+        elif has_user:
+            params = (user_id, limit)
+        elif has_symbol:
+            params = (symbol, limit)
+        else:
+            params = (limit,)
         
         tasks = []
-        for row in rows:
-            task = {
-                "id": row[0],
-                "user_id": row[1],
-                "symbol": row[2],
-                "trading_mode": row[3],
-                "position_state": row[4],
-                "entry_side": row[5],
-                "entry_price": row[6],
-                "entry_quantity": row[7],
-                "exit_price": row[8],
-                "total_profit": row[9],
-                "created_at": row[10],
-                "opened_at": row[11],
-                "closed_at": row[12],
-                "grid_config": json.loads(row[13]) if row[13] else None
-            }
-            tasks.append(task)
+        async with self._read_conn.execute(query, params) as cursor:
+            async for row in cursor:
+                task = dict(row)
+                if task["grid_config"]:
+                    task["grid_config"] = _json_loads(task["grid_config"])
+                tasks.append(task)
         
         return tasks
     
     async def close(self) -> None:
-        """关闭数据库连接"""
+        """关闭数据库连接（关闭前提交未提交的写入）"""
+        if self._checkpoint_task:
+            self._checkpoint_task.cancel()
+            try:
+                await self._checkpoint_task
+            except asyncio.CancelledError:
+                pass
+            self._checkpoint_task = None
+        
+        if self._read_conn:
+            await self._read_conn.close()
+            self._read_conn = None
+        
         if self._conn:
+            await self.flush()
             await self._conn.close()
-            logger.info(f"[tr_database.py:{self._get_line_number()}] TR数据库连接已关闭")
-    
-    @staticmethod
-    def _get_line_number() -> int:
-        """获取当前行号（用于日志）"""
-        import inspect
-        return inspect.currentframe().f_back.f_lineno
-
+            logger.info("TR数据库连接已关闭")
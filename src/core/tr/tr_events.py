@@ -17,6 +17,11 @@ TR模块事件主题常量
     )
 """
 
+import os
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional
+
 
 class TREvents:
     """
@@ -30,6 +35,9 @@ class TREvents:
     - 避免硬编码字符串
     - 统一事件命名规范
     - 便于维护和查找
+    
+    主题字符串在定义时驻留（sys.intern），事件总线按主题查找字典时
+    可以直接以对象地址比较命中。
     """
     
     # ==================== 订阅的事件（输入） ====================
@@ -37,14 +45,14 @@ class TREvents:
     # PM模块发布的账户加载事件
     # 触发TR模块初始化资金管理，获取账户余额
     # 数据格式: {user_id, name, api_key, api_secret, strategy, testnet}
-    INPUT_ACCOUNT_LOADED = "pm.account.loaded"
+    INPUT_ACCOUNT_LOADED = sys.intern("pm.account.loaded")
     
     # ST模块发布的交易信号事件
     # 触发TR模块执行订单（建仓或平仓）
     # 数据格式: {user_id, symbol, side, action}
     # side: "LONG" 或 "SHORT"
     # action: "OPEN" 或 "CLOSE"
-    INPUT_SIGNAL_GENERATED = "st.signal.generated"
+    INPUT_SIGNAL_GENERATED = sys.intern("st.signal.generated")
     
     # ST模块发布的网格创建事件
     # 触发TR模块创建网格订单
@@ -52,37 +60,37 @@ class TREvents:
     # upper_price: 网格上边价格（由ST策略计算）
     # lower_price: 网格下边价格（由ST策略计算）
     # side: 网格方向，"LONG"表示多头网格，"SHORT"表示空头网格
-    INPUT_GRID_CREATE = "st.grid.create"
+    INPUT_GRID_CREATE = sys.intern("st.grid.create")
     
     # DE模块发布的订单成交事件
     # 触发TR模块更新订单状态和持仓信息
     # 数据格式: {user_id, order_id, symbol, price, quantity, timestamp}
-    INPUT_ORDER_FILLED = "de.order.filled"
+    INPUT_ORDER_FILLED = sys.intern("de.order.filled")
     
     # DE模块发布的订单状态更新事件
     # 触发TR模块更新订单状态
     # 数据格式: {user_id, order_id, status, filled_quantity, remaining_quantity}
-    INPUT_ORDER_UPDATE = "de.order.update"
+    INPUT_ORDER_UPDATE = sys.intern("de.order.update")
     
     # DE模块发布的订单提交成功事件
     # 触发TR模块记录订单ID
     # 数据格式: {user_id, order_id, symbol, side, type, quantity, price}
-    INPUT_ORDER_SUBMITTED = "de.order.submitted"
+    INPUT_ORDER_SUBMITTED = sys.intern("de.order.submitted")
     
     # DE模块发布的订单提交失败事件
     # 触发TR模块记录失败信息并可能重试
     # 数据格式: {user_id, symbol, error, retry_count}
-    INPUT_ORDER_FAILED = "de.order.failed"
+    INPUT_ORDER_FAILED = sys.intern("de.order.failed")
     
     # DE模块发布的订单取消成功事件
     # 触发TR模块更新订单状态
     # 数据格式: {user_id, order_id, symbol}
-    INPUT_ORDER_CANCELLED = "de.order.cancelled"
+    INPUT_ORDER_CANCELLED = sys.intern("de.order.cancelled")
     
     # DE模块发布的账户余额事件
     # 触发TR模块更新可用保证金
     # 数据格式: {user_id, asset, available_balance}
-    INPUT_ACCOUNT_BALANCE = "de.account.balance"
+    INPUT_ACCOUNT_BALANCE = sys.intern("de.account.balance")
     
     # ==================== 发布的事件（输出） ====================
     
@@ -90,63 +98,215 @@ class TREvents:
     # 当入场订单成交后发布，通知ST模块持仓已建立
     # 数据格式: {user_id, symbol, side, quantity, entry_price}
     # side: "LONG" 或 "SHORT"
-    POSITION_OPENED = "tr.position.opened"
+    POSITION_OPENED = sys.intern("tr.position.opened")
     
     # 持仓关闭事件
     # 当平仓完成后发布，通知ST模块持仓已关闭
     # 数据格式: {user_id, symbol, side, exit_price, pnl}
     # side: "LONG" 或 "SHORT"
     # pnl: 盈亏金额
-    POSITION_CLOSED = "tr.position.closed"
+    POSITION_CLOSED = sys.intern("tr.position.closed")
     
     # 订单创建请求事件
     # 向DE模块发送订单创建请求
     # 数据格式: {user_id, symbol, side, order_type, quantity, price?, stopPrice?}
     # side: "BUY" 或 "SELL"
     # order_type: "MARKET", "LIMIT", "POST_ONLY", "STOP", "TAKE_PROFIT"等
-    ORDER_CREATE = "trading.order.create"
+    ORDER_CREATE = sys.intern("trading.order.create")
     
     # 订单取消请求事件
     # 向DE模块发送订单取消请求
     # 数据格式: {user_id, symbol, order_id}
-    ORDER_CANCEL = "trading.order.cancel"
+    ORDER_CANCEL = sys.intern("trading.order.cancel")
     
     # 账户余额查询请求事件
     # 向DE模块发送账户余额查询请求
     # 数据格式: {user_id, asset}
     # asset: 保证金资产类型，如 "USDT" 或 "USDC"
-    ACCOUNT_BALANCE_REQUEST = "trading.get_account_balance"
+    ACCOUNT_BALANCE_REQUEST = sys.intern("trading.get_account_balance")
     
     # TR管理器启动完成事件
     # 当TR管理器初始化完成后发布
     # 数据格式: {timestamp, user_count}
-    MANAGER_STARTED = "tr.manager.started"
+    MANAGER_STARTED = sys.intern("tr.manager.started")
     
     # TR管理器关闭事件
     # 当TR管理器关闭时发布
     # 数据格式: {timestamp}
-    MANAGER_SHUTDOWN = "tr.manager.shutdown"
+    MANAGER_SHUTDOWN = sys.intern("tr.manager.shutdown")
     
     # 网格订单创建完成事件
     # 当网格订单全部创建完成后发布
     # 数据格式: {user_id, symbol, grid_count, total_quantity}
-    GRID_CREATED = "tr.grid.created"
+    GRID_CREATED = sys.intern("tr.grid.created")
     
     # 网格移动事件
     # 当网格因价格突破边界而移动时发布
     # 数据格式: {user_id, symbol, direction, new_upper_price, new_lower_price}
     # direction: "UP" 或 "DOWN"
-    GRID_MOVED = "tr.grid.moved"
+    GRID_MOVED = sys.intern("tr.grid.moved")
     
     # 交易任务创建事件
     # 当创建新的交易任务时发布
     # 数据格式: {user_id, symbol, task_id, side}
-    TASK_CREATED = "tr.task.created"
+    TASK_CREATED = sys.intern("tr.task.created")
     
     # 交易任务完成事件
     # 当交易任务完成（平仓）时发布
     # 数据格式: {user_id, symbol, task_id, pnl, duration}
-    TASK_COMPLETED = "tr.task.completed"
+    TASK_COMPLETED = sys.intern("tr.task.completed")
+
+
+# ==================== 订阅事件的类型化数据 ====================
+#
+# 事件数据在首次被处理时从字典解码一次，之后通过 Event.typed_data 以槽属性访问，
+# 避免每个处理器重复 dict.get()。数值字段由发布者按数值类型发布（见 Event 数据约定），
+# 解码时不再做 float()/int() 转换。
+#
+# 设置环境变量 TR_STRICT_EVENTS=1 时（测试环境），解码后校验数值字段类型。
+
+_STRICT_EVENTS = os.environ.get("TR_STRICT_EVENTS") == "1"
+
+
+def _check_numeric(payload: Any) -> None:
+    """
+    校验类型化数据的数值字段（仅 TR_STRICT_EVENTS=1 时调用）
+    
+    Args:
+        payload: 类型化数据实例
+    
+    Raises:
+        TypeError: 声明为 float/int 的字段不是数值类型
+    """
+    for f in fields(payload):
+        if f.type in ("float", "int", float, int):
+            value = getattr(payload, f.name)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError(
+                    f"{type(payload).__name__}.{f.name} 必须是数值类型，当前类型: {type(value)}"
+                )
+
+
+@dataclass(frozen=True, slots=True)
+class AccountLoadedPayload:
+    """账户加载事件数据（pm.account.loaded）"""
+    
+    user_id: str
+    strategy_config: Dict[str, Any]
+    
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'AccountLoadedPayload':
+        """从事件数据字典解码"""
+        return cls(data.get("user_id"), data.get("strategy_config", {}))
+
 
+@dataclass(frozen=True, slots=True)
+class SignalPayload:
+    """交易信号事件数据（st.signal.generated）"""
+    
+    user_id: str
+    symbol: str
+    side: str
+    action: str
+    price: Optional[float]
+    
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'SignalPayload':
+        """从事件数据字典解码"""
+        return cls(
+            data.get("user_id"),
+            data.get("symbol"),
+            data.get("side"),
+            data.get("action"),
+            data.get("price"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class GridCreatePayload:
+    """网格创建事件数据（st.grid.create）"""
+    
+    user_id: str
+    symbol: str
+    upper_price: float
+    lower_price: float
+    grid_levels: int
+    move_up: bool
+    move_down: bool
+    
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'GridCreatePayload':
+        """从事件数据字典解码"""
+        payload = cls(
+            data.get("user_id"),
+            data.get("symbol"),
+            data.get("upper_price", 0.0),
+            data.get("lower_price", 0.0),
+            data.get("grid_levels", 10),
+            data.get("move_up", False),
+            data.get("move_down", False),
+        )
+        if _STRICT_EVENTS:
+            _check_numeric(payload)
+        return payload
+
+
+@dataclass(frozen=True, slots=True)
+class OrderFilledPayload:
+    """订单成交事件数据（de.order.filled）"""
+    
+    user_id: str
+    order_id: str
+    symbol: str
+    price: float
+    quantity: float
+    side: Optional[str]
+    
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'OrderFilledPayload':
+        """从事件数据字典解码"""
+        payload = cls(
+            data.get("user_id"),
+            data.get("order_id"),
+            data.get("symbol"),
+            data.get("price", 0.0),
+            data.get("quantity", 0.0),
+            data.get("side"),
+        )
+        if _STRICT_EVENTS:
+            _check_numeric(payload)
+        return payload
+
+
+@dataclass(frozen=True, slots=True)
+class OrderRefPayload:
+    """订单引用事件数据（de.order.update / de.order.submitted）"""
+    
+    user_id: str
+    order_id: str
+    
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'OrderRefPayload':
+        """从事件数据字典解码"""
+        return cls(data.get("user_id"), data.get("order_id"))
 
 
+@dataclass(frozen=True, slots=True)
+class AccountBalancePayload:
+    """账户余额事件数据（de.account.balance）"""
+    
+    user_id: str
+    available_balance: float
+    balance: float
+    
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'AccountBalancePayload':
+        """从事件数据字典解码"""
+        payload = cls(
+            data.get("user_id"),
+            data.get("available_balance", 0.0),
+            data.get("balance", 0.0),
+        )
+        if _STRICT_EVENTS:
+            _check_numeric(payload)
+        return payload
@@ -16,16 +16,63 @@ TRManager是TR模块的核心管理类，采用单例模式，负责：
     await tr_manager.start()
 """
 
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Type, TypeVar
 from loguru import logger
 from src.core.event.event_bus import EventBus
 from src.core.event.event import Event
-from src.core.tr.tr_events import TREvents
+from src.core.tr.tr_events import (
+    TREvents,
+    AccountLoadedPayload,
+    SignalPayload,
+    GridCreatePayload,
+    OrderFilledPayload,
+    OrderRefPayload,
+    AccountBalancePayload,
+)
 from src.core.tr.order_manager import OrderManager
-from src.core.tr.capital_manager import CapitalManager
+from src.core.tr.capital_manager import CapitalManager, EntrySize
 from src.core.tr.precision_handler import PrecisionHandler
 from src.core.tr.trading_task import TradingTask, TradingMode, PositionState
-from src.core.tr.grid_manager import GridManager
+from src.core.tr.grid_manager import GridManager, warm_up_kernels
+
+
+# 高频发布的事件主题（模块级绑定，省去每次发布时的类属性查找）
+_EVT_TASK_CREATED = TREvents.TASK_CREATED
+_EVT_POS_OPENED = TREvents.POSITION_OPENED
+_EVT_POS_CLOSED = TREvents.POSITION_CLOSED
+
+# 持仓方向 -> 入场/出场订单方向
+_ENTRY_ORDER_SIDE: Dict[str, str] = {"LONG": "BUY", "SHORT": "SELL"}
+_EXIT_ORDER_SIDE: Dict[str, str] = {"LONG": "SELL", "SHORT": "BUY"}
+
+# 持仓状态 -> 平仓订单方向
+_POS_STATE_TO_EXIT: Dict[PositionState, str] = {
+    PositionState.LONG: "SELL",
+    PositionState.SHORT: "BUY",
+}
+
+_P = TypeVar("_P")
+
+
+def _decode(event: Event, payload_cls: Type[_P]) -> _P:
+    """
+    获取事件的类型化数据
+    
+    优先复用发布者或先前订阅者写入的 event.typed_data，
+    否则从 event.data 解码一次并写回，供同一事件的其他订阅者复用。
+    
+    Args:
+        event: 事件对象
+        payload_cls: 类型化数据类（需提供 from_data 类方法）
+    
+    Returns:
+        类型化数据实例
+    """
+    payload = event.typed_data
+    if type(payload) is not payload_cls:
+        payload = payload_cls.from_data(event.data)
+        event.typed_data = payload
+    return payload
 
 
 class TRManager:
@@ -37,7 +84,7 @@ class TRManager:
     Attributes:
         _instance: 单例实例
         _event_bus: 事件总线实例
-        _tasks: 交易任务字典，key为(user_id, symbol)，value为TradingTask实例
+        _tasks: 交易任务字典，按user_id、symbol两级索引，value为TradingTask实例
         _user_configs: 用户配置字典，key为user_id，value为配置信息
         _is_started: 是否已启动
     
@@ -49,20 +96,31 @@ class TRManager:
     
     _instance: Optional['TRManager'] = None
     
+    def __new__(cls, *args: Any, **kwargs: Any) -> 'TRManager':
+        """
+        创建或返回单例实例
+        
+        已存在实例时直接返回该实例，__init__ 通过 _initialized 标记跳过重复初始化。
+        """
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+    
     def __init__(self, event_bus: EventBus):
         """
         初始化TR管理器
         
-        注意：不要直接调用此方法，请使用 get_instance() 获取单例实例
+        推荐使用 get_instance() 获取单例实例；直接构造时返回同一实例且不会重复初始化。
         
         Args:
             event_bus: 事件总线实例
         """
-        if TRManager._instance is not None:
-            raise RuntimeError("TRManager是单例类，请使用get_instance()方法获取实例")
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
         
         self._event_bus: EventBus = event_bus
-        self._tasks: Dict[tuple, Any] = {}  # key: (user_id, symbol), value: TradingTask
+        self._tasks: Dict[str, Dict[str, TradingTask]] = {}  # {user_id: {symbol: TradingTask}}
         self._user_configs: Dict[str, Dict[str, Any]] = {}  # key: user_id, value: config
         self._capital_managers: Dict[str, CapitalManager] = {}  # key: user_id, value: CapitalManager
         self._is_started: bool = False
@@ -72,7 +130,14 @@ class TRManager:
         self._precision_handler = PrecisionHandler()
         self._grid_manager = GridManager(event_bus, self._order_manager, self._precision_handler)
 
-        logger.info(f"[tr_manager.py:{self._get_line_number()}] TRManager实例创建成功")
+        # 交易模式 -> 入场处理方法
+        self._entry_dispatch = {
+            TradingMode.NO_GRID: self._entry_no_grid,
+            TradingMode.NORMAL_GRID: self._entry_normal_grid,
+            TradingMode.ABNORMAL_GRID: self._entry_abnormal_grid,
+        }
+
+        logger.info("TRManager实例创建成功")
     
     @classmethod
     def get_instance(cls, event_bus: Optional[EventBus] = None) -> 'TRManager':
@@ -92,11 +157,12 @@ class TRManager:
             >>> event_bus = EventBus()
             >>> tr_manager = TRManager.get_instance(event_bus=event_bus)
         """
-        if cls._instance is None:
+        instance = cls._instance
+        if instance is None:
             if event_bus is None:
                 raise ValueError("首次调用get_instance()时必须提供event_bus参数")
-            cls._instance = cls(event_bus)
-        return cls._instance
+            instance = cls(event_bus)
+        return instance
     
     @classmethod
     def reset_instance(cls) -> None:
@@ -106,7 +172,7 @@ class TRManager:
         警告：此方法仅用于单元测试，生产环境不应调用
         """
         cls._instance = None
-        logger.warning(f"[tr_manager.py:{cls._get_line_number_static()}] TRManager实例已重置")
+        logger.warning("TRManager实例已重置")
     
     async def start(self) -> None:
         """
@@ -120,11 +186,14 @@ class TRManager:
         if self._is_started:
             raise RuntimeError("TRManager已经启动，不能重复启动")
         
+        # 预热网格计算内核，避免首个网格事件承担编译延迟
+        warm_up_kernels()
+        
         # 订阅事件
         await self._subscribe_events()
         
         self._is_started = True
-        logger.info(f"[tr_manager.py:{self._get_line_number()}] TRManager启动成功")
+        logger.info("TRManager启动成功")
         
         # 发布启动完成事件
         await self._publish_manager_started()
@@ -135,49 +204,24 @@ class TRManager:
         
         订阅来自PM、ST、DE模块的事件
         """
-        # 订阅PM模块的账户加载事件
-        self._event_bus.subscribe(
-            TREvents.INPUT_ACCOUNT_LOADED,
-            self._on_account_loaded
-        )
-
-        # 订阅ST模块的交易信号事件
-        self._event_bus.subscribe(
-            TREvents.INPUT_SIGNAL_GENERATED,
-            self._on_signal_generated
-        )
-
-        # 订阅ST模块的网格创建事件
-        self._event_bus.subscribe(
-            TREvents.INPUT_GRID_CREATE,
-            self._on_grid_create
-        )
-
-        # 订阅DE模块的订单成交事件
-        self._event_bus.subscribe(
-            TREvents.INPUT_ORDER_FILLED,
-            self._on_order_filled
-        )
-
-        # 订阅DE模块的订单状态更新事件
-        self._event_bus.subscribe(
-            TREvents.INPUT_ORDER_UPDATE,
-            self._on_order_update
-        )
-
-        # 订阅DE模块的订单提交成功事件
-        self._event_bus.subscribe(
-            TREvents.INPUT_ORDER_SUBMITTED,
-            self._on_order_submitted
-        )
-
-        # 订阅DE模块的账户余额事件
-        self._event_bus.subscribe(
-            TREvents.INPUT_ACCOUNT_BALANCE,
-            self._on_account_balance
-        )
+        self._event_bus.subscribe_many({
+            # PM模块的账户加载事件
+            TREvents.INPUT_ACCOUNT_LOADED: self._on_account_loaded,
+            # ST模块的交易信号事件
+            TREvents.INPUT_SIGNAL_GENERATED: self._on_signal_generated,
+            # ST模块的网格创建事件
+            TREvents.INPUT_GRID_CREATE: self._on_grid_create,
+            # DE模块的订单成交事件
+            TREvents.INPUT_ORDER_FILLED: self._on_order_filled,
+            # DE模块的订单状态更新事件
+            TREvents.INPUT_ORDER_UPDATE: self._on_order_update,
+            # DE模块的订单提交成功事件
+            TREvents.INPUT_ORDER_SUBMITTED: self._on_order_submitted,
+            # DE模块的账户余额事件
+            TREvents.INPUT_ACCOUNT_BALANCE: self._on_account_balance,
+        })
         
-        logger.info(f"[tr_manager.py:{self._get_line_number()}] 事件订阅完成")
+        logger.info("事件订阅完成")
     
     async def _on_account_loaded(self, event: Event) -> None:
         """
@@ -188,10 +232,11 @@ class TRManager:
         Args:
             event: 账户加载事件
         """
-        user_id = event.data.get("user_id")
-        strategy_config = event.data.get("strategy_config", {})
+        payload = _decode(event, AccountLoadedPayload)
+        user_id = payload.user_id
+        strategy_config = payload.strategy_config
 
-        logger.info(f"[tr_manager.py:{self._get_line_number()}] 收到账户加载事件: {user_id}")
+        logger.info("收到账户加载事件: {}", user_id)
 
         # 获取杠杆和保证金类型
         leverage = strategy_config.get("leverage", 1)
@@ -201,16 +246,19 @@ class TRManager:
         capital_manager = CapitalManager(user_id, leverage, margin_type)
         self._capital_managers[user_id] = capital_manager
 
+        # 已存在的交易任务改绑到新的资金管理器，并按新的策略配置刷新派生字段
+        for task in self._tasks.get(user_id, {}).values():
+            task.capital_manager = capital_manager
+            task.strategy_config = strategy_config
+            task.refresh_from_config()
+
         # 保存用户配置
         self._user_configs[user_id] = strategy_config
 
         # 请求账户余额
         await self._order_manager.request_account_balance(user_id, margin_type)
 
-        logger.info(
-            f"[tr_manager.py:{self._get_line_number()}] 资金管理器创建完成: "
-            f"{user_id} 杠杆={leverage}x 保证金类型={margin_type}"
-        )
+        logger.info("资金管理器创建完成: {} 杠杆={}x 保证金类型={}", user_id, leverage, margin_type)
     
     async def _on_signal_generated(self, event: Event) -> None:
         """
@@ -224,37 +272,37 @@ class TRManager:
         Args:
             event: 交易信号事件
         """
-        user_id = event.data.get("user_id")
-        symbol = event.data.get("symbol")
-        side = event.data.get("side")  # "LONG" or "SHORT"
-        action = event.data.get("action")  # "OPEN" or "CLOSE"
+        signal = _decode(event, SignalPayload)
+        user_id = signal.user_id
+        if user_id not in self._capital_managers:
+            logger.debug("忽略未加载账户的用户事件: {} {}", user_id, event.subject)
+            return
+        symbol = signal.symbol
+        side = signal.side  # "LONG" or "SHORT"
+        action = signal.action  # "OPEN" or "CLOSE"
 
-        logger.info(
-            f"[tr_manager.py:{self._get_line_number()}] 收到交易信号: "
-            f"{user_id}/{symbol} {side} {action}"
-        )
+        logger.info("收到交易信号: {}/{} {} {}", user_id, symbol, side, action)
 
         # 获取或创建交易任务
-        task_key = (user_id, symbol)
-        if task_key not in self._tasks:
+        user_tasks = self._tasks.setdefault(user_id, {})
+        task = user_tasks.get(symbol)
+        if task is None:
             strategy_config = self._user_configs.get(user_id, {})
-            task = TradingTask(user_id, symbol, strategy_config)
-            self._tasks[task_key] = task
+            task = TradingTask(user_id, symbol, strategy_config, self._capital_managers.get(user_id))
+            user_tasks[symbol] = task
 
             # 发布任务创建事件
             await self._event_bus.publish(Event(
-                subject=TREvents.TASK_CREATED,
-                data={"user_id": user_id, "symbol": symbol, "mode": task.get_trading_mode().value}
+                subject=_EVT_TASK_CREATED,
+                data={"user_id": user_id, "symbol": symbol, "mode": task.trading_mode.value}
             ))
-        else:
-            task = self._tasks[task_key]
 
         # 处理入场信号
         if action == "OPEN":
-            await self._handle_entry_signal(task, side, event.data)
+            await self._handle_entry_signal(task, side, signal)
         # 处理出场信号
         elif action == "CLOSE":
-            await self._handle_exit_signal(task, event.data)
+            await self._handle_exit_signal(task, signal)
     
     async def _on_grid_create(self, event: Event) -> None:
         """
@@ -265,80 +313,55 @@ class TRManager:
         Args:
             event: 网格创建事件
         """
-        user_id = event.data.get("user_id")
-        symbol = event.data.get("symbol")
-        upper_price = float(event.data.get("upper_price", 0))
-        lower_price = float(event.data.get("lower_price", 0))
-        grid_levels = int(event.data.get("grid_levels", 10))
-        move_up = event.data.get("move_up", False)
-        move_down = event.data.get("move_down", False)
+        grid = _decode(event, GridCreatePayload)
+        user_id = grid.user_id
+        if user_id not in self._capital_managers:
+            logger.debug("忽略未加载账户的用户事件: {} {}", user_id, event.subject)
+            return
+        symbol = grid.symbol
+        upper_price = grid.upper_price
+        lower_price = grid.lower_price
+        grid_levels = grid.grid_levels
+        move_up = grid.move_up
+        move_down = grid.move_down
 
         logger.info(
-            f"[tr_manager.py:{self._get_line_number()}] 收到网格创建请求: "
-            f"{user_id}/{symbol} 上边={upper_price} 下边={lower_price} 层数={grid_levels}"
+            "收到网格创建请求: {}/{} 上边={} 下边={} 层数={}",
+            user_id, symbol, upper_price, lower_price, grid_levels
         )
 
         # 获取交易任务
-        task_key = (user_id, symbol)
-        if task_key not in self._tasks:
-            logger.error(
-                f"[tr_manager.py:{self._get_line_number()}] "
-                f"未找到交易任务: {user_id}/{symbol}"
-            )
+        user_tasks = self._tasks.get(user_id)
+        task = user_tasks.get(symbol) if user_tasks else None
+        if task is None:
+            logger.error("未找到交易任务: {}/{}", user_id, symbol)
             return
 
-        task = self._tasks[task_key]
-
         # 设置网格配置
         task.set_grid_config(upper_price, lower_price, grid_levels, move_up, move_down)
 
-        # 获取资金管理器
-        capital_manager = self._capital_managers.get(user_id)
-        if not capital_manager:
-            logger.error(
-                f"[tr_manager.py:{self._get_line_number()}] "
-                f"未找到用户{user_id}的资金管理器"
-            )
-            return
-
-        # 计算网格仓位（使用剩余资金，即1-ratio）
-        strategy_config = self._user_configs.get(user_id, {})
-        trading_pairs = strategy_config.get("trading_pairs", [])
-        symbol_count = len(trading_pairs)
-        margin_per_symbol = capital_manager.calculate_margin_per_symbol(symbol_count)
-
         # 获取入场价格和持仓方向
-        if not task.is_position_open():
-            logger.warning(
-                f"[tr_manager.py:{self._get_line_number()}] "
-                f"持仓未开启，无法创建网格"
-            )
+        if not task.position_open:
+            logger.warning("持仓未开启，无法创建网格")
             return
 
-        entry_price = task.entry_price
-        ratio = task.get_grid_ratio()
-        grid_ratio = 1.0 - ratio  # 网格使用剩余资金
-
-        # 计算网格总数量
-        total_quantity = capital_manager.calculate_grid_position_size(
-            margin_per_symbol, entry_price, grid_levels, grid_ratio
-        )
+        # 计算网格仓位（使用剩余资金，即1-ratio）
+        grid_ratio = 1.0 - task.grid_ratio
+        total_quantity = task.capital_manager.size_entry(
+            task.symbol_count, task.entry_price, grid_ratio, grid_levels
+        ).grid_quantity
 
         # 创建网格订单
-        order_side = "SELL" if task.entry_side == "LONG" else "BUY"
+        order_side = _EXIT_ORDER_SIDE[task.entry_side]
         order_ids = await self._grid_manager.create_grid_orders(
             user_id, symbol, upper_price, lower_price, grid_levels,
             total_quantity, order_side, "POST_ONLY"
         )
 
         # 保存网格订单ID到任务
-        for order_id in order_ids:
-            task.add_grid_order(order_id)
+        task.add_grid_orders(order_ids)
 
-        logger.info(
-            f"[tr_manager.py:{self._get_line_number()}] 网格订单创建完成: "
-            f"{symbol} 订单数量={len(order_ids)}"
-        )
+        logger.info("网格订单创建完成: {} 订单数量={}", symbol, len(order_ids))
     
     async def _on_order_filled(self, event: Event) -> None:
         """
@@ -352,62 +375,56 @@ class TRManager:
         Args:
             event: 订单成交事件
         """
-        user_id = event.data.get("user_id")
-        order_id = event.data.get("order_id")
-        symbol = event.data.get("symbol")
-        price = float(event.data.get("price", 0))
-        quantity = float(event.data.get("quantity", 0))
-        side = event.data.get("side")  # "BUY" or "SELL"
+        fill = _decode(event, OrderFilledPayload)
+        user_id = fill.user_id
+        if user_id not in self._capital_managers:
+            logger.debug("忽略未加载账户的用户事件: {} {}", user_id, event.subject)
+            return
+        order_id = fill.order_id
+        symbol = fill.symbol
+        price = fill.price
+        quantity = fill.quantity
+        side = fill.side  # "BUY" or "SELL"
 
-        logger.info(
-            f"[tr_manager.py:{self._get_line_number()}] 收到订单成交事件: "
-            f"{user_id}/{symbol} {order_id} {side} {quantity}@{price}"
-        )
+        logger.info("收到订单成交事件: {}/{} {} {} {}@{}", user_id, symbol, order_id, side, quantity, price)
 
         # 获取交易任务
-        task_key = (user_id, symbol)
-        if task_key not in self._tasks:
-            logger.warning(
-                f"[tr_manager.py:{self._get_line_number()}] "
-                f"未找到交易任务: {user_id}/{symbol}"
-            )
+        user_tasks = self._tasks.get(user_id)
+        task = user_tasks.get(symbol) if user_tasks else None
+        if task is None:
+            logger.warning("未找到交易任务: {}/{}", user_id, symbol)
             return
 
-        task = self._tasks[task_key]
-
         # 更新订单状态
         task.update_order_status(order_id, "FILLED", quantity)
 
         # 判断是入场还是出场
-        if not task.is_position_open():
+        if not task.position_open:
             # 入场订单成交
             position_side = "LONG" if side == "BUY" else "SHORT"
             await task.open_position(position_side, price, quantity)
 
             # 发布持仓开启事件
             await self._event_bus.publish(Event(
-                subject=TREvents.POSITION_OPENED,
+                subject=_EVT_POS_OPENED,
                 data={
                     "user_id": user_id,
                     "symbol": symbol,
                     "side": position_side,
                     "entry_price": price,
                     "quantity": quantity,
-                    "mode": task.get_trading_mode().value
+                    "mode": task.trading_mode.value
                 }
             ))
 
-            logger.info(
-                f"[tr_manager.py:{self._get_line_number()}] 持仓开启: "
-                f"{symbol} {position_side} {quantity}@{price}"
-            )
+            logger.info("持仓开启: {} {} {}@{}", symbol, position_side, quantity, price)
         else:
             # 出场订单成交
             pnl = await task.close_position(price)
 
             # 发布持仓关闭事件
             await self._event_bus.publish(Event(
-                subject=TREvents.POSITION_CLOSED,
+                subject=_EVT_POS_CLOSED,
                 data={
                     "user_id": user_id,
                     "symbol": symbol,
@@ -417,33 +434,40 @@ class TRManager:
                 }
             ))
 
-            logger.info(
-                f"[tr_manager.py:{self._get_line_number()}] 持仓关闭: "
-                f"{symbol} 盈亏={pnl}"
-            )
+            logger.info("持仓关闭: {} 盈亏={}", symbol, pnl)
     
-    async def _on_order_update(self, event: Event) -> None:
+    @staticmethod
+    def _on_order_update(event: Event) -> None:
         """
         处理订单状态更新事件
         
+        仅记录日志，声明为同步处理器，由事件总线直接调用而不创建协程；
+        不访问实例状态，声明为静态方法，订阅时不产生绑定方法对象。
+        
         Args:
             event: 订单状态更新事件
         """
-        user_id = event.data.get("user_id")
-        order_id = event.data.get("order_id")
-        logger.debug(f"[tr_manager.py:{self._get_line_number()}] 收到订单状态更新: {user_id}/{order_id}")
+        ref = _decode(event, OrderRefPayload)
+        user_id = ref.user_id
+        order_id = ref.order_id
+        logger.debug("收到订单状态更新: {}/{}", user_id, order_id)
         # TODO: 实现订单状态更新逻辑
     
-    async def _on_order_submitted(self, event: Event) -> None:
+    @staticmethod
+    def _on_order_submitted(event: Event) -> None:
         """
         处理订单提交成功事件
         
+        仅记录日志，声明为同步处理器，由事件总线直接调用而不创建协程；
+        不访问实例状态，声明为静态方法，订阅时不产生绑定方法对象。
+        
         Args:
             event: 订单提交成功事件
         """
-        user_id = event.data.get("user_id")
-        order_id = event.data.get("order_id")
-        logger.info(f"[tr_manager.py:{self._get_line_number()}] 订单提交成功: {user_id}/{order_id}")
+        ref = _decode(event, OrderRefPayload)
+        user_id = ref.user_id
+        order_id = ref.order_id
+        logger.info("订单提交成功: {}/{}", user_id, order_id)
         # TODO: 实现订单提交成功处理逻辑
     
     async def _on_account_balance(self, event: Event) -> None:
@@ -453,23 +477,18 @@ class TRManager:
         Args:
             event: 账户余额事件
         """
-        user_id = event.data.get("user_id")
-        available_balance = float(event.data.get("available_balance", 0))
-        total_balance = float(event.data.get("balance", 0))
+        balance = _decode(event, AccountBalancePayload)
+        user_id = balance.user_id
+        if user_id not in self._capital_managers:
+            logger.debug("忽略未加载账户的用户事件: {} {}", user_id, event.subject)
+            return
+        available_balance = balance.available_balance
+        total_balance = balance.balance
 
-        logger.info(
-            f"[tr_manager.py:{self._get_line_number()}] 收到账户余额: "
-            f"{user_id} 可用={available_balance} 总额={total_balance}"
-        )
+        logger.info("收到账户余额: {} 可用={} 总额={}", user_id, available_balance, total_balance)
 
         # 更新资金管理器
-        if user_id in self._capital_managers:
-            self._capital_managers[user_id].update_balance(available_balance, total_balance)
-        else:
-            logger.warning(
-                f"[tr_manager.py:{self._get_line_number()}] "
-                f"未找到用户{user_id}的资金管理器"
-            )
+        self._capital_managers[user_id].update_balance(available_balance, total_balance)
     
     async def _publish_manager_started(self) -> None:
         """发布管理器启动完成事件"""
@@ -489,10 +508,10 @@ class TRManager:
         清理资源，发布关闭事件
         """
         if not self._is_started:
-            logger.warning(f"[tr_manager.py:{self._get_line_number()}] TRManager未启动，无需关闭")
+            logger.warning("TRManager未启动，无需关闭")
             return
         
-        logger.info(f"[tr_manager.py:{self._get_line_number()}] 正在关闭TRManager...")
+        logger.info("正在关闭TRManager...")
         
         # 发布关闭事件
         event = Event(
@@ -503,9 +522,9 @@ class TRManager:
         await self._event_bus.publish(event)
         
         self._is_started = False
-        logger.info(f"[tr_manager.py:{self._get_line_number()}] TRManager已关闭")
+        logger.info("TRManager已关闭")
     
-    async def _handle_entry_signal(self, task: TradingTask, side: str, signal_data: Dict[str, Any]) -> None:
+    async def _handle_entry_signal(self, task: TradingTask, side: str, signal_data: SignalPayload) -> None:
         """
         处理入场信号
 
@@ -519,111 +538,132 @@ class TRManager:
             side: 持仓方向（"LONG" or "SHORT"）
             signal_data: 信号数据
         """
-        user_id = task.user_id
         symbol = task.symbol
-        trading_mode = task.get_trading_mode()
-
-        logger.info(
-            f"[tr_manager.py:{self._get_line_number()}] 处理入场信号: "
-            f"{symbol} {side} 模式={trading_mode.value}"
-        )
-
-        # 获取资金管理器
-        capital_manager = self._capital_managers.get(user_id)
-        if not capital_manager:
-            logger.error(
-                f"[tr_manager.py:{self._get_line_number()}] "
-                f"未找到用户{user_id}的资金管理器"
-            )
-            return
+        trading_mode = task.trading_mode
 
-        # 计算保证金分配
-        strategy_config = self._user_configs.get(user_id, {})
-        trading_pairs = strategy_config.get("trading_pairs", [])
-        symbol_count = len(trading_pairs)
-        margin_per_symbol = capital_manager.calculate_margin_per_symbol(symbol_count)
+        logger.info("处理入场信号: {} {} 模式={}", symbol, side, trading_mode.value)
 
         # 获取入场价格（从信号数据或使用市价）
-        entry_price = signal_data.get("price")
+        entry_price = signal_data.price
         if not entry_price:
             # TODO: 从市场数据获取当前价格
-            logger.warning(
-                f"[tr_manager.py:{self._get_line_number()}] "
-                f"信号未提供价格，暂时使用占位符"
-            )
+            logger.warning("信号未提供价格，暂时使用占位符")
             entry_price = 1.0  # 占位符，实际应从市场数据获取
 
-        # 根据交易模式计算仓位
-        if trading_mode == TradingMode.NO_GRID:
-            # 无网格模式：使用全部保证金
-            quantity = capital_manager.calculate_position_size(margin_per_symbol, entry_price, 1.0)
-
-            # 提交市价单
-            order_side = "BUY" if side == "LONG" else "SELL"
-            self._order_manager.submit_market_order(user_id, symbol, order_side, quantity)
-
-            logger.info(
-                f"[tr_manager.py:{self._get_line_number()}] 提交市价单: "
-                f"{symbol} {order_side} 数量={quantity}"
-            )
-
-        elif trading_mode == TradingMode.NORMAL_GRID:
-            # 普通网格模式：直接创建网格交易
-            # 需要等待ST模块发送网格配置（st.grid.create事件）
-            logger.info(
-                f"[tr_manager.py:{self._get_line_number()}] "
-                f"普通网格模式，等待ST模块发送网格配置"
-            )
-            # 网格配置会通过 _on_grid_create 事件处理器接收
-            # 但普通网格模式不需要先建仓，所以这里需要特殊处理
-
-            # 获取网格配置（如果已经设置）
-            grid_config = task.grid_config
-            if grid_config:
-                upper_price = grid_config.get("upper_price")
-                lower_price = grid_config.get("lower_price")
-                grid_levels = grid_config.get("grid_levels", 10)
-
-                # 计算网格总数量（使用全部保证金）
-                total_quantity = capital_manager.calculate_grid_position_size(
-                    margin_per_symbol, entry_price, grid_levels, 1.0
-                )
-
-                # 创建对称网格订单（买单和卖单）
-                result = await self._grid_manager.create_symmetric_grid_orders(
-                    user_id, symbol, entry_price, upper_price, lower_price,
-                    grid_levels, total_quantity, "POST_ONLY"
-                )
-
-                # 保存网格订单ID
-                for order_id in result["buy_order_ids"] + result["sell_order_ids"]:
-                    task.add_grid_order(order_id)
-
-                logger.info(
-                    f"[tr_manager.py:{self._get_line_number()}] 普通网格订单创建完成: "
-                    f"{symbol} 买单={len(result['buy_order_ids'])} 卖单={len(result['sell_order_ids'])}"
-                )
-            else:
-                logger.warning(
-                    f"[tr_manager.py:{self._get_line_number()}] "
-                    f"普通网格模式但未收到网格配置"
-                )
-
-        elif trading_mode == TradingMode.ABNORMAL_GRID:
-            # 特殊网格模式：使用ratio比例资金建仓
-            ratio = task.get_grid_ratio()
-            quantity = capital_manager.calculate_position_size(margin_per_symbol, entry_price, ratio)
-
-            # 提交市价单
-            order_side = "BUY" if side == "LONG" else "SELL"
-            self._order_manager.submit_market_order(user_id, symbol, order_side, quantity)
-
-            logger.info(
-                f"[tr_manager.py:{self._get_line_number()}] 提交入场订单: "
-                f"{symbol} {order_side} 数量={quantity} 资金比例={ratio}"
-            )
-
-    async def _handle_exit_signal(self, task: TradingTask, signal_data: Dict[str, Any]) -> None:
+        entry_handler = self._entry_dispatch.get(trading_mode)
+        if entry_handler is None:
+            return
+
+        # 一次计算保证金分配、仓位和单格仓位（ratio在无网格/普通网格模式下为1.0）
+        grid_config = task.grid_config
+        grid_levels = grid_config.get("grid_levels", 10) if grid_config else 1
+        sizing = task.capital_manager.size_entry(task.symbol_count, entry_price, task.grid_ratio, grid_levels)
+
+        await entry_handler(task, side, entry_price, sizing)
+
+    async def _entry_no_grid(
+        self,
+        task: TradingTask,
+        side: str,
+        entry_price: float,
+        sizing: EntrySize
+    ) -> None:
+        """
+        无网格模式入场：使用全部保证金提交市价单
+
+        Args:
+            task: 交易任务
+            side: 持仓方向（"LONG" or "SHORT"）
+            entry_price: 入场价格
+            sizing: 入场仓位计算结果
+        """
+        symbol = task.symbol
+        quantity = sizing.quantity
+
+        # 提交市价单
+        order_side = _ENTRY_ORDER_SIDE[side]
+        await self._order_manager.submit_market_order(task.user_id, symbol, order_side, quantity)
+
+        logger.info("提交市价单: {} {} 数量={}", symbol, order_side, quantity)
+
+    async def _entry_normal_grid(
+        self,
+        task: TradingTask,
+        side: str,
+        entry_price: float,
+        sizing: EntrySize
+    ) -> None:
+        """
+        普通网格模式入场：直接创建对称网格订单
+
+        Args:
+            task: 交易任务
+            side: 持仓方向（"LONG" or "SHORT"）
+            entry_price: 入场价格
+            sizing: 入场仓位计算结果
+        """
+        symbol = task.symbol
+
+        # 普通网格模式：直接创建网格交易
+        # 需要等待ST模块发送网格配置（st.grid.create事件）
+        logger.info("普通网格模式，等待ST模块发送网格配置")
+        # 网格配置会通过 _on_grid_create 事件处理器接收
+        # 但普通网格模式不需要先建仓，所以这里需要特殊处理
+
+        # 获取网格配置（如果已经设置）
+        grid_config = task.grid_config
+        if not grid_config:
+            logger.warning("普通网格模式但未收到网格配置")
+            return
+
+        upper_price = grid_config.get("upper_price")
+        lower_price = grid_config.get("lower_price")
+        grid_levels = grid_config.get("grid_levels", 10)
+
+        # 网格总数量（使用全部保证金）
+        total_quantity = sizing.grid_quantity
+
+        # 创建对称网格订单（买单和卖单）
+        result = await self._grid_manager.create_symmetric_grid_orders(
+            task.user_id, symbol, entry_price, upper_price, lower_price,
+            grid_levels, total_quantity, "POST_ONLY"
+        )
+
+        # 保存网格订单ID
+        task.add_grid_orders(result["buy_order_ids"] + result["sell_order_ids"])
+
+        logger.info(
+            "普通网格订单创建完成: {} 买单={} 卖单={}",
+            symbol, len(result['buy_order_ids']), len(result['sell_order_ids'])
+        )
+
+    async def _entry_abnormal_grid(
+        self,
+        task: TradingTask,
+        side: str,
+        entry_price: float,
+        sizing: EntrySize
+    ) -> None:
+        """
+        特殊网格模式入场：使用ratio比例资金提交市价单
+
+        Args:
+            task: 交易任务
+            side: 持仓方向（"LONG" or "SHORT"）
+            entry_price: 入场价格
+            sizing: 入场仓位计算结果
+        """
+        symbol = task.symbol
+        ratio = task.grid_ratio
+        quantity = sizing.quantity
+
+        # 提交市价单
+        order_side = _ENTRY_ORDER_SIDE[side]
+        await self._order_manager.submit_market_order(task.user_id, symbol, order_side, quantity)
+
+        logger.info("提交入场订单: {} {} 数量={} 资金比例={}", symbol, order_side, quantity, ratio)
+
+    async def _handle_exit_signal(self, task: TradingTask, signal_data: SignalPayload) -> None:
         """
         处理出场信号
 
@@ -638,59 +678,29 @@ class TRManager:
         user_id = task.user_id
         symbol = task.symbol
 
-        logger.info(
-            f"[tr_manager.py:{self._get_line_number()}] 处理出场信号: {symbol}"
-        )
+        logger.info("处理出场信号: {}", symbol)
 
         # 检查是否有持仓
-        if not task.is_position_open():
-            logger.warning(
-                f"[tr_manager.py:{self._get_line_number()}] "
-                f"无持仓，忽略出场信号: {symbol}"
-            )
+        if not task.position_open:
+            logger.warning("无持仓，忽略出场信号: {}", symbol)
             return
 
         # 撤销所有网格订单
         if task.get_grid_order_count() > 0:
-            grid_order_ids = list(task.grid_orders.keys())
-            self._order_manager.cancel_all_orders(user_id, symbol, grid_order_ids)
-            logger.info(
-                f"[tr_manager.py:{self._get_line_number()}] "
-                f"撤销网格订单: {symbol} 数量={len(grid_order_ids)}"
-            )
+            grid_order_ids = task.grid_order_ids
+            await self._order_manager.cancel_all_orders(user_id, symbol, grid_order_ids)
+            logger.info("撤销网格订单: {} 数量={}", symbol, len(grid_order_ids))
 
         # 提交平仓市价单
-        position_state = task.get_position_state()
+        position_state = task.position_state
         quantity = task.entry_quantity
 
         # 平仓方向与持仓方向相反
-        if position_state == PositionState.LONG:
-            order_side = "SELL"
-        elif position_state == PositionState.SHORT:
-            order_side = "BUY"
-        else:
-            logger.error(
-                f"[tr_manager.py:{self._get_line_number()}] "
-                f"持仓状态异常: {symbol} {position_state}"
-            )
+        order_side = _POS_STATE_TO_EXIT.get(position_state)
+        if order_side is None:
+            logger.error("持仓状态异常: {} {}", symbol, position_state)
             return
 
-        self._order_manager.submit_market_order(user_id, symbol, order_side, quantity)
-
-        logger.info(
-            f"[tr_manager.py:{self._get_line_number()}] 提交平仓订单: "
-            f"{symbol} {order_side} 数量={quantity}"
-        )
-
-    @staticmethod
-    def _get_line_number() -> int:
-        """获取当前行号（用于日志）"""
-        import inspect
-        return inspect.currentframe().f_back.f_lineno
-
-    @staticmethod
-    def _get_line_number_static() -> int:
-        """获取当前行号（用于静态方法日志）"""
-        import inspect
-        return inspect.currentframe().f_back.f_lineno
+        await self._order_manager.submit_market_order(user_id, symbol, order_side, quantity)
 
+        logger.info("提交平仓订单: {} {} 数量={}", symbol, order_side, quantity)
@@ -18,12 +18,22 @@ TradingTask管理单个交易对的所有订单和状态，包括：
     await task.open_position("LONG", 1.0, 100)
 """
 
+import time
+from collections import deque
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, TYPE_CHECKING
 from datetime import datetime
 from loguru import logger
 from src.core.tr.profit_calculator import ProfitCalculator
 
+if TYPE_CHECKING:
+    from src.core.tr.capital_manager import CapitalManager
+
+
+def _to_datetime(timestamp: Optional[float]) -> Optional[datetime]:
+    """epoch秒时间戳转换为本地时间datetime（None保持为None）"""
+    return datetime.fromtimestamp(timestamp) if timestamp is not None else None
+
 
 class PositionState(Enum):
     """
@@ -70,10 +80,18 @@ class OrderInfo:
         status: 状态（NEW/FILLED/CANCELLED等）
         is_grid_order: 是否网格订单
         grid_pair_id: 网格配对ID（如果是网格订单）
-        created_at: 创建时间
-        filled_at: 成交时间
+        created_ts: 创建时间（epoch秒）
+        filled_ts: 成交时间（epoch秒）
+        created_at: 创建时间（datetime，由created_ts转换）
+        filled_at: 成交时间（datetime，由filled_ts转换）
     """
     
+    __slots__ = (
+        "order_id", "symbol", "side", "order_type", "price", "quantity",
+        "filled_quantity", "status", "is_grid_order", "grid_pair_id",
+        "created_ts", "filled_ts",
+    )
+    
     def __init__(
         self,
         order_id: str,
@@ -93,8 +111,18 @@ class OrderInfo:
         self.status = "NEW"
         self.is_grid_order = False
         self.grid_pair_id: Optional[str] = None
-        self.created_at = datetime.now()
-        self.filled_at: Optional[datetime] = None
+        self.created_ts: float = time.time()
+        self.filled_ts: Optional[float] = None
+    
+    @property
+    def created_at(self) -> datetime:
+        """创建时间"""
+        return _to_datetime(self.created_ts)
+    
+    @property
+    def filled_at(self) -> Optional[datetime]:
+        """成交时间"""
+        return _to_datetime(self.filled_ts)
 
 
 class TradingTask:
@@ -107,11 +135,23 @@ class TradingTask:
         user_id: 用户ID
         symbol: 交易对符号
         strategy_config: 策略配置
+        capital_manager: 所属用户的资金管理器（由TRManager创建任务时绑定）
+        symbol_count: 策略配置的交易对数量（用于保证金分配）
         position_state: 持仓状态
+        position_open: 是否有持仓（随开仓/平仓同步更新）
+        direction_sign: 持仓方向符号（多头1.0，空头-1.0，无持仓0.0）
         entry_price: 入场价格
         entry_quantity: 入场数量
         orders: 订单列表
-        grid_orders: 网格订单字典
+        grid_orders: 网格订单字典（value为None表示订单已提交、详情尚未登记）
+        grid_order_ids: 网格订单ID列表（与grid_orders同步维护，按添加顺序）
+        trading_mode: 交易模式（创建时由策略配置确定）
+        grid_ratio: 网格资金比例（创建时由策略配置确定）
+        total_profit: 累计已实现利润
+        realized_profits: 最近MAX_REALIZED_PROFITS笔已实现利润
+        realized_count: 累计已实现利润笔数
+        created_ts / opened_ts / closed_ts: 创建/开仓/平仓时间（epoch秒），
+            created_at / opened_at / closed_at 为对应的datetime
     
     Example:
         >>> task = TradingTask("user_001", "XRPUSDC", config)
@@ -120,11 +160,24 @@ class TradingTask:
         PositionState.LONG
     """
     
+    __slots__ = (
+        "user_id", "symbol", "strategy_config", "capital_manager", "symbol_count",
+        "position_state", "position_open", "direction_sign", "entry_price", "entry_quantity", "entry_side",
+        "orders", "_orders_by_id", "grid_orders", "grid_order_ids",
+        "grid_config", "grid_upper_price", "grid_lower_price",
+        "trading_mode", "grid_ratio", "created_ts", "opened_ts", "closed_ts",
+        "_profit_calculator", "total_profit", "realized_profits", "realized_count",
+    )
+    
+    # realized_profits 保留的最近利润笔数，长时间运行时内存有界
+    MAX_REALIZED_PROFITS = 1024
+    
     def __init__(
         self,
         user_id: str,
         symbol: str,
-        strategy_config: Dict[str, Any]
+        strategy_config: Dict[str, Any],
+        capital_manager: Optional["CapitalManager"] = None
     ):
         """
         初始化交易任务
@@ -133,20 +186,29 @@ class TradingTask:
             user_id: 用户ID
             symbol: 交易对符号
             strategy_config: 策略配置字典
+            capital_manager: 所属用户的资金管理器（可选）
         """
         self.user_id = user_id
         self.symbol = symbol
         self.strategy_config = strategy_config
 
+        # 资金分配所需的引用和常量，任务存续期间不变，创建时计算一次
+        self.capital_manager: Optional["CapitalManager"] = capital_manager
+        self.symbol_count: int = len(strategy_config.get("trading_pairs", []))
+
         # 持仓状态
         self.position_state = PositionState.NONE
+        self.position_open: bool = False
+        self.direction_sign: float = 0.0
         self.entry_price: Optional[float] = None
         self.entry_quantity: Optional[float] = None
         self.entry_side: Optional[str] = None  # "LONG" or "SHORT"
 
         # 订单管理
         self.orders: List[OrderInfo] = []
-        self.grid_orders: Dict[str, OrderInfo] = {}  # key: order_id, value: OrderInfo
+        self._orders_by_id: Dict[str, OrderInfo] = {}  # orders的order_id索引（同ID保留最早添加的订单）
+        self.grid_orders: Dict[str, Optional[OrderInfo]] = {}  # key: order_id, value: OrderInfo
+        self.grid_order_ids: List[str] = []  # 撤单时直接传递，无需从grid_orders复制
 
         # 网格配置
         self.grid_config: Optional[Dict[str, Any]] = None
@@ -155,23 +217,22 @@ class TradingTask:
 
         # 交易模式识别
         self.trading_mode = self._determine_trading_mode()
+        self.grid_ratio: float = self._determine_grid_ratio()
 
         # 时间记录
-        self.created_at = datetime.now()
-        self.opened_at: Optional[datetime] = None
-        self.closed_at: Optional[datetime] = None
+        self.created_ts: float = time.time()
+        self.opened_ts: Optional[float] = None
+        self.closed_ts: Optional[float] = None
 
         # 利润计算器
         self._profit_calculator = ProfitCalculator()
 
         # 利润统计
         self.total_profit: float = 0.0
-        self.realized_profits: List[float] = []  # 已实现利润列表
+        self.realized_profits: deque = deque(maxlen=self.MAX_REALIZED_PROFITS)  # 最近的已实现利润
+        self.realized_count: int = 0
 
-        logger.info(
-            f"[trading_task.py:{self._get_line_number()}] 交易任务创建: "
-            f"{user_id}/{symbol} 模式={self.trading_mode.value}"
-        )
+        logger.info("交易任务创建: {}/{} 模式={}", user_id, symbol, self.trading_mode.value)
     
     def get_position_state(self) -> PositionState:
         """
@@ -182,6 +243,21 @@ class TradingTask:
         """
         return self.position_state
     
+    @property
+    def created_at(self) -> datetime:
+        """创建时间"""
+        return _to_datetime(self.created_ts)
+    
+    @property
+    def opened_at(self) -> Optional[datetime]:
+        """开仓时间"""
+        return _to_datetime(self.opened_ts)
+    
+    @property
+    def closed_at(self) -> Optional[datetime]:
+        """平仓时间"""
+        return _to_datetime(self.closed_ts)
+    
     def is_position_open(self) -> bool:
         """
         判断是否有持仓
@@ -189,7 +265,7 @@ class TradingTask:
         Returns:
             bool: True表示有持仓，False表示无持仓
         """
-        return self.position_state != PositionState.NONE
+        return self.position_open
     
     async def open_position(self, side: str, entry_price: float, quantity: float) -> None:
         """
@@ -203,20 +279,19 @@ class TradingTask:
         Raises:
             ValueError: 如果已有持仓
         """
-        if self.is_position_open():
+        if self.position_open:
             raise ValueError(f"持仓已存在: {self.symbol} {self.position_state.value}")
         
         # 更新持仓状态
         self.position_state = PositionState.LONG if side == "LONG" else PositionState.SHORT
+        self.position_open = True
+        self.direction_sign = 1.0 if side == "LONG" else -1.0
         self.entry_price = entry_price
         self.entry_quantity = quantity
         self.entry_side = side
-        self.opened_at = datetime.now()
+        self.opened_ts = time.time()
         
-        logger.info(
-            f"[trading_task.py:{self._get_line_number()}] 持仓开启: {self.symbol} "
-            f"{side} 价格={entry_price} 数量={quantity}"
-        )
+        logger.info("持仓开启: {} {} 价格={} 数量={}", self.symbol, side, entry_price, quantity)
     
     async def close_position(self, exit_price: float, fee_rate: Optional[float] = None) -> float:
         """
@@ -232,31 +307,37 @@ class TradingTask:
         Raises:
             ValueError: 如果无持仓
         """
-        if not self.is_position_open():
+        if not self.position_open:
             raise ValueError(f"无持仓: {self.symbol}")
 
-        # 使用利润计算器计算盈亏（包含手续费）
-        pnl = self._profit_calculator.calculate_order_profit(
-            entry_price=self.entry_price,
-            exit_price=exit_price,
-            quantity=self.entry_quantity,
-            side=self.entry_side,
-            fee_rate=fee_rate
+        if exit_price <= 0:
+            raise ValueError(f"出场价格必须大于0: {exit_price}")
+        
+        if fee_rate is None:
+            fee_rate = ProfitCalculator.DEFAULT_FEE_RATE
+        
+        # 使用利润计算器计算盈亏（包含手续费），入场参数已在开仓时确定
+        pnl = self._profit_calculator.calculate_order_profit_fast(
+            self.entry_price,
+            exit_price,
+            self.entry_quantity,
+            self.direction_sign > 0,
+            fee_rate
         )
 
         # 记录已实现利润
         self.realized_profits.append(pnl)
+        self.realized_count += 1
         self.total_profit += pnl
 
         # 更新状态
         old_state = self.position_state
         self.position_state = PositionState.NONE
-        self.closed_at = datetime.now()
+        self.position_open = False
+        self.direction_sign = 0.0
+        self.closed_ts = time.time()
 
-        logger.info(
-            f"[trading_task.py:{self._get_line_number()}] 持仓关闭: {self.symbol} "
-            f"{old_state.value} 出场价={exit_price} 盈亏={pnl:.4f}"
-        )
+        logger.info("持仓关闭: {} {} 出场价={} 盈亏={:.4f}", self.symbol, old_state.value, exit_price, pnl)
 
         return pnl
     
@@ -268,19 +349,13 @@ class TradingTask:
             exit_price: 出场价格
         
         Returns:
-            float: 盈亏金额（未扣除手续费）
+            float: 盈亏金额（未扣除手续费，无持仓时为0）
         """
         if self.entry_price is None or self.entry_quantity is None:
             return 0.0
         
-        if self.position_state == PositionState.LONG:
-            # 多头：(出场价 - 入场价) × 数量
-            pnl = (exit_price - self.entry_price) * self.entry_quantity
-        else:
-            # 空头：(入场价 - 出场价) × 数量
-            pnl = (self.entry_price - exit_price) * self.entry_quantity
-        
-        return pnl
+        # 多头：(出场价 - 入场价) × 数量；空头：(入场价 - 出场价) × 数量
+        return (exit_price - self.entry_price) * self.entry_quantity * self.direction_sign
     
     def add_order(self, order: OrderInfo) -> None:
         """
@@ -290,7 +365,8 @@ class TradingTask:
             order: 订单信息
         """
         self.orders.append(order)
-        logger.debug(f"[trading_task.py:{self._get_line_number()}] 添加订单: {order.order_id}")
+        self._orders_by_id.setdefault(order.order_id, order)
+        logger.debug("添加订单: {}", order.order_id)
     
     def add_grid_order(self, order: OrderInfo, pair_id: Optional[str] = None) -> None:
         """
@@ -302,9 +378,28 @@ class TradingTask:
         """
         order.is_grid_order = True
         order.grid_pair_id = pair_id
+        if order.order_id not in self.grid_orders:
+            self.grid_order_ids.append(order.order_id)
         self.grid_orders[order.order_id] = order
         self.orders.append(order)
-        logger.debug(f"[trading_task.py:{self._get_line_number()}] 添加网格订单: {order.order_id}")
+        self._orders_by_id.setdefault(order.order_id, order)
+        logger.debug("添加网格订单: {}", order.order_id)
+    
+    def add_grid_orders(self, order_ids: Iterable[str]) -> None:
+        """
+        批量登记已提交的网格订单ID
+        
+        订单详情尚未回报，grid_orders中对应值为None，后续可通过add_grid_order补充。
+        已登记的ID会被跳过。
+        
+        Args:
+            order_ids: 订单ID序列
+        """
+        grid_orders = self.grid_orders
+        new_ids = [order_id for order_id in dict.fromkeys(order_ids) if order_id not in grid_orders]
+        grid_orders.update(dict.fromkeys(new_ids))
+        self.grid_order_ids.extend(new_ids)
+        logger.debug("批量添加网格订单: {} 数量={}", self.symbol, len(new_ids))
     
     def get_order(self, order_id: str) -> Optional[OrderInfo]:
         """
@@ -316,10 +411,7 @@ class TradingTask:
         Returns:
             OrderInfo: 订单信息，如果不存在返回None
         """
-        for order in self.orders:
-            if order.order_id == order_id:
-                return order
-        return None
+        return self._orders_by_id.get(order_id)
     
     def update_order_status(self, order_id: str, status: str, filled_quantity: float = 0.0) -> None:
         """
@@ -335,8 +427,8 @@ class TradingTask:
             order.status = status
             order.filled_quantity = filled_quantity
             if status == "FILLED":
-                order.filled_at = datetime.now()
-            logger.debug(f"[trading_task.py:{self._get_line_number()}] 订单状态更新: {order_id} -> {status}")
+                order.filled_ts = time.time()
+            logger.debug("订单状态更新: {} -> {}", order_id, status)
     
     def get_grid_order_count(self) -> int:
         """
@@ -350,7 +442,8 @@ class TradingTask:
     def clear_grid_orders(self) -> None:
         """清空网格订单记录"""
         self.grid_orders.clear()
-        logger.debug(f"[trading_task.py:{self._get_line_number()}] 网格订单已清空")
+        self.grid_order_ids.clear()
+        logger.debug("网格订单已清空")
 
     def _determine_trading_mode(self) -> TradingMode:
         """
@@ -379,6 +472,19 @@ class TradingTask:
         else:
             return TradingMode.ABNORMAL_GRID
 
+    def refresh_from_config(self) -> None:
+        """
+        按当前策略配置重新计算派生字段
+        
+        trading_mode、grid_ratio、symbol_count 在创建时由策略配置计算并缓存，
+        策略配置被修改后需调用此方法刷新。
+        """
+        self.symbol_count = len(self.strategy_config.get("trading_pairs", []))
+        self.trading_mode = self._determine_trading_mode()
+        self.grid_ratio = self._determine_grid_ratio()
+        
+        logger.info("交易任务配置刷新: {}/{} 模式={}", self.user_id, self.symbol, self.trading_mode.value)
+
     def get_trading_mode(self) -> TradingMode:
         """
         获取交易模式
@@ -401,6 +507,15 @@ class TradingTask:
         """
         获取网格资金比例
 
+        Returns:
+            float: 资金比例（0.0-1.0）
+        """
+        return self.grid_ratio
+
+    def _determine_grid_ratio(self) -> float:
+        """
+        根据交易模式确定网格资金比例
+
         Returns:
             float: 资金比例（0.0-1.0）
 
@@ -443,8 +558,8 @@ class TradingTask:
         self.grid_lower_price = lower_price
 
         logger.info(
-            f"[trading_task.py:{self._get_line_number()}] 网格配置设置: "
-            f"{self.symbol} 上边={upper_price} 下边={lower_price} 层数={grid_levels}"
+            "网格配置设置: {} 上边={} 下边={} 层数={}",
+            self.symbol, upper_price, lower_price, grid_levels
         )
 
     def get_total_profit(self) -> float:
@@ -460,12 +575,15 @@ class TradingTask:
         """
         获取利润统计信息
 
+        盈利单/亏损单数量和胜率按最近MAX_REALIZED_PROFITS笔利润统计，
+        total_profit 和 order_count 为累计值。
+
         Returns:
             Dict[str, Any]: 利润统计数据
         """
         stats = self._profit_calculator.calculate_total_profit(self.realized_profits)
         stats["total_profit"] = self.total_profit
-        stats["order_count"] = len(self.realized_profits)
+        stats["order_count"] = self.realized_count
 
         return stats
 
@@ -477,16 +595,7 @@ class TradingTask:
             profit: 网格订单利润
         """
         self.realized_profits.append(profit)
+        self.realized_count += 1
         self.total_profit += profit
 
-        logger.debug(
-            f"[trading_task.py:{self._get_line_number()}] 网格利润记录: "
-            f"{self.symbol} 利润={profit:.4f} 总利润={self.total_profit:.4f}"
-        )
-
-    @staticmethod
-    def _get_line_number() -> int:
-        """获取当前行号（用于日志）"""
-        import inspect
-        return inspect.currentframe().f_back.f_lineno
-
+        logger.debug("网格利润记录: {} 利润={:.4f} 总利润={:.4f}", self.symbol, profit, self.total_profit)
@@ -23,12 +23,47 @@ MA Stop (Moving Average Stop) 是一个基于移动平均线的趋势跟踪指
     IndicatorFactory.register_indicator("ma_stop_ta", MAStopIndicator)
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 from src.core.ta.base_indicator import BaseIndicator, IndicatorSignal
 from src.core.event.event_bus import EventBus
+from src.utils.jit import njit
 from src.utils.logger import logger
 
 
+# 内核返回的信号编码 -> 指标信号
+_SIGNAL_NONE = 0
+_SIGNAL_LONG = 1
+_SIGNAL_SHORT = 2
+_SIGNALS = (IndicatorSignal.NONE, IndicatorSignal.LONG, IndicatorSignal.SHORT)
+
+
+@njit("Tuple((float64, float64, float64, int64))(float64, int64, float64, float64, float64)", cache=True)
+def _ma_stop_kernel(
+    window_sum: float,
+    period: int,
+    latest_close: float,
+    stop_mul_long: float,
+    stop_mul_short: float
+) -> Tuple[float, float, float, int]:
+    """
+    MA Stop 计算内核
+
+    window_sum 为最近 period 根K线收盘价之和，stop_mul_long / stop_mul_short 为
+    1 - percent/100 和 1 + percent/100，返回 (MA, 多头止损线, 空头止损线, 信号编码)。
+    """
+    ma_value = window_sum / period
+    stop_line_long = ma_value * stop_mul_long
+    stop_line_short = ma_value * stop_mul_short
+    if latest_close > stop_line_long:
+        signal_code = _SIGNAL_LONG
+    elif latest_close < stop_line_short:
+        signal_code = _SIGNAL_SHORT
+    else:
+        signal_code = _SIGNAL_NONE
+    return ma_value, stop_line_long, stop_line_short, signal_code
+
+
 class MAStopIndicator(BaseIndicator):
     """
     MA Stop 指标实现
@@ -38,7 +73,18 @@ class MAStopIndicator(BaseIndicator):
     Attributes:
         period: MA周期
         percent: 止损百分比
+        _stop_mul_long: 多头止损线系数（1 - percent/100）
+        _stop_mul_short: 空头止损线系数（1 + percent/100）
         _min_klines_required: 所需的最小K线数量
+        _closes_buf: 最近period根已收盘K线收盘价的环形缓冲区（np.float64）
+        _n: _closes_buf 中有效收盘价数量（不超过period）
+        _write_idx: 下一根已收盘K线的写入位置（满窗口时即最早一根的位置）
+        _running_sum: 窗口内收盘价之和（逐根增量维护）
+        _last_closed_ts: 窗口中最新一根已收盘K线的时间戳
+        _last_key: 上次计算输入的最新K线标识（时间戳、是否收盘、收盘价、K线数量）
+        _last_result: 上次计算结果，输入相同时直接返回
+        _cache_hits: 结果缓存命中次数
+        _cache_misses: 结果缓存未命中次数
     
     Example:
         >>> indicator = MAStopIndicator(
@@ -82,9 +128,28 @@ class MAStopIndicator(BaseIndicator):
         self.period = params.get("period", 20)
         self.percent = params.get("percent", 2)
         
+        # 止损线系数在指标生命周期内不变，初始化时计算一次
+        self._stop_mul_long: float = 1.0 - self.percent / 100.0
+        self._stop_mul_short: float = 1.0 + self.percent / 100.0
+        
         # 设置所需的最小K线数量（至少需要period * 2根K线）
         self._min_klines_required = max(self.period * 2, 50)
         
+        # 已收盘K线收盘价的环形缓冲区，新收盘一根K线时O(1)写入并更新窗口和
+        self._closes_buf: np.ndarray = np.zeros(self.period, dtype=np.float64)
+        self._n: int = 0
+        self._write_idx: int = 0
+        self._running_sum: float = 0.0
+        self._last_closed_ts: Optional[int] = None
+        # 增量更新次数，每满period次按窗口重新求和，避免浮点误差累积
+        self._incremental_updates: int = 0
+        
+        # 单槽结果缓存：同一根K线状态重复计算时直接返回上次结果
+        self._last_key: Optional[tuple] = None
+        self._last_result: Optional[Dict[str, Any]] = None
+        self._cache_hits: int = 0
+        self._cache_misses: int = 0
+        
         logger.info(
             f"[ma_stop_indicator.py] "
             f"MA Stop指标初始化: {self._indicator_id}, "
@@ -97,14 +162,19 @@ class MAStopIndicator(BaseIndicator):
         计算MA Stop指标
         
         计算步骤：
-        1. 提取收盘价列表
-        2. 计算移动平均线（MA）
+        1. 更新已收盘K线的滑动窗口（仅新收盘一根K线时O(1)更新，否则按K线重建）
+        2. 计算移动平均线（MA），未收盘的最新K线替换窗口中最早的一根
         3. 计算止损线（MA * (1 - percent/100) 或 MA * (1 + percent/100)）
         4. 判断信号：
            - 价格 > 上止损线 → LONG
            - 价格 < 下止损线 → SHORT
            - 其他 → NONE
         
+        data 中的数值为未取整的原始浮点数，展示时再按需格式化。
+        
+        结果缓存：最新K线的时间戳、收盘状态、收盘价和K线数量均与上次相同时，
+        直接返回上次的结果字典（调用方只读使用，不应修改）。
+        
         Args:
             klines: 完整的历史K线列表
                 每根K线格式：{
@@ -131,65 +201,76 @@ class MAStopIndicator(BaseIndicator):
             }
         """
         try:
-            # 1. 提取收盘价列表
-            closes = [float(k["close"]) for k in klines]
+            period = self.period
+            kline_count = len(klines)
             
             # 检查K线数量是否足够
-            if len(closes) < self.period:
+            if kline_count < period:
                 logger.warning(
                     f"[ma_stop_indicator.py] "
-                    f"K线数量不足: {len(closes)} < {self.period}, "
+                    f"K线数量不足: {kline_count} < {period}, "
                     f"indicator_id={self._indicator_id}"
                 )
                 return {
                     "signal": IndicatorSignal.NONE.value,
                     "data": {
                         "error": "K线数量不足",
-                        "required": self.period,
-                        "actual": len(closes)
+                        "required": period,
+                        "actual": kline_count
                     }
                 }
             
-            # 2. 计算移动平均线（使用最近period根K线）
-            ma_value = sum(closes[-self.period:]) / self.period
+            latest = klines[-1]
+            timestamp = latest.get("timestamp")
+            is_closed = latest.get("is_closed", True)
+            
+            # 最新K线未变化（同一时间戳、收盘状态和收盘价）时直接返回上次结果
+            key = (timestamp, is_closed, latest["close"], kline_count)
+            if timestamp is not None and key == self._last_key:
+                self._cache_hits += 1
+                return self._last_result
+            self._cache_misses += 1
             
-            # 3. 计算止损线
-            # 多头止损线：MA * (1 - percent/100)
-            stop_line_long = ma_value * (1 - self.percent / 100)
-            # 空头止损线：MA * (1 + percent/100)
-            stop_line_short = ma_value * (1 + self.percent / 100)
+            latest_close = float(latest["close"])
             
-            # 4. 获取最新收盘价
-            latest_close = closes[-1]
+            # 1. 更新已收盘K线窗口
+            closed_count = kline_count if is_closed else kline_count - 1
+            self._update_window(klines, closed_count)
             
-            # 5. 判断信号
-            if latest_close > stop_line_long:
-                signal = IndicatorSignal.LONG
-            elif latest_close < stop_line_short:
-                signal = IndicatorSignal.SHORT
+            # 2. 最近period根K线的收盘价之和
+            if closed_count == kline_count:
+                window_sum = self._running_sum
             else:
-                signal = IndicatorSignal.NONE
+                oldest = float(self._closes_buf[self._write_idx]) if self._n == period else 0.0
+                window_sum = self._running_sum - oldest + latest_close
+            
+            # 3-5. 计算MA、止损线并判断信号
+            # 多头止损线：MA * (1 - percent/100)，空头止损线：MA * (1 + percent/100)
+            ma_value, stop_line_long, stop_line_short, signal_code = _ma_stop_kernel(
+                window_sum, period, latest_close, self._stop_mul_long, self._stop_mul_short
+            )
+            signal = _SIGNALS[signal_code]
             
             # 6. 构造返回结果
             result = {
                 "signal": signal.value,
                 "data": {
-                    "ma": round(ma_value, 6),
-                    "stop_line_long": round(stop_line_long, 6),
-                    "stop_line_short": round(stop_line_short, 6),
-                    "close": round(latest_close, 6),
+                    "ma": ma_value,
+                    "stop_line_long": stop_line_long,
+                    "stop_line_short": stop_line_short,
+                    "close": latest_close,
                     "period": self.period,
                     "percent": self.percent
                 }
             }
             
             logger.debug(
-                f"[ma_stop_indicator.py] "
-                f"MA Stop计算完成: {self._indicator_id}, "
-                f"signal={signal.value}, ma={ma_value:.6f}, "
-                f"close={latest_close:.6f}"
+                "[ma_stop_indicator.py] MA Stop计算完成: {}, signal={}, ma={:.6f}, close={:.6f}",
+                self._indicator_id, signal.value, ma_value, latest_close
             )
             
+            self._last_key = key
+            self._last_result = result
             return result
             
         except Exception as e:
@@ -204,4 +285,77 @@ class MAStopIndicator(BaseIndicator):
                     "error": str(e)
                 }
             }
-
+    
+    def ingest_closed_bar(self, close: float) -> None:
+        """
+        写入一根新收盘K线的收盘价
+        
+        窗口已满时覆盖最早的一根，并同步更新窗口和。
+        
+        Args:
+            close: 收盘价
+        """
+        buf = self._closes_buf
+        idx = self._write_idx
+        if self._n == self.period:
+            self._running_sum -= float(buf[idx])
+        else:
+            self._n += 1
+        buf[idx] = close
+        self._running_sum += close
+        idx += 1
+        self._write_idx = 0 if idx == self.period else idx
+    
+    def get_window_closes(self) -> np.ndarray:
+        """
+        获取窗口内的已收盘K线收盘价（按时间从早到晚）
+        
+        Returns:
+            收盘价数组（副本）
+        """
+        if self._n < self.period:
+            return self._closes_buf[:self._n].copy()
+        idx = self._write_idx
+        return np.concatenate((self._closes_buf[idx:], self._closes_buf[:idx]))
+    
+    def _update_window(self, klines: List[Dict[str, Any]], closed_count: int) -> None:
+        """
+        更新已收盘K线的滑动窗口和窗口和
+        
+        - 最新已收盘K线未变化：窗口不变
+        - 恰好新收盘一根K线（前一根即窗口最新K线）：写入环形缓冲区，O(1)
+        - 首次计算、K线不连续或增量更新满period次：按K线重建缓冲区
+        
+        Args:
+            klines: 完整的历史K线列表
+            closed_count: klines 中已收盘K线的数量（已收盘K线位于列表前部）
+        """
+        last_closed_ts = klines[closed_count - 1].get("timestamp") if closed_count else None
+        if last_closed_ts is not None and last_closed_ts == self._last_closed_ts:
+            return
+        
+        period = self.period
+        if (
+            last_closed_ts is not None
+            and closed_count >= 2
+            and self._last_closed_ts is not None
+            and klines[closed_count - 2].get("timestamp") == self._last_closed_ts
+            and self._incremental_updates < period
+        ):
+            self.ingest_closed_bar(float(klines[closed_count - 1]["close"]))
+            self._incremental_updates += 1
+        else:
+            start = max(closed_count - period, 0)
+            closes = np.fromiter(
+                (float(k["close"]) for k in klines[start:closed_count]),
+                dtype=np.float64,
+                count=closed_count - start
+            )
+            count = closes.shape[0]
+            self._closes_buf[:count] = closes
+            self._n = count
+            self._write_idx = 0 if count == period else count
+            self._running_sum = float(closes.sum())
+            self._incremental_updates = 0
+        
+        self._last_closed_ts = last_closed_ts
@@ -0,0 +1,40 @@
+"""
+JIT编译工具
+
+封装可选依赖 numba，供数值计算内核使用：
+- 已安装 numba 时，njit 即 numba.njit，内核被编译为本地机器码
+- 未安装 numba 时，njit 为直接返回原函数的装饰器，内核以纯Python/NumPy执行
+
+内核函数需要同时兼容两种模式：只使用 numba nopython 模式支持的
+NumPy 子集和标量运算，且必须定义在模块顶层。
+
+使用方式：
+    from src.utils.jit import njit
+
+    @njit(cache=True)
+    def kernel(prices, quantity):
+        return prices * quantity
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        numba 未安装时的占位装饰器
+
+        同时支持 @njit 和 @njit(...) 两种写法，直接返回原函数。
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ["njit", "NUMBA_AVAILABLE"]
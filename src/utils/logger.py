@@ -9,9 +9,38 @@
 
 import sys
 from pathlib import Path
+from typing import Dict, List
 from loguru import logger
 
 
+# 是否已完成日志配置（重复调用 setup_logger 时直接返回）
+_CONFIGURED = False
+# setup_logger 添加的 handler id，重新配置时只移除这些 handler
+_HANDLER_IDS: List[int] = []
+# 模块路径 -> 模块名缓存，避免每条日志都拆分模块路径
+_MODULE_NAME_CACHE: Dict[str, str] = {}
+
+# 自定义日志格式：时间 | 等级 | 模块名:行号 | 信息
+# 时间格式：YY/MM/DD HH:mm:ss
+# 等级：去除多余空格
+# 位置：简化为模块名:行号
+# 格式为静态字符串，loguru 在添加 handler 时解析一次，之后每条日志直接复用
+_CONSOLE_FORMAT = (
+    "<green>{time:YY/MM/DD HH:mm:ss}</green> | "
+    "<level>{level}</level> | "
+    "<cyan>{extra[module_name]}</cyan>:<cyan>{line}</cyan> | "
+    "<level>{message}</level>"
+)
+
+# 文件日志格式（不带颜色标签）
+_FILE_FORMAT = (
+    "{time:YY/MM/DD HH:mm:ss} | "
+    "{level} | "
+    "{extra[module_name]}:{line} | "
+    "{message}"
+)
+
+
 def add_module_name(record):
     """
     添加模块名到日志记录中
@@ -19,84 +48,88 @@ def add_module_name(record):
     从完整的模块路径中提取文件名作为模块名
     例如：src.core.event.event_bus -> event_bus
     例如：__main__ -> main
+
+    结果按模块路径缓存，同一模块的后续日志只做一次字典查找。
     """
     module_path = record["name"]
-    # 提取最后一个部分作为模块名（文件名）
-    parts = module_path.split(".")
-    module_name = parts[-1]
+    module_name = _MODULE_NAME_CACHE.get(module_path)
+    if module_name is None:
+        # 提取最后一个部分作为模块名（文件名）
+        module_name = module_path.rpartition(".")[2] or module_path
 
-    # 特殊处理：__main__ -> main
-    if module_name == "__main__":
-        module_name = "main"
+        # 特殊处理：__main__ -> main
+        if module_name == "__main__":
+            module_name = "main"
+        _MODULE_NAME_CACHE[module_path] = module_name
 
     record["extra"]["module_name"] = module_name
     return True
 
 
-def setup_logger(log_dir: str = "logs", log_file: str = "st_trading.log") -> None:
+def setup_logger(
+    log_dir: str = "logs",
+    log_file: str = "st_trading.log",
+    force: bool = False
+) -> None:
     """
     配置全局日志系统
     
+    已配置过时直接返回，避免重复导入或重复调用时重新打开日志文件、叠加 handler。
+    
     Args:
         log_dir: 日志文件目录，默认为 "logs"
         log_file: 日志文件名，默认为 "st_trading.log"
+        force: 是否强制重新配置（只移除本函数之前添加的 handler）
     
     实现细节：
-        - 移除默认的控制台输出配置
+        - 首次配置时移除默认的控制台输出配置
         - 添加控制台输出（带颜色）
-        - 添加文件输出（按时间轮转，保留3天）
+        - 添加文件输出（按时间轮转，保留3天，经队列由后台线程写入）
         - 统一日志格式：时间 | 等级 | 文件名:行号 | 信息
     """
-    # 移除默认的 logger 配置
-    logger.remove()
+    global _CONFIGURED
+    if _CONFIGURED and not force:
+        return
     
-    # 自定义日志格式：时间 | 等级 | 模块名:行号 | 信息
-    # 时间格式：YY/MM/DD HH:mm:ss
-    # 等级：去除多余空格
-    # 位置：简化为模块名:行号
-    log_format = (
-        "<green>{time:YY/MM/DD HH:mm:ss}</green> | "
-        "<level>{level}</level> | "
-        "<cyan>{extra[module_name]}</cyan>:<cyan>{line}</cyan> | "
-        "<level>{message}</level>"
-    )
-
-    # 文件日志格式（不带颜色标签）
-    file_format = (
-        "{time:YY/MM/DD HH:mm:ss} | "
-        "{level} | "
-        "{extra[module_name]}:{line} | "
-        "{message}"
-    )
+    if _HANDLER_IDS:
+        # 重新配置：只移除之前添加的 handler，保留外部添加的 sink
+        for handler_id in _HANDLER_IDS:
+            logger.remove(handler_id)
+        _HANDLER_IDS.clear()
+    else:
+        # 首次配置：移除默认的 logger 配置
+        logger.remove()
+    _CONFIGURED = True
     
     # 添加控制台输出（带颜色，方便开发调试）
-    logger.add(
+    _HANDLER_IDS.append(logger.add(
         sys.stdout,
-        format=log_format,
+        format=_CONSOLE_FORMAT,
         level="DEBUG",
         colorize=True,
         backtrace=True,  # 显示完整的堆栈跟踪
         diagnose=True,   # 显示变量值，便于调试
         filter=add_module_name  # 添加模块名过滤器
-    )
+    ))
     
     # 确保日志目录存在
     log_path = Path(log_dir)
     log_path.mkdir(parents=True, exist_ok=True)
     
     # 添加文件输出（按时间轮转，保留3天）
-    logger.add(
+    _HANDLER_IDS.append(logger.add(
         log_path / log_file,
-        format=file_format,
+        format=_FILE_FORMAT,
         level="DEBUG",
         rotation="00:00",      # 每天午夜轮转
         retention="3 days",    # 保留3天的日志
         compression="zip",     # 压缩旧日志文件
         encoding="utf-8",      # 使用 UTF-8 编码支持中文
+        enqueue=True,          # 由后台线程写文件，不阻塞事件循环
         backtrace=True,
         diagnose=True,
         filter=add_module_name  # 添加模块名过滤器
-    )
+    ))
     
     logger.info("日志系统初始化完成")
 
@@ -2,11 +2,15 @@
 ST模块集成测试
 
 测试完整的事件流程、多策略隔离、错误处理等。
+
+EventBus.publish 会等待所有处理器（包括处理器中再次发布的事件）执行完毕后才返回，
+因此发布后可以直接断言，无需额外等待。
 """
 
 import asyncio
 import pytest
-from unittest.mock import Mock, AsyncMock
+from collections import defaultdict
+from typing import DefaultDict, List
 from src.core.event.event import Event
 from src.core.event.event_bus import EventBus
 from src.core.st.st_manager import STManager
@@ -14,6 +18,74 @@ from src.core.st.base_strategy import BaseStrategy, PositionState
 from src.core.st.st_events import STEvents
 
 
+# 本模块的测试共用一个事件循环，避免每个测试重复创建和关闭事件循环
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+# 各测试共用的策略配置和事件数据，测试中只覆盖不同的字段
+_GRID_TRADING = {"enabled": True, "grid_levels": 10, "ratio": 0.5, "move_up": True, "move_down": False}
+
+_BASE_CONFIG = {
+    "timeframe": "15m",
+    "reverse": False,
+    "grid_trading": {"enabled": False},
+    "trading_pairs": [{"symbol": "XRPUSDC", "indicator_params": {}}]
+}
+
+_EVENT_DATA = {
+    "ta.calculation.completed": ("ta", {
+        "user_id": "user_001",
+        "symbol": "XRPUSDC",
+        "timeframe": "15m",
+        "indicators": {
+            "ma_stop_ta": {"signal": "LONG", "data": {}}
+        }
+    }),
+    "tr.position.opened": ("tr", {
+        "user_id": "user_001",
+        "symbol": "XRPUSDC",
+        "side": "LONG",
+        "quantity": 100,
+        "entry_price": 1.5
+    }),
+    "tr.position.closed": ("tr", {
+        "user_id": "user_001",
+        "symbol": "XRPUSDC",
+        "side": "LONG",
+        "exit_price": 1.6,
+        "pnl": 10.0
+    }),
+}
+
+
+def make_config(**overrides) -> dict:
+    """基于默认配置构造策略配置"""
+    return {**_BASE_CONFIG, **overrides}
+
+
+def make_event(subject: str, **overrides) -> Event:
+    """基于默认事件数据构造事件"""
+    source, data = _EVENT_DATA[subject]
+    return Event(subject=subject, data={**data, **overrides}, source=source)
+
+
+
+def make_recorder(event_bus: EventBus) -> DefaultDict[str, List[Event]]:
+    """
+    包装事件总线的publish方法，记录发布的事件后再交给原方法处理
+
+    Returns:
+        按事件主题分组记录的发布事件
+    """
+    published_events: DefaultDict[str, List[Event]] = defaultdict(list)
+
+    async def publish(event: Event, _events=published_events, _publish=event_bus.publish):
+        _events[event.subject].append(event)
+        await _publish(event)
+
+    event_bus.publish = publish
+    return published_events
+
 class TestStrategy(BaseStrategy):
     """测试用的具体策略实现"""
     
@@ -23,275 +95,150 @@ class TestStrategy(BaseStrategy):
         
         简单策略：如果所有指标都是LONG，则开多仓；如果所有指标都是SHORT，则开空仓。
         """
-        # 检查所有指标信号
-        signals = [ind.get("signal") for ind in indicators.values()]
+        # 检查所有指标信号（去重后只剩一种信号即为一致）
+        signals = {ind["signal"] for ind in indicators.values()}
         
         # 获取当前持仓
         current_position = self.get_position(symbol)
         
         # 所有指标都是LONG
-        if all(s == "LONG" for s in signals):
+        if signals == {"LONG"}:
             if current_position == PositionState.NONE:
                 await self._generate_signal(symbol, "LONG", "OPEN")
             elif current_position == PositionState.SHORT:
                 await self._generate_signal(symbol, "SHORT", "CLOSE")
         
         # 所有指标都是SHORT
-        elif all(s == "SHORT" for s in signals):
+        elif signals == {"SHORT"}:
             if current_position == PositionState.NONE:
                 await self._generate_signal(symbol, "SHORT", "OPEN")
             elif current_position == PositionState.LONG:
                 await self._generate_signal(symbol, "LONG", "CLOSE")
 
 
+@pytest.fixture(scope="module")
+def st_components():
+    """创建模块内共享的事件总线和策略管理器，模块结束后重置单例"""
+    STManager.reset_instance()
+    event_bus = EventBus()
+    manager = STManager.get_instance(event_bus=event_bus)
+    yield event_bus, manager
+    STManager.reset_instance()
+
+
+@pytest.fixture
+def event_bus(st_components):
+    """获取共享的事件总线，测试结束后恢复被包装的publish方法"""
+    bus = st_components[0]
+    original_publish = bus.publish
+    yield bus
+    bus.publish = original_publish
+
+
+@pytest.fixture
+def manager(st_components):
+    """获取共享的策略管理器，每个测试开始前清空已注册的策略"""
+    manager = st_components[1]
+    manager._strategies.clear()
+    return manager
+
+
 class TestSTIntegrationCompleteFlow:
     """测试完整事件流程"""
     
-    def teardown_method(self):
-        """每个测试后重置单例"""
-        STManager.reset_instance()
-    
-    @pytest.mark.asyncio
-    async def test_complete_flow_from_account_to_signal(self):
+    async def test_complete_flow_from_account_to_signal(self, event_bus, manager):
         """测试从账户加载到生成交易信号的完整流程"""
-        # 创建EventBus
-        event_bus = EventBus()
-
-        # 创建STManager
-        manager = STManager.get_instance(event_bus=event_bus)
-
         # 手动创建并注册策略实例（模拟账户加载）
-        config = {
-            "timeframe": "15m",
-            "reverse": True,
-            "grid_trading": {"enabled": True, "grid_levels": 10, "ratio": 0.5, "move_up": True, "move_down": False},
-            "trading_pairs": [{"symbol": "XRPUSDC", "indicator_params": {}}]
-        }
+        config = make_config(reverse=True, grid_trading=_GRID_TRADING)
         strategy = TestStrategy("user_001", config, event_bus)
         manager._strategies["user_001"] = strategy
 
-        # 用于收集发布的事件
-        published_events = []
-
-        # 保存原始publish方法
-        original_publish = event_bus.publish
-
-        # 包装publish方法以收集事件
-        async def wrapped_publish(event: Event):
-            published_events.append(event)
-            await original_publish(event)
-
-        event_bus.publish = wrapped_publish
+        # 记录发布的事件
+        published_events = make_recorder(event_bus)
 
         # 1. 发布指标计算完成事件
-        indicators_event = Event(
-            subject="ta.calculation.completed",
-            data={
-                "user_id": "user_001",
-                "symbol": "XRPUSDC",
-                "timeframe": "15m",
-                "indicators": {
-                    "ma_stop_ta": {"signal": "LONG", "data": {}},
-                    "rsi_ta": {"signal": "LONG", "data": {}}
-                }
-            },
-            source="ta"
+        indicators_event = make_event(
+            "ta.calculation.completed",
+            indicators={
+                "ma_stop_ta": {"signal": "LONG", "data": {}},
+                "rsi_ta": {"signal": "LONG", "data": {}}
+            }
         )
         await event_bus.publish(indicators_event)
 
-        # 等待事件处理
-        await asyncio.sleep(0.1)
-
         # 验证发布了signal.generated事件
-        signal_events = [e for e in published_events if e.subject == STEvents.SIGNAL_GENERATED]
+        signal_events = published_events[STEvents.SIGNAL_GENERATED]
         assert len(signal_events) == 1
         assert signal_events[0].data["symbol"] == "XRPUSDC"
         assert signal_events[0].data["side"] == "LONG"
         assert signal_events[0].data["action"] == "OPEN"
 
         # 2. 发布持仓开启事件
-        position_opened_event = Event(
-            subject="tr.position.opened",
-            data={
-                "user_id": "user_001",
-                "symbol": "XRPUSDC",
-                "side": "LONG",
-                "quantity": 100,
-                "entry_price": 1.5
-            },
-            source="tr"
-        )
+        position_opened_event = make_event("tr.position.opened")
         await event_bus.publish(position_opened_event)
         
-        # 等待事件处理
-        await asyncio.sleep(0.1)
-        
         # 验证持仓状态已更新
         strategy = manager._strategies.get("user_001")
         assert strategy is not None
         assert strategy.get_position("XRPUSDC") == PositionState.LONG
 
         # 3. 发布持仓关闭事件
-        position_closed_event = Event(
-            subject="tr.position.closed",
-            data={
-                "user_id": "user_001",
-                "symbol": "XRPUSDC",
-                "side": "LONG",
-                "exit_price": 1.6,
-                "pnl": 10.0
-            },
-            source="tr"
-        )
+        position_closed_event = make_event("tr.position.closed")
         await event_bus.publish(position_closed_event)
         
-        # 等待事件处理
-        await asyncio.sleep(0.1)
-        
         # 验证持仓状态已更新为NONE
         assert strategy.get_position("XRPUSDC") == PositionState.NONE
     
-    @pytest.mark.asyncio
-    async def test_grid_trading_flow(self):
-        """测试网格交易完整流程"""
-        # 创建EventBus
-        event_bus = EventBus()
-
-        # 创建STManager
-        manager = STManager.get_instance(event_bus=event_bus)
-
-        # 手动创建并注册策略实例
-        config = {
-            "timeframe": "15m",
-            "reverse": False,
-            "grid_trading": {"enabled": True, "grid_levels": 10, "ratio": 0.5, "move_up": True, "move_down": False},
-            "trading_pairs": [{"symbol": "XRPUSDC", "indicator_params": {}}]
-        }
-        strategy = TestStrategy("user_001", config, event_bus)
-        manager._strategies["user_001"] = strategy
-
-        # 用于收集发布的事件
-        published_events = []
-
-        # 保存原始publish方法
-        original_publish = event_bus.publish
-
-        # 包装publish方法以收集事件
-        async def wrapped_publish(event: Event):
-            published_events.append(event)
-            await original_publish(event)
-
-        event_bus.publish = wrapped_publish
-
-        # 1. 发布持仓开启事件（配置中启用了网格交易）
-        position_opened_event = Event(
-            subject="tr.position.opened",
-            data={
-                "user_id": "user_001",
-                "symbol": "XRPUSDC",
-                "side": "LONG",
-                "quantity": 100,
-                "entry_price": 1.5
-            },
-            source="tr"
-        )
-        await event_bus.publish(position_opened_event)
-        await asyncio.sleep(0.1)
-        
-        # 验证发布了grid.create事件
-        grid_events = [e for e in published_events if e.subject == STEvents.GRID_CREATE]
-        assert len(grid_events) == 1
-        assert grid_events[0].data["symbol"] == "XRPUSDC"
-        assert grid_events[0].data["entry_price"] == 1.5
-        assert grid_events[0].data["grid_levels"] == 10
-    
-    @pytest.mark.asyncio
-    async def test_reverse_trading_flow(self):
-        """测试反向建仓完整流程"""
-        # 创建EventBus
-        event_bus = EventBus()
-
-        # 创建STManager
-        manager = STManager.get_instance(event_bus=event_bus)
-
+    @pytest.mark.parametrize(
+        "config, event, expected_subject, expected_data",
+        [
+            # 网格交易：持仓开启后创建网格
+            (
+                make_config(grid_trading=_GRID_TRADING),
+                make_event("tr.position.opened"),
+                STEvents.GRID_CREATE,
+                {"symbol": "XRPUSDC", "entry_price": 1.5, "grid_levels": 10}
+            ),
+            # 反向建仓：持仓关闭后反向开仓
+            (
+                make_config(reverse=True),
+                make_event("tr.position.closed"),
+                STEvents.SIGNAL_GENERATED,
+                {"symbol": "XRPUSDC", "side": "SHORT", "action": "OPEN"}
+            ),
+        ],
+        ids=["grid_trading", "reverse_trading"]
+    )
+    async def test_position_event_flow(
+        self, event_bus, manager, config, event, expected_subject, expected_data
+    ):
+        """测试持仓事件触发的后续流程（网格交易、反向建仓）"""
         # 手动创建并注册策略实例
-        config = {
-            "timeframe": "15m",
-            "reverse": True,
-            "grid_trading": {"enabled": False},
-            "trading_pairs": [{"symbol": "XRPUSDC", "indicator_params": {}}]
-        }
         strategy = TestStrategy("user_001", config, event_bus)
         manager._strategies["user_001"] = strategy
 
-        # 用于收集发布的事件
-        published_events = []
-
-        # 保存原始publish方法
-        original_publish = event_bus.publish
-
-        # 包装publish方法以收集事件
-        async def wrapped_publish(event: Event):
-            published_events.append(event)
-            await original_publish(event)
+        # 记录发布的事件
+        published_events = make_recorder(event_bus)
 
-        event_bus.publish = wrapped_publish
-
-        # 1. 发布持仓关闭事件（配置中启用了反向建仓）
-        position_closed_event = Event(
-            subject="tr.position.closed",
-            data={
-                "user_id": "user_001",
-                "symbol": "XRPUSDC",
-                "side": "LONG",
-                "exit_price": 1.6,
-                "pnl": 10.0
-            },
-            source="tr"
-        )
-        await event_bus.publish(position_closed_event)
-        await asyncio.sleep(0.1)
+        # 发布持仓事件
+        await event_bus.publish(event)
         
-        # 验证发布了反向开仓信号
-        signal_events = [e for e in published_events if e.subject == STEvents.SIGNAL_GENERATED]
-        reverse_signals = [e for e in signal_events if e.data.get("side") == "SHORT" and e.data.get("action") == "OPEN"]
-        assert len(reverse_signals) == 1
-        assert reverse_signals[0].data["symbol"] == "XRPUSDC"
-
+        # 验证发布了对应的后续事件
+        follow_up_events = published_events[expected_subject]
+        assert len(follow_up_events) == 1
+        for key, value in expected_data.items():
+            assert follow_up_events[0].data[key] == value
 
 class TestSTIntegrationMultiStrategy:
     """测试多策略隔离"""
 
-    def teardown_method(self):
-        """每个测试后重置单例"""
-        STManager.reset_instance()
-
-    @pytest.mark.asyncio
-    async def test_multiple_users_isolation(self):
+    async def test_multiple_users_isolation(self, event_bus, manager):
         """测试多个用户的策略互不干扰"""
-        # 创建EventBus
-        event_bus = EventBus()
-
-        # 创建STManager
-        manager = STManager.get_instance(event_bus=event_bus)
-
         # 手动创建并注册两个用户的策略实例
-        config_1 = {
-            "timeframe": "15m",
-            "reverse": False,
-            "grid_trading": {"enabled": False},
-            "trading_pairs": [{"symbol": "XRPUSDC", "indicator_params": {}}]
-        }
-        strategy_1 = TestStrategy("user_001", config_1, event_bus)
+        strategy_1 = TestStrategy("user_001", make_config(), event_bus)
         manager._strategies["user_001"] = strategy_1
 
-        config_2 = {
-            "timeframe": "15m",
-            "reverse": False,
-            "grid_trading": {"enabled": False},
-            "trading_pairs": [{"symbol": "XRPUSDC", "indicator_params": {}}]
-        }
-        strategy_2 = TestStrategy("user_002", config_2, event_bus)
+        strategy_2 = TestStrategy("user_002", make_config(), event_bus)
         manager._strategies["user_002"] = strategy_2
 
         # 验证两个策略都已加载
@@ -299,35 +246,14 @@ class TestSTIntegrationMultiStrategy:
         assert "user_002" in manager._strategies
         assert manager._strategies["user_001"] != manager._strategies["user_002"]
 
-        # 1. user_001开多仓
-        position_opened_1 = Event(
-            subject="tr.position.opened",
-            data={
-                "user_id": "user_001",
-                "symbol": "XRPUSDC",
-                "side": "LONG",
-                "quantity": 100,
-                "entry_price": 1.5
-            },
-            source="tr"
-        )
-        await event_bus.publish(position_opened_1)
-        await asyncio.sleep(0.1)
-
-        # 2. user_002开空仓
-        position_opened_2 = Event(
-            subject="tr.position.opened",
-            data={
-                "user_id": "user_002",
-                "symbol": "XRPUSDC",
-                "side": "SHORT",
-                "quantity": 50,
-                "entry_price": 1.5
-            },
-            source="tr"
+        # 1. user_001开多仓、user_002开空仓（不同用户的事件互不依赖，并发发布）
+        position_opened_1 = make_event("tr.position.opened")
+        position_opened_2 = make_event(
+            "tr.position.opened", user_id="user_002", side="SHORT", quantity=50
         )
-        await event_bus.publish(position_opened_2)
-        await asyncio.sleep(0.1)
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(event_bus.publish(position_opened_1))
+            tg.create_task(event_bus.publish(position_opened_2))
 
         # 验证持仓状态隔离
         strategy_1 = manager._strategies["user_001"]
@@ -336,20 +262,9 @@ class TestSTIntegrationMultiStrategy:
         assert strategy_1.get_position("XRPUSDC") == PositionState.LONG
         assert strategy_2.get_position("XRPUSDC") == PositionState.SHORT
 
-        # 3. user_001平仓
-        position_closed_1 = Event(
-            subject="tr.position.closed",
-            data={
-                "user_id": "user_001",
-                "symbol": "XRPUSDC",
-                "side": "LONG",
-                "exit_price": 1.6,
-                "pnl": 10.0
-            },
-            source="tr"
-        )
+        # 2. user_001平仓
+        position_closed_1 = make_event("tr.position.closed")
         await event_bus.publish(position_closed_1)
-        await asyncio.sleep(0.1)
 
         # 验证只有user_001的持仓被更新
         assert strategy_1.get_position("XRPUSDC") == PositionState.NONE
@@ -359,73 +274,25 @@ class TestSTIntegrationMultiStrategy:
 class TestSTIntegrationErrorHandling:
     """测试错误处理"""
 
-    def teardown_method(self):
-        """每个测试后重置单例"""
-        STManager.reset_instance()
-
-    @pytest.mark.asyncio
-    async def test_handle_missing_user_id(self):
+    async def test_handle_missing_user_id(self, event_bus, manager):
         """测试处理缺失user_id的事件"""
-        # 创建EventBus
-        event_bus = EventBus()
-
-        # 创建STManager
-        manager = STManager.get_instance(event_bus=event_bus)
-
         # 发布缺失user_id的指标事件
-        indicators_event = Event(
-            subject="ta.calculation.completed",
-            data={
-                # "user_id": "user_001",  # 缺失
-                "symbol": "XRPUSDC",
-                "timeframe": "15m",
-                "indicators": {
-                    "ma_stop_ta": {"signal": "LONG", "data": {}}
-                }
-            },
-            source="ta"
-        )
+        indicators_event = make_event("ta.calculation.completed")
+        del indicators_event.data["user_id"]
 
         # 不应该抛出异常
         await event_bus.publish(indicators_event)
-        await asyncio.sleep(0.1)
 
-    @pytest.mark.asyncio
-    async def test_handle_unknown_user(self):
+    async def test_handle_unknown_user(self, event_bus, manager):
         """测试处理未知用户的事件"""
-        # 创建EventBus
-        event_bus = EventBus()
-
-        # 创建STManager
-        manager = STManager.get_instance(event_bus=event_bus)
-
         # 发布未知用户的指标事件
-        indicators_event = Event(
-            subject="ta.calculation.completed",
-            data={
-                "user_id": "unknown_user",
-                "symbol": "XRPUSDC",
-                "timeframe": "15m",
-                "indicators": {
-                    "ma_stop_ta": {"signal": "LONG", "data": {}}
-                }
-            },
-            source="ta"
-        )
+        indicators_event = make_event("ta.calculation.completed", user_id="unknown_user")
 
         # 不应该抛出异常
         await event_bus.publish(indicators_event)
-        await asyncio.sleep(0.1)
 
-    @pytest.mark.asyncio
-    async def test_handle_invalid_config(self):
+    async def test_handle_invalid_config(self, event_bus, manager):
         """测试处理无效配置文件"""
-        # 创建EventBus
-        event_bus = EventBus()
-
-        # 创建STManager
-        manager = STManager.get_instance(event_bus=event_bus)
-
         # 发布账户加载事件（配置文件不存在）
         account_event = Event(
             subject="pm.account.loaded",
@@ -438,7 +305,6 @@ class TestSTIntegrationErrorHandling:
 
         # 不应该抛出异常
         await event_bus.publish(account_event)
-        await asyncio.sleep(0.1)
 
         # 验证策略未加载
         assert "invalid_user" not in manager._strategies
@@ -9,11 +9,16 @@ TA模块集成测试
 - 指标聚合流程（多个指标 → 统一发布）
 - 多用户/多交易对隔离
 - 错误处理和恢复
+
+EventBus.publish 会等待所有处理器（包括处理器中再次发布的事件）执行完毕后才返回，
+因此发布后可以直接断言，无需额外等待。
 """
 
 import pytest
 import asyncio
-from typing import Dict, Any, List
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, Any, DefaultDict, List
 from unittest.mock import Mock, AsyncMock, patch
 from src.core.event import EventBus, Event
 from src.core.ta.ta_manager import TAManager
@@ -24,6 +29,14 @@ from src.core.ta.base_indicator import BaseIndicator, IndicatorSignal
 from src.core.ta.indicator_factory import IndicatorFactory
 
 
+# 测试共用的K线数据（只读），测试中直接引用，不再每次重新构造
+_KLINES = tuple(MappingProxyType(kline) for kline in (
+    {"open": "1.0", "high": "1.1", "low": "0.9", "close": "1.05", "volume": "1000", "timestamp": 1499040000000, "is_closed": True},
+    {"open": "1.05", "high": "1.15", "low": "0.95", "close": "1.10", "volume": "2000", "timestamp": 1499050000000, "is_closed": True},
+))
+_SINGLE_KLINE = _KLINES[:1]
+
+
 class TestIndicator(BaseIndicator):
     """测试用的指标实现"""
 
@@ -66,39 +79,44 @@ class RSIIndicator(BaseIndicator):
         }
 
 
-class TestTAIntegration:
-    """TA模块集成测试"""
-    
-    def setup_method(self):
-        """每个测试前的设置"""
-        # 重置TAManager单例
-        TAManager.reset_instance()
+@pytest.fixture(scope="module", autouse=True)
+def register_test_indicators():
+    """注册测试指标（模块内只注册一次），模块结束后清空指标注册表"""
+    IndicatorFactory.register_indicator("ma_stop_ta", MAStopIndicator)
+    IndicatorFactory.register_indicator("rsi_ta", RSIIndicator)
+    IndicatorFactory.register_indicator("test_indicator", TestIndicator)
+    yield
+    IndicatorFactory._indicator_registry.clear()
 
-        # 创建EventBus（单例，不需要重置）
-        self.event_bus = EventBus.get_instance()
 
-        # 注册测试指标
-        IndicatorFactory.register_indicator("ma_stop_ta", MAStopIndicator)
-        IndicatorFactory.register_indicator("rsi_ta", RSIIndicator)
-        IndicatorFactory.register_indicator("test_indicator", TestIndicator)
+@pytest.fixture
+def event_bus():
+    """创建独立的事件总线，之前测试的TAManager订阅不会残留到当前测试"""
+    return EventBus()
 
-        # 用于收集事件
-        self.received_events = []
 
-    def teardown_method(self):
-        """每个测试后的清理"""
-        # 只重置TAManager，EventBus是全局单例
-        TAManager.reset_instance()
+@pytest.fixture
+def ta_manager(event_bus):
+    """创建TAManager单例，测试结束后重置"""
+    TAManager.reset_instance()
+    yield TAManager.get_instance(event_bus=event_bus)
+    TAManager.reset_instance()
 
-        # 清空指标注册表
-        IndicatorFactory._indicator_registry.clear()
+
+class TestTAIntegration:
+    """TA模块集成测试"""
+    
+    @pytest.fixture(autouse=True)
+    def _init_received_events(self):
+        """每个测试使用独立的事件收集字典（按事件主题分组）"""
+        self.received_events: DefaultDict[str, List[Event]] = defaultdict(list)
     
     async def event_collector(self, event: Event):
         """事件收集器"""
-        self.received_events.append(event)
+        self.received_events[event.subject].append(event)
     
     @pytest.mark.asyncio
-    async def test_complete_indicator_subscription_flow(self):
+    async def test_complete_indicator_subscription_flow(self, event_bus, ta_manager):
         """
         测试完整的指标订阅流程
         
@@ -109,11 +127,8 @@ class TestTAIntegration:
         4. TA模块向DE模块请求历史K线（de.get_historical_klines）
         """
         # 订阅相关事件
-        self.event_bus.subscribe(TAEvents.INDICATOR_CREATED, self.event_collector)
-        self.event_bus.subscribe(DEEvents.INPUT_GET_HISTORICAL_KLINES, self.event_collector)
-        
-        # 创建TAManager
-        manager = TAManager.get_instance(event_bus=self.event_bus)
+        event_bus.subscribe(TAEvents.INDICATOR_CREATED, self.event_collector)
+        event_bus.subscribe(DEEvents.INPUT_GET_HISTORICAL_KLINES, self.event_collector)
         
         # 模拟ST模块发布指标订阅事件
         subscribe_event = Event(
@@ -128,11 +143,10 @@ class TestTAIntegration:
             source="st"
         )
         
-        await self.event_bus.publish(subscribe_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(subscribe_event)
         
         # 验证ta.indicator.created事件
-        created_events = [e for e in self.received_events if e.subject == TAEvents.INDICATOR_CREATED]
+        created_events = self.received_events[TAEvents.INDICATOR_CREATED]
         assert len(created_events) == 1, "应该发布一个指标创建事件"
         
         created_event = created_events[0]
@@ -142,7 +156,7 @@ class TestTAIntegration:
         assert created_event.data["indicator_id"] == "user_001_XRPUSDC_15m_ma_stop_ta"
         
         # 验证de.get_historical_klines事件
-        kline_request_events = [e for e in self.received_events if e.subject == DEEvents.INPUT_GET_HISTORICAL_KLINES]
+        kline_request_events = self.received_events[DEEvents.INPUT_GET_HISTORICAL_KLINES]
         assert len(kline_request_events) == 1, "应该发布一个历史K线请求事件"
         
         kline_request = kline_request_events[0]
@@ -152,7 +166,7 @@ class TestTAIntegration:
         assert kline_request.data["limit"] == 200
     
     @pytest.mark.asyncio
-    async def test_historical_klines_initialization_flow(self):
+    async def test_historical_klines_initialization_flow(self, event_bus, ta_manager):
         """
         测试历史K线初始化流程
         
@@ -162,9 +176,6 @@ class TestTAIntegration:
         3. DE模块返回历史K线（de.historical_klines.success）
         4. TA模块初始化指标
         """
-        # 创建TAManager
-        manager = TAManager.get_instance(event_bus=self.event_bus)
-        
         # 1. 模拟ST模块发布指标订阅事件
         subscribe_event = Event(
             subject=STEvents.INDICATOR_SUBSCRIBE,
@@ -178,23 +189,19 @@ class TestTAIntegration:
             source="st"
         )
         
-        await self.event_bus.publish(subscribe_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(subscribe_event)
         
         # 验证指标已创建
-        assert len(manager._indicators) == 1
+        assert len(ta_manager._indicators) == 1
         indicator_id = "user_001_XRPUSDC_15m_ma_stop_ta"
-        assert indicator_id in manager._indicators
+        assert indicator_id in ta_manager._indicators
         
         # 验证指标未就绪
-        indicator = manager._indicators[indicator_id]
+        indicator = ta_manager._indicators[indicator_id]
         assert indicator.is_ready() is False
         
         # 2. 模拟DE模块返回历史K线
-        klines = [
-            {"open": "1.0", "high": "1.1", "low": "0.9", "close": "1.05", "volume": "1000", "timestamp": 1499040000000, "is_closed": True},
-            {"open": "1.05", "high": "1.15", "low": "0.95", "close": "1.10", "volume": "2000", "timestamp": 1499050000000, "is_closed": True}
-        ]
+        klines = _KLINES
         
         historical_klines_event = Event(
             subject=DEEvents.HISTORICAL_KLINES_SUCCESS,
@@ -207,14 +214,13 @@ class TestTAIntegration:
             source="de"
         )
         
-        await self.event_bus.publish(historical_klines_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(historical_klines_event)
         
         # 验证指标已就绪
         assert indicator.is_ready() is True
     
     @pytest.mark.asyncio
-    async def test_realtime_kline_processing_and_aggregation_flow(self):
+    async def test_realtime_kline_processing_and_aggregation_flow(self, event_bus, ta_manager):
         """
         测试实时K线处理和指标聚合流程
         
@@ -226,14 +232,11 @@ class TestTAIntegration:
         5. TA模块聚合结果并发布ta.calculation.completed事件
         """
         # 订阅ta.calculation.completed事件
-        self.event_bus.subscribe(TAEvents.CALCULATION_COMPLETED, self.event_collector)
-        
-        # 创建TAManager
-        manager = TAManager.get_instance(event_bus=self.event_bus)
+        event_bus.subscribe(TAEvents.CALCULATION_COMPLETED, self.event_collector)
         
         # 1. 订阅两个指标
-        for indicator_name in ["ma_stop_ta", "rsi_ta"]:
-            subscribe_event = Event(
+        subscribe_events = [
+            Event(
                 subject=STEvents.INDICATOR_SUBSCRIBE,
                 data={
                     "user_id": "user_001",
@@ -244,18 +247,15 @@ class TestTAIntegration:
                 },
                 source="st"
             )
-            await self.event_bus.publish(subscribe_event)
-        
-        await asyncio.sleep(0.1)
+            for indicator_name in ["ma_stop_ta", "rsi_ta"]
+        ]
+        await asyncio.gather(*(event_bus.publish(event) for event in subscribe_events))
         
         # 验证两个指标已创建
-        assert len(manager._indicators) == 2
+        assert len(ta_manager._indicators) == 2
         
         # 2. 初始化指标（模拟DE返回历史K线）
-        klines = [
-            {"open": "1.0", "high": "1.1", "low": "0.9", "close": "1.05", "volume": "1000", "timestamp": 1499040000000, "is_closed": True},
-            {"open": "1.05", "high": "1.15", "low": "0.95", "close": "1.10", "volume": "2000", "timestamp": 1499050000000, "is_closed": True}
-        ]
+        klines = _KLINES
         
         historical_klines_event = Event(
             subject=DEEvents.HISTORICAL_KLINES_SUCCESS,
@@ -268,11 +268,10 @@ class TestTAIntegration:
             source="de"
         )
         
-        await self.event_bus.publish(historical_klines_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(historical_klines_event)
         
         # 验证所有指标已就绪
-        for indicator in manager._indicators.values():
+        for indicator in ta_manager._indicators.values():
             assert indicator.is_ready() is True
         
         # 清空事件列表
@@ -290,11 +289,10 @@ class TestTAIntegration:
             source="de"
         )
         
-        await self.event_bus.publish(kline_update_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(kline_update_event)
         
         # 4. 验证ta.calculation.completed事件
-        completed_events = [e for e in self.received_events if e.subject == TAEvents.CALCULATION_COMPLETED]
+        completed_events = self.received_events[TAEvents.CALCULATION_COMPLETED]
         assert len(completed_events) == 1, "应该发布一个计算完成事件"
         
         completed_event = completed_events[0]
@@ -309,7 +307,7 @@ class TestTAIntegration:
         assert "signal" in completed_event.data["indicators"]["rsi_ta"]
 
     @pytest.mark.asyncio
-    async def test_multi_user_isolation(self):
+    async def test_multi_user_isolation(self, event_bus, ta_manager):
         """
         测试多用户隔离
 
@@ -319,14 +317,11 @@ class TestTAIntegration:
         3. 每个用户独立发布ta.calculation.completed事件
         """
         # 订阅ta.calculation.completed事件
-        self.event_bus.subscribe(TAEvents.CALCULATION_COMPLETED, self.event_collector)
-
-        # 创建TAManager
-        manager = TAManager.get_instance(event_bus=self.event_bus)
+        event_bus.subscribe(TAEvents.CALCULATION_COMPLETED, self.event_collector)
 
         # 1. 两个用户订阅相同的指标
-        for user_id in ["user_001", "user_002"]:
-            subscribe_event = Event(
+        subscribe_events = [
+            Event(
                 subject=STEvents.INDICATOR_SUBSCRIBE,
                 data={
                     "user_id": user_id,
@@ -337,22 +332,20 @@ class TestTAIntegration:
                 },
                 source="st"
             )
-            await self.event_bus.publish(subscribe_event)
-
-        await asyncio.sleep(0.1)
+            for user_id in ["user_001", "user_002"]
+        ]
+        await asyncio.gather(*(event_bus.publish(event) for event in subscribe_events))
 
         # 验证两个指标已创建
-        assert len(manager._indicators) == 2
-        assert "user_001_XRPUSDC_15m_ma_stop_ta" in manager._indicators
-        assert "user_002_XRPUSDC_15m_ma_stop_ta" in manager._indicators
+        assert len(ta_manager._indicators) == 2
+        assert "user_001_XRPUSDC_15m_ma_stop_ta" in ta_manager._indicators
+        assert "user_002_XRPUSDC_15m_ma_stop_ta" in ta_manager._indicators
 
         # 2. 初始化两个用户的指标
-        klines = [
-            {"open": "1.0", "high": "1.1", "low": "0.9", "close": "1.05", "volume": "1000", "timestamp": 1499040000000, "is_closed": True}
-        ]
+        klines = _SINGLE_KLINE
 
-        for user_id in ["user_001", "user_002"]:
-            historical_klines_event = Event(
+        historical_klines_events = [
+            Event(
                 subject=DEEvents.HISTORICAL_KLINES_SUCCESS,
                 data={
                     "user_id": user_id,
@@ -362,9 +355,9 @@ class TestTAIntegration:
                 },
                 source="de"
             )
-            await self.event_bus.publish(historical_klines_event)
-
-        await asyncio.sleep(0.1)
+            for user_id in ["user_001", "user_002"]
+        ]
+        await asyncio.gather(*(event_bus.publish(event) for event in historical_klines_events))
 
         # 清空事件列表
         self.received_events.clear()
@@ -381,16 +374,15 @@ class TestTAIntegration:
             source="de"
         )
 
-        await self.event_bus.publish(kline_update_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(kline_update_event)
 
         # 4. 验证只有user_001的事件被发布
-        completed_events = [e for e in self.received_events if e.subject == TAEvents.CALCULATION_COMPLETED]
+        completed_events = self.received_events[TAEvents.CALCULATION_COMPLETED]
         assert len(completed_events) == 1, "应该只发布一个计算完成事件"
         assert completed_events[0].data["user_id"] == "user_001"
 
     @pytest.mark.asyncio
-    async def test_multi_symbol_isolation(self):
+    async def test_multi_symbol_isolation(self, event_bus, ta_manager):
         """
         测试多交易对隔离
 
@@ -399,14 +391,11 @@ class TestTAIntegration:
         2. 每个交易对独立聚合和发布事件
         """
         # 订阅ta.calculation.completed事件
-        self.event_bus.subscribe(TAEvents.CALCULATION_COMPLETED, self.event_collector)
-
-        # 创建TAManager
-        manager = TAManager.get_instance(event_bus=self.event_bus)
+        event_bus.subscribe(TAEvents.CALCULATION_COMPLETED, self.event_collector)
 
         # 1. 订阅两个交易对的指标
-        for symbol in ["XRPUSDC", "BTCUSDC"]:
-            subscribe_event = Event(
+        subscribe_events = [
+            Event(
                 subject=STEvents.INDICATOR_SUBSCRIBE,
                 data={
                     "user_id": "user_001",
@@ -417,20 +406,18 @@ class TestTAIntegration:
                 },
                 source="st"
             )
-            await self.event_bus.publish(subscribe_event)
-
-        await asyncio.sleep(0.1)
+            for symbol in ["XRPUSDC", "BTCUSDC"]
+        ]
+        await asyncio.gather(*(event_bus.publish(event) for event in subscribe_events))
 
         # 验证两个指标已创建
-        assert len(manager._indicators) == 2
+        assert len(ta_manager._indicators) == 2
 
         # 2. 初始化两个交易对的指标
-        klines = [
-            {"open": "1.0", "high": "1.1", "low": "0.9", "close": "1.05", "volume": "1000", "timestamp": 1499040000000, "is_closed": True}
-        ]
+        klines = _SINGLE_KLINE
 
-        for symbol in ["XRPUSDC", "BTCUSDC"]:
-            historical_klines_event = Event(
+        historical_klines_events = [
+            Event(
                 subject=DEEvents.HISTORICAL_KLINES_SUCCESS,
                 data={
                     "user_id": "user_001",
@@ -440,9 +427,9 @@ class TestTAIntegration:
                 },
                 source="de"
             )
-            await self.event_bus.publish(historical_klines_event)
-
-        await asyncio.sleep(0.1)
+            for symbol in ["XRPUSDC", "BTCUSDC"]
+        ]
+        await asyncio.gather(*(event_bus.publish(event) for event in historical_klines_events))
 
         # 清空事件列表
         self.received_events.clear()
@@ -459,16 +446,15 @@ class TestTAIntegration:
             source="de"
         )
 
-        await self.event_bus.publish(kline_update_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(kline_update_event)
 
         # 4. 验证只有XRPUSDC的事件被发布
-        completed_events = [e for e in self.received_events if e.subject == TAEvents.CALCULATION_COMPLETED]
+        completed_events = self.received_events[TAEvents.CALCULATION_COMPLETED]
         assert len(completed_events) == 1, "应该只发布一个计算完成事件"
         assert completed_events[0].data["symbol"] == "XRPUSDC"
 
     @pytest.mark.asyncio
-    async def test_historical_klines_failed_handling(self):
+    async def test_historical_klines_failed_handling(self, event_bus, ta_manager):
         """
         测试历史K线获取失败的处理
 
@@ -477,9 +463,6 @@ class TestTAIntegration:
         2. 指标保持未就绪状态
         3. 后续K线更新不会触发计算
         """
-        # 创建TAManager
-        manager = TAManager.get_instance(event_bus=self.event_bus)
-
         # 1. 订阅指标
         subscribe_event = Event(
             subject=STEvents.INDICATOR_SUBSCRIBE,
@@ -493,13 +476,12 @@ class TestTAIntegration:
             source="st"
         )
 
-        await self.event_bus.publish(subscribe_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(subscribe_event)
 
         # 验证指标已创建但未就绪
         indicator_id = "user_001_XRPUSDC_15m_ma_stop_ta"
-        assert indicator_id in manager._indicators
-        assert manager._indicators[indicator_id].is_ready() is False
+        assert indicator_id in ta_manager._indicators
+        assert ta_manager._indicators[indicator_id].is_ready() is False
 
         # 2. 模拟DE返回失败事件
         failed_event = Event(
@@ -513,18 +495,15 @@ class TestTAIntegration:
             source="de"
         )
 
-        await self.event_bus.publish(failed_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(failed_event)
 
         # 3. 验证指标仍未就绪
-        assert manager._indicators[indicator_id].is_ready() is False
+        assert ta_manager._indicators[indicator_id].is_ready() is False
 
         # 4. 发布K线更新，验证不会触发计算
-        self.event_bus.subscribe(TAEvents.CALCULATION_COMPLETED, self.event_collector)
+        event_bus.subscribe(TAEvents.CALCULATION_COMPLETED, self.event_collector)
 
-        klines = [
-            {"open": "1.0", "high": "1.1", "low": "0.9", "close": "1.05", "volume": "1000", "timestamp": 1499040000000, "is_closed": True}
-        ]
+        klines = _SINGLE_KLINE
 
         kline_update_event = Event(
             subject=DEEvents.KLINE_UPDATE,
@@ -537,15 +516,14 @@ class TestTAIntegration:
             source="de"
         )
 
-        await self.event_bus.publish(kline_update_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(kline_update_event)
 
         # 验证没有发布计算完成事件
-        completed_events = [e for e in self.received_events if e.subject == TAEvents.CALCULATION_COMPLETED]
+        completed_events = self.received_events[TAEvents.CALCULATION_COMPLETED]
         assert len(completed_events) == 0, "未就绪的指标不应该触发计算"
 
     @pytest.mark.asyncio
-    async def test_partial_indicator_aggregation(self):
+    async def test_partial_indicator_aggregation(self, event_bus, ta_manager):
         """
         测试部分指标就绪时的聚合行为
 
@@ -554,14 +532,11 @@ class TestTAIntegration:
         2. 只有所有指标都就绪后，才会发布聚合事件
         """
         # 订阅ta.calculation.completed事件
-        self.event_bus.subscribe(TAEvents.CALCULATION_COMPLETED, self.event_collector)
-
-        # 创建TAManager
-        manager = TAManager.get_instance(event_bus=self.event_bus)
+        event_bus.subscribe(TAEvents.CALCULATION_COMPLETED, self.event_collector)
 
         # 1. 订阅两个指标
-        for indicator_name in ["ma_stop_ta", "rsi_ta"]:
-            subscribe_event = Event(
+        subscribe_events = [
+            Event(
                 subject=STEvents.INDICATOR_SUBSCRIBE,
                 data={
                     "user_id": "user_001",
@@ -572,14 +547,12 @@ class TestTAIntegration:
                 },
                 source="st"
             )
-            await self.event_bus.publish(subscribe_event)
-
-        await asyncio.sleep(0.1)
+            for indicator_name in ["ma_stop_ta", "rsi_ta"]
+        ]
+        await asyncio.gather(*(event_bus.publish(event) for event in subscribe_events))
 
         # 2. 只初始化第一个指标
-        klines = [
-            {"open": "1.0", "high": "1.1", "low": "0.9", "close": "1.05", "volume": "1000", "timestamp": 1499040000000, "is_closed": True}
-        ]
+        klines = _SINGLE_KLINE
 
         historical_klines_event = Event(
             subject=DEEvents.HISTORICAL_KLINES_SUCCESS,
@@ -594,8 +567,8 @@ class TestTAIntegration:
 
         # 只初始化ma_stop_ta（通过修改指标ID匹配）
         # 实际上这个事件会初始化所有匹配的指标，所以我们需要手动设置状态
-        indicator_ma = manager._indicators["user_001_XRPUSDC_15m_ma_stop_ta"]
-        indicator_rsi = manager._indicators["user_001_XRPUSDC_15m_rsi_ta"]
+        indicator_ma = ta_manager._indicators["user_001_XRPUSDC_15m_ma_stop_ta"]
+        indicator_rsi = ta_manager._indicators["user_001_XRPUSDC_15m_rsi_ta"]
 
         # 手动初始化ma_stop_ta
         await indicator_ma.initialize(klines)
@@ -616,11 +589,10 @@ class TestTAIntegration:
             source="de"
         )
 
-        await self.event_bus.publish(kline_update_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(kline_update_event)
 
         # 4. 验证没有发布聚合事件（因为rsi_ta未就绪）
-        completed_events = [e for e in self.received_events if e.subject == TAEvents.CALCULATION_COMPLETED]
+        completed_events = self.received_events[TAEvents.CALCULATION_COMPLETED]
         assert len(completed_events) == 0, "部分指标未就绪时不应该发布聚合事件"
 
         # 5. 初始化第二个指标
@@ -631,17 +603,16 @@ class TestTAIntegration:
         self.received_events.clear()
 
         # 6. 再次发布K线更新
-        await self.event_bus.publish(kline_update_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(kline_update_event)
 
         # 7. 验证现在发布了聚合事件
-        completed_events = [e for e in self.received_events if e.subject == TAEvents.CALCULATION_COMPLETED]
+        completed_events = self.received_events[TAEvents.CALCULATION_COMPLETED]
         assert len(completed_events) == 1, "所有指标就绪后应该发布聚合事件"
         assert "ma_stop_ta" in completed_events[0].data["indicators"]
         assert "rsi_ta" in completed_events[0].data["indicators"]
 
     @pytest.mark.asyncio
-    async def test_multi_interval_isolation(self):
+    async def test_multi_interval_isolation(self, event_bus, ta_manager):
         """
         测试多时间周期隔离
 
@@ -650,14 +621,11 @@ class TestTAIntegration:
         2. 每个时间周期独立聚合和发布事件
         """
         # 订阅ta.calculation.completed事件
-        self.event_bus.subscribe(TAEvents.CALCULATION_COMPLETED, self.event_collector)
-
-        # 创建TAManager
-        manager = TAManager.get_instance(event_bus=self.event_bus)
+        event_bus.subscribe(TAEvents.CALCULATION_COMPLETED, self.event_collector)
 
         # 1. 订阅两个时间周期的指标
-        for interval in ["15m", "1h"]:
-            subscribe_event = Event(
+        subscribe_events = [
+            Event(
                 subject=STEvents.INDICATOR_SUBSCRIBE,
                 data={
                     "user_id": "user_001",
@@ -668,22 +636,20 @@ class TestTAIntegration:
                 },
                 source="st"
             )
-            await self.event_bus.publish(subscribe_event)
-
-        await asyncio.sleep(0.1)
+            for interval in ["15m", "1h"]
+        ]
+        await asyncio.gather(*(event_bus.publish(event) for event in subscribe_events))
 
         # 验证两个指标已创建
-        assert len(manager._indicators) == 2
-        assert "user_001_XRPUSDC_15m_ma_stop_ta" in manager._indicators
-        assert "user_001_XRPUSDC_1h_ma_stop_ta" in manager._indicators
+        assert len(ta_manager._indicators) == 2
+        assert "user_001_XRPUSDC_15m_ma_stop_ta" in ta_manager._indicators
+        assert "user_001_XRPUSDC_1h_ma_stop_ta" in ta_manager._indicators
 
         # 2. 初始化两个时间周期的指标
-        klines = [
-            {"open": "1.0", "high": "1.1", "low": "0.9", "close": "1.05", "volume": "1000", "timestamp": 1499040000000, "is_closed": True}
-        ]
+        klines = _SINGLE_KLINE
 
-        for interval in ["15m", "1h"]:
-            historical_klines_event = Event(
+        historical_klines_events = [
+            Event(
                 subject=DEEvents.HISTORICAL_KLINES_SUCCESS,
                 data={
                     "user_id": "user_001",
@@ -693,9 +659,9 @@ class TestTAIntegration:
                 },
                 source="de"
             )
-            await self.event_bus.publish(historical_klines_event)
-
-        await asyncio.sleep(0.1)
+            for interval in ["15m", "1h"]
+        ]
+        await asyncio.gather(*(event_bus.publish(event) for event in historical_klines_events))
 
         # 清空事件列表
         self.received_events.clear()
@@ -712,11 +678,10 @@ class TestTAIntegration:
             source="de"
         )
 
-        await self.event_bus.publish(kline_update_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(kline_update_event)
 
         # 4. 验证只有15m的事件被发布
-        completed_events = [e for e in self.received_events if e.subject == TAEvents.CALCULATION_COMPLETED]
+        completed_events = self.received_events[TAEvents.CALCULATION_COMPLETED]
         assert len(completed_events) == 1, "应该只发布一个计算完成事件"
         assert completed_events[0].data["timeframe"] == "15m"
 
@@ -735,11 +700,10 @@ class TestTAIntegration:
             source="de"
         )
 
-        await self.event_bus.publish(kline_update_event)
-        await asyncio.sleep(0.1)
+        await event_bus.publish(kline_update_event)
 
         # 6. 验证只有1h的事件被发布
-        completed_events = [e for e in self.received_events if e.subject == TAEvents.CALCULATION_COMPLETED]
+        completed_events = self.received_events[TAEvents.CALCULATION_COMPLETED]
         assert len(completed_events) == 1, "应该只发布一个计算完成事件"
         assert completed_events[0].data["timeframe"] == "1h"
 
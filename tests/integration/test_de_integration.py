@@ -234,7 +234,7 @@ class TestDEIntegration:
             assert balance_event.subject == DEEvents.ACCOUNT_BALANCE
             assert balance_event.data["user_id"] == "user_001"
             assert balance_event.data["asset"] == "USDT"
-            assert balance_event.data["available_balance"] == "9500.00000000"
+            assert balance_event.data["available_balance"] == 9500.0
     
     @pytest.mark.asyncio
     async def test_order_execution_error_handling(self):
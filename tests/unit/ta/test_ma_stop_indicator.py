@@ -0,0 +1,174 @@
+"""
+MAStopIndicator单元测试
+
+测试MA Stop指标的计算结果，包括：
+- MA与止损线计算
+- 信号判断
+- K线数量不足
+- 滑动窗口增量更新
+- 计算内核
+"""
+
+import pytest
+from unittest.mock import Mock
+from src.indicators.ma_stop_indicator import MAStopIndicator, _ma_stop_kernel
+from src.core.ta.base_indicator import IndicatorSignal
+
+
+def make_klines(closes):
+    """根据收盘价列表构造K线数据"""
+    return [
+        {
+            "open": str(close),
+            "high": str(close),
+            "low": str(close),
+            "close": str(close),
+            "volume": "1000",
+            "timestamp": 1499040000000 + i * 900000,
+            "is_closed": True
+        }
+        for i, close in enumerate(closes)
+    ]
+
+
+def make_indicator(period=3, percent=2):
+    """创建MA Stop指标实例"""
+    return MAStopIndicator(
+        user_id="user_001",
+        symbol="XRPUSDC",
+        interval="15m",
+        indicator_name="ma_stop_ta",
+        params={"period": period, "percent": percent},
+        event_bus=Mock()
+    )
+
+
+class TestMAStopCalculation:
+    """测试MA Stop指标计算"""
+
+    @pytest.mark.asyncio
+    async def test_ma_uses_last_period_closes(self):
+        """测试MA只使用最近period根K线的收盘价"""
+        indicator = make_indicator(period=3, percent=2)
+        result = await indicator.calculate(make_klines([100.0, 1.0, 2.0, 3.0]))
+
+        data = result["data"]
+        assert data["ma"] == 2.0
+        assert data["stop_line_long"] == 1.96
+        assert data["stop_line_short"] == 2.04
+        assert data["close"] == 3.0
+        assert data["period"] == 3
+        assert data["percent"] == 2
+
+    @pytest.mark.asyncio
+    async def test_signal_long_and_short(self):
+        """测试收盘价高于多头止损线为LONG，否则为SHORT"""
+        indicator = make_indicator(period=3, percent=2)
+
+        result = await indicator.calculate(make_klines([1.0, 1.0, 1.1]))
+        assert result["signal"] == IndicatorSignal.LONG.value
+
+        result = await indicator.calculate(make_klines([1.0, 1.0, 0.5]))
+        assert result["signal"] == IndicatorSignal.SHORT.value
+
+    @pytest.mark.asyncio
+    async def test_insufficient_klines(self):
+        """测试K线数量不足时返回NONE信号"""
+        indicator = make_indicator(period=5)
+        result = await indicator.calculate(make_klines([1.0, 1.1]))
+
+        assert result["signal"] == IndicatorSignal.NONE.value
+        assert result["data"]["required"] == 5
+        assert result["data"]["actual"] == 2
+
+
+class TestMAStopIncrementalWindow:
+    """测试已收盘K线滑动窗口的增量更新"""
+
+    @pytest.mark.asyncio
+    async def test_new_closed_kline_updates_window(self):
+        """测试新收盘一根K线时窗口增量更新，结果与完整计算一致"""
+        indicator = make_indicator(period=3)
+        klines = make_klines([1.0, 2.0, 3.0, 4.0])
+        await indicator.calculate(klines)
+
+        klines = klines + make_klines([1.0, 2.0, 3.0, 4.0, 8.0])[4:]
+        result = await indicator.calculate(klines)
+
+        assert indicator.get_window_closes().tolist() == [3.0, 4.0, 8.0]
+        assert indicator._incremental_updates == 1
+        assert result["data"]["ma"] == 5.0
+
+    @pytest.mark.asyncio
+    async def test_open_kline_replaces_oldest_close(self):
+        """测试未收盘K线参与MA计算但不进入窗口"""
+        indicator = make_indicator(period=3)
+        klines = make_klines([1.0, 2.0, 3.0, 9.0])
+        klines[-1]["is_closed"] = False
+
+        result = await indicator.calculate(klines)
+
+        assert indicator.get_window_closes().tolist() == [1.0, 2.0, 3.0]
+        assert result["data"]["ma"] == pytest.approx((2.0 + 3.0 + 9.0) / 3)
+        assert result["data"]["close"] == 9.0
+
+    def test_ingest_closed_bar_wraps_around(self):
+        """测试环形缓冲区写满后覆盖最早的收盘价"""
+        indicator = make_indicator(period=3)
+        for close in [1.0, 2.0, 3.0, 4.0, 5.0]:
+            indicator.ingest_closed_bar(close)
+
+        assert indicator.get_window_closes().tolist() == [3.0, 4.0, 5.0]
+        assert indicator._running_sum == 12.0
+
+
+class TestMAStopKernel:
+    """测试MA Stop计算内核"""
+
+    def test_kernel_returns_ma_stop_lines_and_signal(self):
+        """测试内核返回MA、止损线和信号编码"""
+        ma_value, stop_line_long, stop_line_short, signal_code = _ma_stop_kernel(6.0, 3, 3.0, 0.98, 1.02)
+
+        assert ma_value == 2.0
+        assert abs(stop_line_long - 1.96) < 1e-12
+        assert abs(stop_line_short - 2.04) < 1e-12
+        assert signal_code == 1
+
+    def test_stop_multipliers_precomputed(self):
+        """测试止损线系数在初始化时由percent计算"""
+        indicator = make_indicator(period=3, percent=2)
+
+        assert indicator._stop_mul_long == 0.98
+        assert indicator._stop_mul_short == 1.02
+
+
+class TestMAStopResultCache:
+    """测试单槽结果缓存"""
+
+    @pytest.mark.asyncio
+    async def test_same_latest_kline_returns_cached_result(self):
+        """测试最新K线未变化时直接返回上次结果"""
+        indicator = make_indicator(period=3)
+        klines = make_klines([1.0, 2.0, 3.0])
+
+        result1 = await indicator.calculate(klines)
+        result2 = await indicator.calculate(make_klines([1.0, 2.0, 3.0]))
+
+        assert result2 is result1
+        assert indicator._cache_hits == 1
+        assert indicator._cache_misses == 1
+
+    @pytest.mark.asyncio
+    async def test_open_kline_price_change_recalculates(self):
+        """测试未收盘K线价格变化时重新计算"""
+        indicator = make_indicator(period=3)
+        klines = make_klines([1.0, 2.0, 3.0])
+        klines[-1]["is_closed"] = False
+        result1 = await indicator.calculate(klines)
+
+        klines[-1]["close"] = "6.0"
+        result2 = await indicator.calculate(klines)
+
+        assert result2 is not result1
+        assert result2["data"]["ma"] == 3.0
+        assert indicator._cache_hits == 0
@@ -602,7 +602,7 @@ class TestDEManagerAccountBalanceEvents:
                 assert published_event.subject == DEEvents.ACCOUNT_BALANCE
                 assert published_event.data["user_id"] == "user_001"
                 assert published_event.data["asset"] == "USDT"
-                assert published_event.data["available_balance"] == "9500.00000000"
+                assert published_event.data["available_balance"] == 9500.0
 
     @pytest.mark.asyncio
     async def test_on_get_account_balance_client_not_found(self):
@@ -236,6 +236,22 @@ class TestEventEnhancedMethods:
         # 时间戳可能有微小差异，只比较到秒
         assert restored.timestamp.replace(microsecond=0) == original.timestamp.replace(microsecond=0), "timestamp 应该基本一致"
 
+    def test_typed_data_not_serialized(self):
+        """测试 typed_data 不参与序列化和比较"""
+        event = Event(subject="order.created", data={"order_id": "12345"})
+        assert event.typed_data is None
+
+        event.typed_data = object()
+        assert "typed_data" not in event.to_dict()
+        assert Event.from_dict(event.to_dict()).typed_data is None
+
+    def test_event_uses_slots(self):
+        """测试 Event 使用 __slots__，实例不分配 __dict__"""
+        event = Event(subject="order.created", data={})
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.extra = 1
+
     def test_validate_valid_event(self):
         """测试 validate 方法对有效事件返回 True"""
         event = Event(
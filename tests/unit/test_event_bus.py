@@ -95,6 +95,22 @@ class TestEventBusSubscription:
         assert handler1 in bus._subscribers["test.event"], "应该包含 handler1"
         assert handler2 in bus._subscribers["test.event"], "应该包含 handler2"
     
+    def test_subscribe_many(self):
+        """测试批量订阅事件"""
+        bus = EventBus.get_instance()
+        
+        def handler1(event):
+            pass
+        
+        async def handler2(event):
+            pass
+        
+        bus.subscribe_many({"event1": handler1, "event2": handler2})
+        
+        assert bus._subscribers["event1"] == [handler1]
+        assert bus._subscribers["event2"] == [handler2]
+        assert bus._handler_is_async[handler2] is True
+    
     def test_subscribe_to_different_events(self):
         """测试订阅不同的事件"""
         bus = EventBus.get_instance()
@@ -137,6 +153,24 @@ class TestEventBusPublish:
         assert len(received_events) == 1, "应该收到一个事件"
         assert received_events[0].subject == "test.event", "应该是正确的事件"
     
+    @pytest.mark.asyncio
+    async def test_publish_to_sync_subscriber(self):
+        """测试同步处理器被直接调用"""
+        bus = EventBus.get_instance()
+
+        received = []
+
+        def handler(event):
+            received.append(event)
+
+        bus.subscribe("test.event", handler)
+        assert bus._handler_is_async[handler] is False
+
+        event = Event(subject="test.event", data={})
+        await bus.publish(event)
+
+        assert received == [event], "同步处理器应该收到事件"
+
     @pytest.mark.asyncio
     async def test_publish_to_multiple_subscribers(self):
         """测试发布到多个订阅者"""
@@ -348,6 +382,26 @@ class TestEventBusErrorIsolation:
         # 即使 failing_handler 失败，normal_handler 也应该执行
         assert len(received) == 1, "正常处理器应该执行"
 
+    @pytest.mark.asyncio
+    async def test_sync_handler_exception_isolated(self):
+        """测试同步处理器异常不影响其他处理器"""
+        bus = EventBus.get_instance()
+
+        received = []
+
+        def failing_handler(event):
+            raise ValueError("Handler failed")
+
+        async def normal_handler(event):
+            received.append(event)
+
+        bus.subscribe("test.event", failing_handler)
+        bus.subscribe("test.event", normal_handler)
+
+        await bus.publish(Event(subject="test.event", data={}))
+
+        assert len(received) == 1, "正常处理器应该执行"
+
     @pytest.mark.asyncio
     async def test_handler_exception_is_logged(self, caplog):
         """测试处理器异常被记录到日志"""
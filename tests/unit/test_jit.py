@@ -0,0 +1,42 @@
+"""
+JIT 装饰器单元测试
+
+测试 src.utils.jit.njit 在有无 Numba 时的行为，包括：
+- 无参数装饰
+- 带参数装饰
+- 预编译签名装饰
+"""
+
+from src.utils.jit import njit, NUMBA_AVAILABLE
+
+
+class TestNjit:
+    """njit 装饰器测试类"""
+
+    def test_bare_decorator(self):
+        """测试 @njit 直接装饰"""
+        @njit
+        def add(a, b):
+            return a + b
+
+        assert add(1.0, 2.0) == 3.0
+
+    def test_decorator_with_options(self):
+        """测试 @njit(cache=...) 带参数装饰"""
+        @njit(fastmath=True)
+        def mul(a, b):
+            return a * b
+
+        assert mul(2.0, 3.0) == 6.0
+
+    def test_decorator_with_signature(self):
+        """测试 @njit("签名") 预编译写法"""
+        @njit("float64(float64, float64)", cache=True)
+        def sub(a, b):
+            return a - b
+
+        assert sub(3.0, 1.0) == 2.0
+
+    def test_numba_flag_is_bool(self):
+        """测试 NUMBA_AVAILABLE 标志类型"""
+        assert isinstance(NUMBA_AVAILABLE, bool)
@@ -5,12 +5,13 @@
 - 日志文件创建
 - 日志格式验证
 - 日志级别测试
+- 重复配置保护
 """
 
 import pytest
 from pathlib import Path
 import time
-from src.utils.logger import get_logger, setup_logger
+from src.utils.logger import get_logger, setup_logger, add_module_name
 
 
 class TestLogger:
@@ -28,7 +29,7 @@ class TestLogger:
         test_log_file = "test.log"
         
         # 重新配置 logger 使用测试目录
-        setup_logger(log_dir=str(test_log_dir), log_file=test_log_file)
+        setup_logger(log_dir=str(test_log_dir), log_file=test_log_file, force=True)
         logger = get_logger()
         
         # 写入测试日志
@@ -46,7 +47,7 @@ class TestLogger:
         test_log_dir = tmp_path / "test_logs_levels"
         test_log_file = "test_levels.log"
         
-        setup_logger(log_dir=str(test_log_dir), log_file=test_log_file)
+        setup_logger(log_dir=str(test_log_dir), log_file=test_log_file, force=True)
         logger = get_logger()
         
         # 测试不同级别的日志
@@ -75,7 +76,7 @@ class TestLogger:
         test_log_dir = tmp_path / "test_logs_format"
         test_log_file = "test_format.log"
 
-        setup_logger(log_dir=str(test_log_dir), log_file=test_log_file)
+        setup_logger(log_dir=str(test_log_dir), log_file=test_log_file, force=True)
         logger = get_logger()
 
         test_message = "测试日志格式"
@@ -107,7 +108,7 @@ class TestLogger:
         test_log_dir = tmp_path / "test_logs_chinese"
         test_log_file = "test_chinese.log"
         
-        setup_logger(log_dir=str(test_log_dir), log_file=test_log_file)
+        setup_logger(log_dir=str(test_log_dir), log_file=test_log_file, force=True)
         logger = get_logger()
         
         chinese_message = "这是一条中文日志消息：订单已创建"
@@ -123,3 +124,34 @@ class TestLogger:
         # 验证中文内容正确写入
         assert chinese_message in log_content, "日志应正确支持中文"
 
+    
+    def test_setup_logger_is_idempotent(self, tmp_path):
+        """测试已配置时重复调用不重新配置，force=True 时只替换自身添加的 handler"""
+        logger = get_logger()
+        extra_messages = []
+        extra_id = logger.add(extra_messages.append, level="INFO")
+        
+        try:
+            test_log_dir = tmp_path / "test_logs_idempotent"
+            setup_logger(log_dir=str(test_log_dir), log_file="test.log")
+            assert not test_log_dir.exists(), "已配置时不应重新创建日志文件"
+            
+            setup_logger(log_dir=str(test_log_dir), log_file="test.log", force=True)
+            logger.info("重新配置后的日志")
+            time.sleep(0.1)
+            
+            assert (test_log_dir / "test.log").exists()
+            assert any("重新配置后的日志" in message for message in extra_messages), \
+                "外部添加的 sink 不应被移除"
+        finally:
+            logger.remove(extra_id)
+    
+    def test_add_module_name(self):
+        """测试从模块路径提取模块名"""
+        record = {"name": "src.core.event.event_bus", "extra": {}}
+        assert add_module_name(record) is True
+        assert record["extra"]["module_name"] == "event_bus"
+        
+        record = {"name": "__main__", "extra": {}}
+        add_module_name(record)
+        assert record["extra"]["module_name"] == "main"
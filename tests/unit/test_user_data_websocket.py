@@ -373,6 +373,8 @@ class TestUserDataWebSocketOrderUpdate:
         assert published_event.data["user_id"] == "user_001"
         assert published_event.data["order_id"] == 12345678
         assert published_event.data["symbol"] == "BTCUSDT"
+        assert published_event.data["price"] == 50000.0
+        assert published_event.data["quantity"] == 0.001
 
 
 class TestUserDataWebSocketAccountUpdate:
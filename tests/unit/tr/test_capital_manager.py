@@ -104,6 +104,17 @@ class TestMarginCalculation:
         
         with pytest.raises(ValueError, match="交易对数量必须大于0"):
             capital_manager.calculate_margin_per_symbol(-1)
+    
+    def test_margin_cache_invalidated_by_balance_update(self):
+        """测试余额更新后保证金缓存失效"""
+        capital_manager = CapitalManager("user_001", 4, "USDC")
+        capital_manager.update_balance(10000.0)
+        
+        assert abs(capital_manager.calculate_margin_per_symbol(5) - 1900.0) < 0.01
+        assert abs(capital_manager.calculate_margin_per_symbol(2) - 4750.0) < 0.01
+        
+        capital_manager.update_balance(20000.0)
+        assert abs(capital_manager.calculate_margin_per_symbol(2) - 9500.0) < 0.01
 
 
 class TestPositionSizeCalculation:
@@ -164,6 +175,19 @@ class TestPositionSizeCalculation:
             capital_manager.calculate_position_size(2000.0, 1.0, 1.5)
 
 
+class TestPositionSizeCache:
+    """测试仓位计算缓存"""
+    
+    def test_position_size_cache_keyed_by_leverage(self):
+        """测试不同杠杆的用户不会共用缓存结果"""
+        manager_4x = CapitalManager("user_001", 4, "USDC")
+        manager_2x = CapitalManager("user_002", 2, "USDC")
+        
+        assert manager_4x.calculate_position_size(2000.0, 1.0, 1.0) == 8000.0
+        assert manager_2x.calculate_position_size(2000.0, 1.0, 1.0) == 4000.0
+        assert manager_4x.calculate_position_size(2000.0, 1.0, 1.0) == 8000.0
+
+
 class TestGridPositionSizeCalculation:
     """测试网格仓位大小计算"""
     
@@ -194,3 +218,32 @@ class TestGridPositionSizeCalculation:
         with pytest.raises(ValueError, match="网格层数必须大于0"):
             capital_manager.calculate_grid_position_size(2000.0, 1.0, 0, 1.0)
 
+
+
+class TestSizeEntry:
+    """测试入场仓位一次性计算"""
+    
+    def test_size_entry_matches_separate_calculations(self):
+        """测试size_entry与分步计算结果一致"""
+        capital_manager = CapitalManager("user_001", 4, "USDC")
+        capital_manager.update_balance(10000.0)
+        
+        sizing = capital_manager.size_entry(5, 2.0, 0.5, 10)
+        margin = capital_manager.calculate_margin_per_symbol(5)
+        
+        assert sizing.margin_per_symbol == margin
+        assert sizing.quantity == capital_manager.calculate_position_size(margin, 2.0, 0.5)
+        assert sizing.grid_quantity == capital_manager.calculate_grid_position_size(margin, 2.0, 10, 0.5)
+    
+    def test_size_entry_invalid_params(self):
+        """测试size_entry参数无效时抛出异常"""
+        capital_manager = CapitalManager("user_001", 4, "USDC")
+        
+        with pytest.raises(ValueError, match="账户余额未初始化"):
+            capital_manager.size_entry(5, 1.0)
+        
+        capital_manager.update_balance(10000.0)
+        with pytest.raises(ValueError, match="资金比例"):
+            capital_manager.size_entry(5, 1.0, 0.0)
+        with pytest.raises(ValueError, match="网格层数必须大于0"):
+            capital_manager.size_entry(5, 1.0, 1.0, 0)
@@ -72,6 +72,33 @@ class TestGridPricesCalculation:
         for i in range(len(prices) - 1):
             interval = prices[i + 1] - prices[i]
             assert abs(interval - 0.01) < 0.0001
+    
+    def test_calculate_grid_prices_exact_endpoints(self):
+        """测试网格首尾价格与上下边价格完全一致"""
+        calculator = GridCalculator()
+        prices = calculator.calculate_grid_prices(0.0657, 0.01, 7)
+        
+        # 累加式 0.01 + 7 * ((0.0657 - 0.01) / 7) 会得到 0.06569999999999998
+        assert prices[0] == 0.01
+        assert prices[-1] == 0.0657
+        assert all(prices[i] < prices[i + 1] for i in range(len(prices) - 1))
+    
+    def test_calculate_grid_prices_cached(self):
+        """测试相同参数的网格价格计算结果被缓存"""
+        calculator = GridCalculator()
+        prices1 = calculator.calculate_grid_prices(1.05, 0.95, 10)
+        prices2 = GridCalculator().calculate_grid_prices(1.05, 0.95, 10)
+        
+        assert isinstance(prices1, tuple)
+        assert prices1 is prices2
+    
+    def test_calculate_grid_prices_invalid_params(self):
+        """测试无效参数不会被缓存"""
+        calculator = GridCalculator()
+        with pytest.raises(ValueError):
+            calculator.calculate_grid_prices(0.95, 1.05, 10)
+        with pytest.raises(ValueError):
+            calculator.calculate_grid_prices(1.05, 0.95, 0)
 
 
 class TestGridOrdersCalculation:
@@ -155,6 +182,15 @@ class TestSymmetricGridOrders:
         for order in orders["buy_orders"] + orders["sell_orders"]:
             assert abs(order.quantity - expected_quantity) < 0.0001
     
+    def test_symmetric_grid_orders_entry_on_grid_level(self):
+        """测试入场价格恰好落在网格价格上时该层不挂单"""
+        calculator = GridCalculator()
+        orders = calculator.calculate_symmetric_grid_orders(1.0, 2.0, 0.0, 4, 100.0)
+
+        assert [o.price for o in orders["buy_orders"]] == [0.0, 0.5]
+        assert [o.price for o in orders["sell_orders"]] == [1.5, 2.0]
+        assert orders["buy_orders"][0].quantity == 25.0
+
     def test_symmetric_grid_orders_invalid_entry_price(self):
         """测试无效入场价格（不在网格范围内）"""
         calculator = GridCalculator()
@@ -6,7 +6,7 @@
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from src.core.tr.grid_manager import GridManager, GridPair
+from src.core.tr.grid_manager import GridManager, GridPair, warm_up_kernels
 from src.core.event.event_bus import EventBus
 from src.core.tr.order_manager import OrderManager
 from src.core.tr.precision_handler import PrecisionHandler
@@ -24,8 +24,6 @@ def event_bus():
 def order_manager(event_bus):
     """创建订单管理器mock"""
     manager = OrderManager(event_bus)
-    manager.submit_limit_order = AsyncMock()
-    manager.submit_post_only_order = AsyncMock()
     manager.cancel_all_orders = AsyncMock()
     return manager
 
@@ -52,31 +50,64 @@ class TestGridManagerCreation:
         assert grid_manager is not None
 
 
+class TestKernelWarmUp:
+    """测试网格计算内核预热"""
+    
+    def test_warm_up_kernels(self):
+        """测试预热可重复调用且不影响计算结果"""
+        warm_up_kernels()
+        warm_up_kernels()
+        
+        pair = GridPair("pair_001", 1.0, 1.1, 100.0)
+        assert abs(pair.calculate_profit(0.0) - 10.0) < 1e-9
+
+
 class TestGridOrderCreation:
     """测试网格订单创建"""
     
     @pytest.mark.asyncio
-    async def test_create_grid_orders(self, grid_manager, order_manager):
+    async def test_create_grid_orders(self, grid_manager, event_bus):
         """测试创建网格订单"""
         order_ids = await grid_manager.create_grid_orders(
             "user_001", "XRPUSDC", 1.05, 0.95, 10, 1000.0, "BUY"
         )
         
         assert len(order_ids) == 10
-        assert order_manager.submit_limit_order.call_count == 10
+        assert event_bus.publish.call_count == 10
+        events = [call.args[0] for call in event_bus.publish.call_args_list]
+        assert all(event.data["order_type"] == "LIMIT" for event in events)
+        assert len({event.event_id for event in events}) == 10
     
     @pytest.mark.asyncio
-    async def test_create_grid_orders_post_only(self, grid_manager, order_manager):
+    async def test_create_grid_orders_post_only(self, grid_manager, event_bus):
         """测试创建POST_ONLY网格订单"""
         order_ids = await grid_manager.create_grid_orders(
             "user_001", "XRPUSDC", 1.05, 0.95, 10, 1000.0, "BUY", "POST_ONLY"
         )
         
         assert len(order_ids) == 10
-        assert order_manager.submit_post_only_order.call_count == 10
+        assert event_bus.publish.call_count == 10
+        for call in event_bus.publish.call_args_list:
+            assert call.args[0].data["order_type"] == "POST_ONLY"
+    
+    @pytest.mark.asyncio
+    async def test_create_grid_orders_skips_insufficient_notional(self, grid_manager, event_bus):
+        """测试名义价值不足的网格层级被跳过"""
+        # 每层数量5，价格0.95~1.04，只有价格>=1.0的层级满足最小名义价值5.0
+        order_ids = await grid_manager.create_grid_orders(
+            "user_001", "XRPUSDC", 1.05, 0.95, 10, 50.0, "BUY"
+        )
+        
+        assert order_ids == [f"grid_XRPUSDC_{level}" for level in range(5, 10)]
+        assert event_bus.publish.call_count == 5
+        for call in event_bus.publish.call_args_list:
+            data = call.args[0].data
+            quantity, price = data["quantity"], data["price"]
+            assert quantity == 5.0
+            assert price * quantity >= 5.0
     
     @pytest.mark.asyncio
-    async def test_create_symmetric_grid_orders(self, grid_manager, order_manager):
+    async def test_create_symmetric_grid_orders(self, grid_manager, event_bus):
         """测试创建对称网格订单"""
         result = await grid_manager.create_symmetric_grid_orders(
             "user_001", "XRPUSDC", 1.0, 1.05, 0.95, 10, 1000.0
@@ -86,6 +117,9 @@ class TestGridOrderCreation:
         assert "sell_order_ids" in result
         assert len(result["buy_order_ids"]) > 0
         assert len(result["sell_order_ids"]) > 0
+        sides = [call.args[0].data["side"] for call in event_bus.publish.call_args_list]
+        assert sides.count("BUY") == len(result["buy_order_ids"])
+        assert sides.count("SELL") == len(result["sell_order_ids"])
 
 
 class TestGridPairManagement:
@@ -118,6 +152,14 @@ class TestGridPairManagement:
         assert profit is not None
         assert profit > 0  # 买0.95卖1.05应该有利润
     
+    def test_unknown_symbol_does_not_create_bucket(self, grid_manager):
+        """测试查询不存在的交易对不会创建空配对字典"""
+        grid_manager.update_grid_pair_order("BTCUSDC", "BTCUSDC_0", "order_123", "BUY")
+        
+        assert grid_manager.mark_pair_completed("BTCUSDC", "BTCUSDC_0") is None
+        assert grid_manager.get_grid_pairs("BTCUSDC") == {}
+        assert "BTCUSDC" not in grid_manager._grid_pairs
+    
     def test_get_grid_pairs(self, grid_manager):
         """测试获取网格配对"""
         grid_manager.create_grid_pair("XRPUSDC", 0.95, 1.05, 100.0)
@@ -127,6 +169,24 @@ class TestGridPairManagement:
         
         assert len(pairs) == 2
     
+    def test_calculate_all_profits(self, grid_manager):
+        """测试批量计算网格配对利润与逐个计算完全一致"""
+        grid_manager.create_grid_pair("XRPUSDC", 0.95, 1.05, 100.0)
+        grid_manager.create_grid_pair("XRPUSDC", 1.06, 0.96, 50.0)
+        
+        profits = grid_manager.calculate_all_profits("XRPUSDC", fee_rate=0.0004)
+        pairs = list(grid_manager.get_grid_pairs("XRPUSDC").values())
+        
+        assert len(profits) == 2
+        for profit, pair in zip(profits, pairs):
+            assert profit == pair.calculate_profit(fee_rate=0.0004)
+    
+    def test_calculate_all_profits_empty(self, grid_manager):
+        """测试无配对时返回空数组"""
+        profits = grid_manager.calculate_all_profits("XRPUSDC")
+        
+        assert len(profits) == 0
+    
     def test_clear_grid_pairs(self, grid_manager):
         """测试清除网格配对"""
         grid_manager.create_grid_pair("XRPUSDC", 0.95, 1.05, 100.0)
@@ -79,6 +79,51 @@ class TestSubmitOrders:
         
         assert call_args.data["order_type"] == "POST_ONLY"
         assert call_args.data["price"] == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_submit_market_order_has_no_price(self):
+        """测试市价单事件数据不包含价格字段"""
+        event_bus = Mock(spec=EventBus)
+        event_bus.publish = AsyncMock()
+        
+        order_manager = OrderManager(event_bus)
+        await order_manager.submit_market_order("user_001", "XRPUSDC", "SELL", 100)
+        
+        assert "price" not in event_bus.publish.call_args[0][0].data
+    
+    @pytest.mark.asyncio
+    async def test_submit_unsupported_order_type(self):
+        """测试不支持的订单类型"""
+        event_bus = Mock(spec=EventBus)
+        event_bus.publish = AsyncMock()
+        
+        order_manager = OrderManager(event_bus)
+        with pytest.raises(ValueError):
+            await order_manager._submit("STOP", "user_001", "XRPUSDC", "BUY", 100, 1.0)
+        event_bus.publish.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_submit_grid_orders(self):
+        """测试批量提交网格订单"""
+        event_bus = Mock(spec=EventBus)
+        event_bus.publish = AsyncMock()
+        
+        order_manager = OrderManager(event_bus)
+        await order_manager.submit_grid_orders(
+            "user_001", "XRPUSDC", "LIMIT", [("BUY", 100, 0.99), ("SELL", 100, 1.01)]
+        )
+        
+        # 每个订单发布独立的事件
+        assert event_bus.publish.call_count == 2
+        first, second = [call.args[0] for call in event_bus.publish.call_args_list]
+        assert first is not second
+        assert first.event_id != second.event_id
+        assert first.data == {
+            "user_id": "user_001", "symbol": "XRPUSDC", "order_type": "LIMIT",
+            "side": "BUY", "quantity": 100, "price": 0.99
+        }
+        assert second.data["side"] == "SELL"
+        assert second.data["price"] == 1.01
 
 
 class TestCancelOrders:
@@ -152,3 +197,20 @@ class TestPrecisionHandling:
         assert OrderManager.round_quantity(100.123, 2) == 100.12
         assert OrderManager.round_quantity(100.999, 0) == 101.0
 
+    def test_round_half_up(self):
+        """测试精度处理为四舍五入，超出查表范围时回退内置 round"""
+        assert OrderManager.round_price(2.5, 0) == 3.0
+        assert OrderManager.round_quantity(0.125, 2) == 0.13
+        assert OrderManager.round_price(1234.5, -2) == 1200.0
+    
+    def test_round_half_up_negative(self):
+        """测试负数按绝对值四舍五入并保留符号"""
+        assert OrderManager.round_price(-1.5, 0) == -2.0
+        assert OrderManager.round_price(-1.23456, 2) == -1.23
+        assert OrderManager.round_quantity(-0.125, 2) == -0.13
+    
+    def test_round_half_up_below_half(self):
+        """测试略小于0.5的数值不会因加法舍入被进位"""
+        assert OrderManager.round_price(0.49999999999999994, 0) == 0.0
+        assert OrderManager.round_price(-0.49999999999999994, 0) == -0.0
+
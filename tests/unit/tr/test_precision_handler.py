@@ -38,6 +38,22 @@ class TestSymbolPrecisionManagement:
         assert price_prec == handler.DEFAULT_PRICE_PRECISION
         assert qty_prec == handler.DEFAULT_QUANTITY_PRECISION
         assert min_notional == handler.DEFAULT_MIN_NOTIONAL
+    
+    def test_get_symbol_precision_no_reallocation(self):
+        """测试重复获取精度配置返回同一元组"""
+        handler = PrecisionHandler()
+        handler.set_symbol_precision("XRPUSDC", 4, 0, 5.0)
+        
+        assert handler.get_symbol_precision("XRPUSDC") is handler.get_symbol_precision("XRPUSDC")
+        assert handler.get_symbol_precision("UNKNOWN") is handler.get_symbol_precision("OTHER")
+    
+    def test_get_min_notional(self):
+        """测试获取最小名义价值"""
+        handler = PrecisionHandler()
+        handler.set_symbol_precision("XRPUSDC", 4, 0, 10.0)
+        
+        assert handler.get_min_notional("XRPUSDC") == 10.0
+        assert handler.get_min_notional("UNKNOWN") == handler.DEFAULT_MIN_NOTIONAL
 
 
 class TestPriceRounding:
@@ -75,6 +91,49 @@ class TestPriceRounding:
         # 1.23459 应该向下取整为 1.2345，而不是四舍五入为 1.2346
         price = handler.round_price("XRPUSDC", 1.23459)
         assert price == 1.2345
+    
+    def test_round_price_float_product_error(self):
+        """测试浮点乘法误差不会导致多舍一位（0.29 * 100 = 28.999999999999996）"""
+        handler = PrecisionHandler()
+        handler.set_symbol_precision("TEST", 2, 2)
+        
+        assert handler.round_price("TEST", 0.29) == 0.29
+        assert handler.round_quantity("TEST", 1.15) == 1.15
+    
+    def test_round_price_after_precision_update(self):
+        """测试更新精度配置后不会使用旧的缓存配置"""
+        handler = PrecisionHandler()
+        handler.set_symbol_precision("XRPUSDC", 4, 0)
+        assert handler.round_price("XRPUSDC", 1.23456) == 1.2345
+        
+        handler.set_symbol_precision("XRPUSDC", 2, 0)
+        assert handler.round_price("XRPUSDC", 1.23456) == 1.23
+    
+    def test_round_price_exotic_precision(self):
+        """测试超出缩放范围的精度回退到Decimal"""
+        handler = PrecisionHandler()
+        handler.set_symbol_precision("TEST", 18, 18)
+        
+        assert handler.round_price("TEST", 1.23456) == 1.23456
+        assert handler.round_quantity("TEST", 0.1) == 0.1
+    
+    def test_round_price_high_precision_matches_decimal(self):
+        """测试13位及以上精度和大数值缩放时与Decimal向下取整一致"""
+        handler = PrecisionHandler()
+        handler.set_symbol_precision("TEST", 13, 12)
+        
+        assert handler.round_price("TEST", 58310.3590137) == 58310.3590137
+        assert handler.round_quantity("TEST", 58310.3590137) == 58310.3590137
+        assert handler.round_quantity("TEST", 758179.048327) == 758179.048327
+    
+    def test_rounder_shared_per_precision(self):
+        """测试相同精度的交易对共用同一个取整函数"""
+        handler = PrecisionHandler()
+        handler.set_symbol_precision("XRPUSDC", 4, 0)
+        handler.set_symbol_precision("DOGEUSDC", 4, 0)
+        
+        assert handler._symbol_precision["XRPUSDC"][3] is PrecisionHandler._ROUNDERS[4]
+        assert handler._symbol_precision["DOGEUSDC"][3] is handler._symbol_precision["XRPUSDC"][3]
 
 
 class TestQuantityRounding:
@@ -4,6 +4,7 @@
 测试ProfitCalculator的利润计算功能。
 """
 
+import numpy as np
 import pytest
 from src.core.tr.profit_calculator import ProfitCalculator
 
@@ -37,6 +38,14 @@ class TestOrderProfitCalculation:
         # 净利 = 5.0 - 0.082 = 4.918
         assert abs(profit - 4.918) < 0.001
     
+    def test_calculate_order_profit_fast_matches_validated(self):
+        """测试无校验版本与校验版本结果一致"""
+        calculator = ProfitCalculator()
+        
+        for side, is_long in (("LONG", True), ("SHORT", False)):
+            expected = calculator.calculate_order_profit(1.0, 1.05, 100.0, side, 0.0004)
+            assert calculator.calculate_order_profit_fast(1.0, 1.05, 100.0, is_long, 0.0004) == expected
+    
     def test_calculate_long_loss(self):
         """测试多头亏损"""
         calculator = ProfitCalculator()
@@ -197,6 +206,18 @@ class TestTotalProfitCalculation:
         assert result["profit_count"] == 0
         assert result["loss_count"] == 0
         assert result["win_rate"] == 0.0
+    
+    def test_calculate_total_profit_ndarray(self):
+        """测试NumPy数组输入（含零利润订单）"""
+        calculator = ProfitCalculator()
+        result = calculator.calculate_total_profit(np.array([10.0, 0.0, -4.0, 2.0]))
+        
+        assert result["total_profit"] == 8.0
+        assert result["profit_count"] == 2
+        assert result["loss_count"] == 1
+        assert result["win_rate"] == 0.5
+        assert type(result["total_profit"]) is float
+        assert type(result["profit_count"]) is int
 
 
 class TestFeeCalculation:
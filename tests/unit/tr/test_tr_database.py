@@ -7,6 +7,7 @@ TR数据库单元测试
 import pytest
 import pytest_asyncio
 import os
+import sqlite3
 import tempfile
 from datetime import datetime
 from src.core.tr.tr_database import TRDatabase
@@ -38,6 +39,33 @@ class TestDatabaseInitialization:
         """测试初始化数据库"""
         assert temp_db is not None
         assert temp_db._conn is not None
+    
+    @pytest.mark.asyncio
+    async def test_wal_journal_mode(self, temp_db):
+        """测试启用WAL日志模式"""
+        cursor = await temp_db._conn.execute("PRAGMA journal_mode")
+        row = await cursor.fetchone()
+        assert row[0] == "wal"
+    
+    @pytest.mark.asyncio
+    async def test_read_connection_is_read_only(self, temp_db):
+        """测试查询连接为只读且后台检查点任务已启动"""
+        with pytest.raises(sqlite3.OperationalError):
+            await temp_db._read_conn.execute("DELETE FROM trading_tasks")
+        assert temp_db._checkpoint_task is not None
+        assert not temp_db._checkpoint_task.done()
+    
+    @pytest.mark.asyncio
+    async def test_query_uses_index(self, temp_db):
+        """测试按用户查询任务时使用索引且无需额外排序"""
+        cursor = await temp_db._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM trading_tasks "
+            "WHERE user_id = ? ORDER BY created_at DESC LIMIT ?",
+            ("user_001", 10)
+        )
+        plan = " ".join(row[-1] for row in await cursor.fetchall())
+        assert "idx_tasks_user_created" in plan
+        assert "TEMP B-TREE" not in plan
 
 
 class TestTradingTaskPersistence:
@@ -92,6 +120,12 @@ class TestTradingTaskPersistence:
         task_id = await temp_db.save_trading_task(task_data)
         
         assert task_id > 0
+        
+        tasks = await temp_db.query_trading_tasks(user_id="user_001")
+        assert tuple(tasks[0]) == TRDatabase._TASK_COLUMNS
+        assert tasks[0]["id"] == task_id
+        assert tasks[0]["grid_config"] == task_data["grid_config"]
+        assert tasks[0]["opened_at"] is None
     
     @pytest.mark.asyncio
     async def test_query_trading_tasks(self, temp_db):
@@ -147,6 +181,11 @@ class TestTradingTaskPersistence:
         
         assert len(tasks) == 2
         assert all(task["symbol"] == "XRPUSDC" for task in tasks)
+        
+        # 只按交易对 / 不加过滤条件
+        assert len(await temp_db.query_trading_tasks(symbol="BTCUSDC")) == 1
+        assert len(await temp_db.query_trading_tasks()) == 3
+        assert len(await temp_db.query_trading_tasks(limit=2)) == 2
     
     @pytest.mark.asyncio
     async def test_update_task_profit(self, temp_db):
@@ -265,4 +304,87 @@ class TestOrderPersistence:
         order_id = await temp_db.save_order(order_data)
         
         assert order_id > 0
-
+    
+    @pytest.mark.asyncio
+    async def test_save_orders_bulk(self, temp_db):
+        """测试批量保存订单"""
+        created_at = datetime.now().isoformat()
+        orders_data = [
+            {
+                "task_id": 1,
+                "order_id": f"grid_order_{i}",
+                "symbol": "XRPUSDC",
+                "side": "BUY",
+                "order_type": "LIMIT",
+                "price": 0.95 + i * 0.01,
+                "quantity": 10.0,
+                "status": "NEW",
+                "is_grid_order": True,
+                "created_at": created_at
+            }
+            for i in range(5)
+        ]
+        
+        count = await temp_db.save_orders_bulk(orders_data)
+        
+        assert count == 5
+        cursor = await temp_db._conn.execute("SELECT COUNT(*), SUM(is_grid_order) FROM orders")
+        assert tuple(await cursor.fetchone()) == (5, 5)
+    
+    @pytest.mark.asyncio
+    async def test_save_orders_bulk_empty(self, temp_db):
+        """测试批量保存空列表"""
+        assert await temp_db.save_orders_bulk([]) == 0
+    
+    @pytest.mark.asyncio
+    async def test_save_order_nocommit(self, temp_db):
+        """测试不立即提交的订单写入及自动/手动提交"""
+        temp_db.FLUSH_ROWS = 3
+        created_at = datetime.now().isoformat()
+        
+        for i in range(4):
+            await temp_db.save_order_nocommit({
+                "task_id": 1,
+                "order_id": f"order_{i}",
+                "symbol": "XRPUSDC",
+                "side": "BUY",
+                "order_type": "LIMIT",
+                "price": 1.0,
+                "quantity": 10.0,
+                "status": "NEW",
+                "created_at": created_at
+            })
+        
+        # 前3行已自动提交，第4行待提交
+        assert temp_db._pending_writes == 1
+        
+        await temp_db.flush()
+        assert temp_db._pending_writes == 0
+        cursor = await temp_db._conn.execute("SELECT COUNT(*) FROM orders")
+        assert (await cursor.fetchone())[0] == 4
+    
+    @pytest.mark.asyncio
+    async def test_commit_resets_pending_writes(self, temp_db):
+        """测试其他写入提交时连带提交的行不再计入未提交数量"""
+        created_at = datetime.now().isoformat()
+        order = {
+            "task_id": 1,
+            "order_id": "order_1",
+            "symbol": "XRPUSDC",
+            "side": "BUY",
+            "order_type": "LIMIT",
+            "price": 1.0,
+            "quantity": 10.0,
+            "status": "NEW",
+            "created_at": created_at
+        }
+        
+        await temp_db.save_order_nocommit(order)
+        assert temp_db._pending_writes == 1
+        
+        await temp_db.save_order({**order, "order_id": "order_2"})
+        assert temp_db._pending_writes == 0
+        
+        await temp_db.save_order_nocommit({**order, "order_id": "order_3"})
+        await temp_db.update_task_profit(1, 1.0)
+        assert temp_db._pending_writes == 0
@@ -4,8 +4,10 @@ TR模块事件常量测试
 测试TR模块的事件常量定义是否正确。
 """
 
+import sys
 import pytest
-from src.core.tr.tr_events import TREvents
+from src.core.tr import tr_events
+from src.core.tr.tr_events import TREvents, OrderFilledPayload, GridCreatePayload
 
 
 class TestTREvents:
@@ -64,4 +66,47 @@ class TestTREvents:
         assert len(TREvents.INPUT_ACCOUNT_LOADED) > 0
         assert len(TREvents.POSITION_OPENED) > 0
         assert len(TREvents.ORDER_CREATE) > 0
+    
+    def test_event_values_interned(self):
+        """测试事件常量值已驻留"""
+        assert TREvents.ORDER_CREATE is sys.intern("trading.order.create")
+        assert TREvents.INPUT_ORDER_FILLED is sys.intern("de.order.filled")
+
 
+class TestTREventPayloads:
+    """测试订阅事件的类型化数据"""
+    
+    def test_order_filled_payload_from_data(self):
+        """测试订单成交数据解码"""
+        payload = OrderFilledPayload.from_data({
+            "user_id": "user_001", "order_id": "123", "symbol": "XRPUSDC",
+            "price": 0.5123, "quantity": 100.0, "side": "BUY"
+        })
+        
+        assert payload.price == 0.5123
+        assert payload.quantity == 100.0
+        assert payload.side == "BUY"
+    
+    def test_strict_mode_rejects_string_numbers(self, monkeypatch):
+        """测试严格模式下数值字段为字符串时抛出异常"""
+        monkeypatch.setattr(tr_events, "_STRICT_EVENTS", True)
+        
+        with pytest.raises(TypeError, match="price"):
+            OrderFilledPayload.from_data({"price": "0.5123", "quantity": 100.0})
+        
+        payload = OrderFilledPayload.from_data({"price": 0.5123, "quantity": 100})
+        assert payload.quantity == 100
+    
+    def test_grid_create_payload_defaults(self):
+        """测试网格创建数据缺省字段"""
+        payload = GridCreatePayload.from_data({"user_id": "user_001", "symbol": "XRPUSDC"})
+        
+        assert payload.grid_levels == 10
+        assert payload.move_up is False
+        assert payload.move_down is False
+    
+    def test_payload_is_frozen(self):
+        """测试类型化数据不可修改"""
+        payload = OrderFilledPayload.from_data({"price": 1.0, "quantity": 1.0})
+        with pytest.raises(AttributeError):
+            payload.price = 2.0
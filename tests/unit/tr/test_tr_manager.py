@@ -9,7 +9,9 @@ from unittest.mock import Mock, AsyncMock, patch
 from src.core.tr.tr_manager import TRManager
 from src.core.event.event_bus import EventBus
 from src.core.event.event import Event
-from src.core.tr.tr_events import TREvents
+from src.core.tr.tr_events import TREvents, SignalPayload
+from src.core.tr.trading_task import TradingTask
+from src.core.tr.capital_manager import CapitalManager
 
 
 class TestTRManagerCreation:
@@ -45,13 +47,15 @@ class TestTRManagerCreation:
         with pytest.raises(ValueError, match="首次调用get_instance"):
             TRManager.get_instance()
     
-    def test_direct_instantiation_raises_error(self):
-        """测试直接实例化会抛出异常"""
+    def test_direct_instantiation_returns_singleton(self):
+        """测试直接实例化返回已有单例且不重复初始化"""
         event_bus = Mock(spec=EventBus)
-        TRManager.get_instance(event_bus=event_bus)
+        tr_manager = TRManager.get_instance(event_bus=event_bus)
+        
+        other = TRManager(Mock(spec=EventBus))
         
-        with pytest.raises(RuntimeError, match="单例类"):
-            TRManager(event_bus)
+        assert other is tr_manager
+        assert other._event_bus is event_bus
     
     def test_initial_state(self):
         """测试初始状态"""
@@ -84,8 +88,11 @@ class TestTRManagerStart:
         tr_manager = TRManager.get_instance(event_bus=event_bus)
         await tr_manager.start()
         
-        # 验证订阅了所有必要的事件
-        assert event_bus.subscribe.call_count >= 7  # 至少订阅7个事件
+        # 验证一次性订阅了所有必要的事件
+        event_bus.subscribe_many.assert_called_once()
+        handlers = event_bus.subscribe_many.call_args[0][0]
+        assert len(handlers) >= 7  # 至少订阅7个事件
+        assert handlers[TREvents.INPUT_ORDER_FILLED] == tr_manager._on_order_filled
         assert tr_manager._is_started is True
     
     @pytest.mark.asyncio
@@ -151,6 +158,38 @@ class TestTRManagerEventHandlers:
         # 验证日志记录（通过不抛出异常来验证）
         assert True
     
+    @pytest.mark.asyncio
+    async def test_account_reload_refreshes_task_config(self):
+        """测试账户重新加载后已存在的交易任务按新策略配置刷新"""
+        event_bus = Mock(spec=EventBus)
+        event_bus.subscribe = AsyncMock()
+        event_bus.publish = AsyncMock()
+        
+        tr_manager = TRManager.get_instance(event_bus=event_bus)
+        await tr_manager.start()
+        
+        def account_loaded(symbols):
+            config = {"trading_pairs": [{"symbol": symbol} for symbol in symbols]}
+            return Event(
+                subject=TREvents.INPUT_ACCOUNT_LOADED,
+                data={"user_id": "user_001", "strategy_config": config},
+                source="pm"
+            )
+        
+        await tr_manager._on_account_loaded(account_loaded(["XRPUSDC"]))
+        await tr_manager._on_signal_generated(Event(
+            subject=TREvents.INPUT_SIGNAL_GENERATED,
+            data={"user_id": "user_001", "symbol": "XRPUSDC", "side": "LONG", "action": "CLOSE"},
+            source="st"
+        ))
+        task = tr_manager._tasks["user_001"]["XRPUSDC"]
+        assert task.symbol_count == 1
+        
+        await tr_manager._on_account_loaded(account_loaded(["XRPUSDC", "BTCUSDC", "ETHUSDC", "SOLUSDC"]))
+        
+        assert task.symbol_count == 4
+        assert task.capital_manager is tr_manager._capital_managers["user_001"]
+    
     @pytest.mark.asyncio
     async def test_on_signal_generated(self):
         """测试处理交易信号事件"""
@@ -173,6 +212,237 @@ class TestTRManagerEventHandlers:
         
         # 验证日志记录
         assert True
+    
+    @pytest.mark.asyncio
+    async def test_signal_creates_task_per_user(self):
+        """测试交易任务按用户、交易对两级存储"""
+        event_bus = Mock(spec=EventBus)
+        event_bus.subscribe = AsyncMock()
+        event_bus.publish = AsyncMock()
+        
+        tr_manager = TRManager.get_instance(event_bus=event_bus)
+        await tr_manager.start()
+        await tr_manager._on_account_loaded(Event(
+            subject=TREvents.INPUT_ACCOUNT_LOADED,
+            data={"user_id": "user_001", "strategy_config": {}},
+            source="pm"
+        ))
+        
+        for symbol in ("XRPUSDC", "BTCUSDC"):
+            await tr_manager._on_signal_generated(Event(
+                subject=TREvents.INPUT_SIGNAL_GENERATED,
+                data={"user_id": "user_001", "symbol": symbol, "side": "LONG", "action": "CLOSE"},
+                source="st"
+            ))
+        
+        assert list(tr_manager._tasks) == ["user_001"]
+        assert set(tr_manager._tasks["user_001"]) == {"XRPUSDC", "BTCUSDC"}
+    
+    @pytest.mark.asyncio
+    async def test_unknown_user_events_ignored(self):
+        """测试未加载账户的用户事件被直接忽略"""
+        event_bus = Mock(spec=EventBus)
+        event_bus.subscribe = AsyncMock()
+        event_bus.publish = AsyncMock()
+        
+        tr_manager = TRManager.get_instance(event_bus=event_bus)
+        await tr_manager.start()
+        event_bus.publish.reset_mock()
+        
+        await tr_manager._on_signal_generated(Event(
+            subject=TREvents.INPUT_SIGNAL_GENERATED,
+            data={"user_id": "user_999", "symbol": "XRPUSDC", "side": "LONG", "action": "OPEN"},
+            source="st"
+        ))
+        await tr_manager._on_order_filled(Event(
+            subject=TREvents.INPUT_ORDER_FILLED,
+            data={"user_id": "user_999", "order_id": "1", "symbol": "XRPUSDC",
+                  "price": 1.0, "quantity": 1.0, "side": "BUY"},
+            source="de"
+        ))
+        
+        assert tr_manager._tasks == {}
+        event_bus.publish.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_account_loaded_rebinds_capital_manager(self):
+        """测试账户重新加载后交易任务改绑资金管理器"""
+        event_bus = Mock(spec=EventBus)
+        event_bus.subscribe = AsyncMock()
+        event_bus.publish = AsyncMock()
+        
+        tr_manager = TRManager.get_instance(event_bus=event_bus)
+        await tr_manager.start()
+        
+        loaded = Event(
+            subject=TREvents.INPUT_ACCOUNT_LOADED,
+            data={"user_id": "user_001", "strategy_config": {"trading_pairs": [{"symbol": "XRPUSDC"}]}},
+            source="pm"
+        )
+        await tr_manager._on_account_loaded(loaded)
+        await tr_manager._on_signal_generated(Event(
+            subject=TREvents.INPUT_SIGNAL_GENERATED,
+            data={"user_id": "user_001", "symbol": "XRPUSDC", "side": "LONG", "action": "CLOSE"},
+            source="st"
+        ))
+        task = tr_manager._tasks["user_001"]["XRPUSDC"]
+        assert task.capital_manager is tr_manager._capital_managers["user_001"]
+        assert task.symbol_count == 1
+        
+        await tr_manager._on_account_loaded(loaded)
+        assert task.capital_manager is tr_manager._capital_managers["user_001"]
+    
+    @pytest.mark.asyncio
+    async def test_signal_payload_decoded_once(self):
+        """测试事件数据解码后缓存在事件上"""
+        event_bus = Mock(spec=EventBus)
+        event_bus.subscribe = AsyncMock()
+        event_bus.publish = AsyncMock()
+        
+        tr_manager = TRManager.get_instance(event_bus=event_bus)
+        await tr_manager.start()
+        
+        event = Event(
+            subject=TREvents.INPUT_SIGNAL_GENERATED,
+            data={"user_id": "user_001", "symbol": "XRPUSDC", "side": "LONG", "action": "CLOSE"},
+            source="st"
+        )
+        await tr_manager._on_signal_generated(event)
+        
+        payload = event.typed_data
+        assert isinstance(payload, SignalPayload)
+        assert payload.symbol == "XRPUSDC"
+        
+        await tr_manager._on_signal_generated(event)
+        assert event.typed_data is payload
+
+
+class TestTRManagerSignalHandling:
+    """测试TRManager的入场/出场信号处理"""
+    
+    def setup_method(self):
+        """每个测试方法前重置单例"""
+        TRManager.reset_instance()
+    
+    def teardown_method(self):
+        """每个测试方法后重置单例"""
+        TRManager.reset_instance()
+    
+    @pytest.mark.asyncio
+    async def test_entry_signal_dispatch_no_grid(self):
+        """测试无网格模式入场信号分发到市价单处理"""
+        event_bus = Mock(spec=EventBus)
+        tr_manager = TRManager.get_instance(event_bus=event_bus)
+        tr_manager._order_manager = Mock()
+        tr_manager._order_manager.submit_market_order = AsyncMock()
+        
+        capital_manager = CapitalManager("user_001", 4, "USDC")
+        capital_manager.update_balance(10000.0)
+        config = {"trading_pairs": [{"symbol": "XRPUSDC"}]}
+        task = TradingTask("user_001", "XRPUSDC", config, capital_manager)
+        signal = SignalPayload("user_001", "XRPUSDC", "LONG", "OPEN", 2.0)
+        
+        await tr_manager._handle_entry_signal(task, "LONG", signal)
+        
+        # 9500保证金 × 4倍杠杆 ÷ 2.0 = 19000
+        tr_manager._order_manager.submit_market_order.assert_awaited_once_with(
+            "user_001", "XRPUSDC", "BUY", 19000.0
+        )
+    
+    @pytest.mark.asyncio
+    async def test_entry_signal_publishes_order_create(self):
+        """测试无网格/特殊网格模式入场经真实OrderManager发布订单创建事件"""
+        grid_trading = {"enabled": True, "grid_type": "abnormal", "ratio": 0.5}
+        # 9500保证金 × 4倍杠杆 ÷ 2.0 = 19000；特殊网格模式按ratio=0.5减半
+        cases = (({}, "LONG", "BUY", 19000.0), ({"grid_trading": grid_trading}, "SHORT", "SELL", 9500.0))
+        
+        for extra_config, side, order_side, quantity in cases:
+            TRManager.reset_instance()
+            event_bus = Mock(spec=EventBus)
+            event_bus.publish = AsyncMock()
+            tr_manager = TRManager.get_instance(event_bus=event_bus)
+            
+            capital_manager = CapitalManager("user_001", 4, "USDC")
+            capital_manager.update_balance(10000.0)
+            config = {"trading_pairs": [{"symbol": "XRPUSDC"}], **extra_config}
+            task = TradingTask("user_001", "XRPUSDC", config, capital_manager)
+            signal = SignalPayload("user_001", "XRPUSDC", side, "OPEN", 2.0)
+            
+            await tr_manager._handle_entry_signal(task, side, signal)
+            
+            event_bus.publish.assert_awaited_once()
+            event = event_bus.publish.await_args.args[0]
+            assert event.subject == TREvents.ORDER_CREATE
+            assert event.data == {
+                "user_id": "user_001", "symbol": "XRPUSDC", "side": order_side,
+                "order_type": "MARKET", "quantity": quantity
+            }
+    
+    @pytest.mark.asyncio
+    async def test_grid_create_registers_order_ids(self):
+        """测试网格创建后订单ID批量登记到交易任务"""
+        event_bus = Mock(spec=EventBus)
+        tr_manager = TRManager.get_instance(event_bus=event_bus)
+        tr_manager._grid_manager = Mock()
+        tr_manager._grid_manager.create_grid_orders = AsyncMock(return_value=["grid_1", "grid_2"])
+        
+        capital_manager = CapitalManager("user_001", 4, "USDC")
+        capital_manager.update_balance(10000.0)
+        tr_manager._capital_managers["user_001"] = capital_manager
+        config = {"trading_pairs": [{"symbol": "XRPUSDC"}], "grid_trading": {"enabled": True, "ratio": 0.5}}
+        task = TradingTask("user_001", "XRPUSDC", config, capital_manager)
+        tr_manager._tasks["user_001"] = {"XRPUSDC": task}
+        await task.open_position("LONG", 1.0, 100.0)
+        
+        await tr_manager._on_grid_create(Event(
+            subject=TREvents.INPUT_GRID_CREATE,
+            data={"user_id": "user_001", "symbol": "XRPUSDC", "upper_price": 1.1,
+                  "lower_price": 0.9, "grid_levels": 2},
+            source="st"
+        ))
+        
+        assert task.grid_order_ids == ["grid_1", "grid_2"]
+        assert task.get_grid_order_count() == 2
+    
+    @pytest.mark.asyncio
+    async def test_exit_signal_order_side(self):
+        """测试出场信号按持仓方向提交反向平仓单"""
+        event_bus = Mock(spec=EventBus)
+        tr_manager = TRManager.get_instance(event_bus=event_bus)
+        tr_manager._order_manager = Mock()
+        tr_manager._order_manager.submit_market_order = AsyncMock()
+        
+        for position_side, order_side in (("LONG", "SELL"), ("SHORT", "BUY")):
+            task = TradingTask("user_001", "XRPUSDC", {})
+            await task.open_position(position_side, 1.0, 100.0)
+            
+            await tr_manager._handle_exit_signal(task, None)
+            
+            tr_manager._order_manager.submit_market_order.assert_awaited_with(
+                "user_001", "XRPUSDC", order_side, 100.0
+            )
+    
+    @pytest.mark.asyncio
+    async def test_exit_signal_cancels_grid_then_publishes_close(self):
+        """测试出场信号经真实OrderManager先撤销网格挂单再发布平仓订单事件"""
+        event_bus = Mock(spec=EventBus)
+        event_bus.publish = AsyncMock()
+        tr_manager = TRManager.get_instance(event_bus=event_bus)
+        
+        task = TradingTask("user_001", "XRPUSDC", {})
+        await task.open_position("LONG", 1.0, 100.0)
+        task.add_grid_orders(["grid_1", "grid_2"])
+        
+        await tr_manager._handle_exit_signal(task, None)
+        
+        events = [call.args[0] for call in event_bus.publish.await_args_list]
+        assert [event.subject for event in events] == [
+            TREvents.ORDER_CANCEL, TREvents.ORDER_CANCEL, TREvents.ORDER_CREATE
+        ]
+        assert events[-1].data == {
+            "user_id": "user_001", "symbol": "XRPUSDC", "side": "SELL",
+            "order_type": "MARKET", "quantity": 100.0
+        }
 
 
 class TestTRManagerShutdown:
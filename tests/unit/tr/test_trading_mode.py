@@ -242,3 +242,31 @@ class TestGridRatioCalculation:
         
         assert task.get_grid_ratio() == 0.3
 
+    
+    def test_grid_ratio_cached_at_creation(self):
+        """测试网格资金比例在创建时确定，设置网格配置不改变模式和比例"""
+        config = {
+            "grid_trading": {
+                "enabled": True,
+                "grid_type": "abnormal",
+                "ratio": 0.3
+            }
+        }
+        task = TradingTask("user_001", "XRPUSDC", config)
+        task.set_grid_config(1.1, 0.9, 10)
+        
+        assert task.grid_ratio == 0.3
+        assert task.trading_mode == TradingMode.ABNORMAL_GRID
+    
+    def test_refresh_from_config(self):
+        """测试策略配置修改后刷新交易模式和资金比例"""
+        config = {"grid_trading": {"enabled": False}}
+        task = TradingTask("user_001", "XRPUSDC", config)
+        
+        config["grid_trading"] = {"enabled": True, "grid_type": "abnormal", "ratio": 0.4}
+        config["trading_pairs"] = [{"symbol": "XRPUSDC"}, {"symbol": "BTCUSDC"}]
+        task.refresh_from_config()
+        
+        assert task.trading_mode == TradingMode.ABNORMAL_GRID
+        assert task.grid_ratio == 0.4
+        assert task.symbol_count == 2
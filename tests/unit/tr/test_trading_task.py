@@ -5,6 +5,7 @@ TradingTask单元测试
 """
 
 import pytest
+from datetime import datetime
 from src.core.tr.trading_task import TradingTask, PositionState, OrderInfo
 
 
@@ -30,6 +31,26 @@ class TestTradingTaskCreation:
         task = TradingTask("user_001", "XRPUSDC", {})
         assert task.get_position_state() == PositionState.NONE
         assert task.is_position_open() is False
+    
+    def test_timestamps_stored_as_epoch_seconds(self):
+        """测试时间记录为epoch秒，datetime属性按需转换"""
+        task = TradingTask("user_001", "XRPUSDC", {})
+        
+        assert isinstance(task.created_ts, float)
+        assert isinstance(task.created_at, datetime)
+        assert task.created_at.timestamp() == pytest.approx(task.created_ts)
+        assert task.opened_at is None
+        assert task.closed_at is None
+    
+    def test_symbol_count_from_config(self):
+        """测试创建时缓存交易对数量和资金管理器"""
+        capital_manager = object()
+        config = {"trading_pairs": [{"symbol": "XRPUSDC"}, {"symbol": "BTCUSDC"}]}
+        task = TradingTask("user_001", "XRPUSDC", config, capital_manager)
+        
+        assert task.symbol_count == 2
+        assert task.capital_manager is capital_manager
+        assert TradingTask("user_001", "XRPUSDC", {}).capital_manager is None
 
 
 class TestPositionManagement:
@@ -43,6 +64,7 @@ class TestPositionManagement:
         
         assert task.get_position_state() == PositionState.LONG
         assert task.is_position_open() is True
+        assert task.position_open is True
         assert task.entry_price == 1.0
         assert task.entry_quantity == 100
         assert task.entry_side == "LONG"
@@ -78,6 +100,7 @@ class TestPositionManagement:
 
         assert task.get_position_state() == PositionState.NONE
         assert task.is_position_open() is False
+        assert task.position_open is False
         # 毛利 = (1.1 - 1.0) × 100 = 10.0
         # 手续费 = 1.0 × 100 × 0.0004 + 1.1 × 100 × 0.0004 = 0.084
         # 净利 = 10.0 - 0.084 = 9.916
@@ -133,6 +156,19 @@ class TestPositionManagement:
         
         with pytest.raises(ValueError, match="无持仓"):
             await task.close_position(1.0)
+    
+    @pytest.mark.asyncio
+    async def test_position_pnl_uses_direction_sign(self):
+        """测试持仓盈亏按方向符号计算，平仓后为0"""
+        task = TradingTask("user_001", "XRPUSDC", {})
+        await task.open_position("SHORT", 1.0, 100)
+        
+        assert task.direction_sign == -1.0
+        assert task._calculate_position_pnl(0.9) == pytest.approx(10.0)
+        
+        await task.close_position(0.9)
+        assert task.direction_sign == 0.0
+        assert task._calculate_position_pnl(0.9) == 0.0
 
 
 class TestOrderManagement:
@@ -171,6 +207,17 @@ class TestOrderManagement:
         
         assert found_order == order
     
+    def test_get_order_indexes_grid_orders_and_keeps_first(self):
+        """测试网格订单可按ID查找，同ID重复添加时返回最早的订单"""
+        task = TradingTask("user_001", "XRPUSDC", {})
+        order = OrderInfo("12345", "XRPUSDC", "BUY", "LIMIT", 1.0, 100)
+        duplicate = OrderInfo("12345", "XRPUSDC", "BUY", "LIMIT", 1.0, 100)
+        task.add_grid_order(order)
+        task.add_order(duplicate)
+        task.clear_grid_orders()
+        
+        assert task.get_order("12345") is order
+    
     def test_get_nonexistent_order_returns_none(self):
         """测试获取不存在的订单返回None"""
         task = TradingTask("user_001", "XRPUSDC", {})
@@ -202,6 +249,24 @@ class TestOrderManagement:
         task.add_grid_order(order2)
         
         assert task.get_grid_order_count() == 2
+        assert task.grid_order_ids == ["12345", "12346"]
+    
+    def test_add_grid_orders_bulk(self):
+        """测试批量登记网格订单ID，重复ID跳过，后续可补充订单详情"""
+        task = TradingTask("user_001", "XRPUSDC", {})
+        
+        task.add_grid_orders(["grid_1", "grid_2"])
+        task.add_grid_orders(["grid_2", "grid_3"])
+        
+        assert task.grid_order_ids == ["grid_1", "grid_2", "grid_3"]
+        assert task.get_grid_order_count() == 3
+        assert task.grid_orders["grid_1"] is None
+        
+        order = OrderInfo("grid_1", "XRPUSDC", "SELL", "LIMIT", 1.1, 100)
+        task.add_grid_order(order)
+        
+        assert task.grid_orders["grid_1"] is order
+        assert task.grid_order_ids == ["grid_1", "grid_2", "grid_3"]
     
     def test_clear_grid_orders(self):
         """测试清空网格订单"""
@@ -213,6 +278,7 @@ class TestOrderManagement:
         task.clear_grid_orders()
         
         assert len(task.grid_orders) == 0
+        assert task.grid_order_ids == []
         # 注意：orders列表不会被清空，只是grid_orders字典被清空
         assert len(task.orders) == 1
 
@@ -237,3 +303,31 @@ class TestOrderInfo:
         assert order.created_at is not None
         assert order.filled_at is None
 
+    
+    def test_slots_without_instance_dict(self):
+        """测试OrderInfo和TradingTask使用__slots__，实例不分配__dict__"""
+        order = OrderInfo("12345", "XRPUSDC", "BUY", "MARKET", 1.0, 100)
+        task = TradingTask("user_001", "XRPUSDC", {})
+        
+        assert not hasattr(order, "__dict__")
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown_field = 1
+
+
+class TestProfitStatistics:
+    """测试利润统计"""
+    
+    def test_realized_profits_bounded(self):
+        """测试已实现利润只保留最近记录，累计利润和笔数不受影响"""
+        task = TradingTask("user_001", "XRPUSDC", {})
+        count = TradingTask.MAX_REALIZED_PROFITS + 10
+        for _ in range(count):
+            task.add_grid_profit(1.0)
+        
+        stats = task.get_profit_statistics()
+        
+        assert len(task.realized_profits) == TradingTask.MAX_REALIZED_PROFITS
+        assert stats["total_profit"] == pytest.approx(count)
+        assert stats["order_count"] == count
+        assert stats["win_rate"] == 1.0